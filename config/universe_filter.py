@@ -11,5 +11,12 @@ STOCK_ALLOWLIST = {"SPY", "QQQ"}
 # Always block (commodity ETFs, leveraged ETFs, crypto trusts, etc.)
 STOCK_BLOCKLIST = {"UNG", "SLV", "KOLD", "BITO"}
 
+# Leveraged / inverse products, rejectable by ticker alone (no quote needed)
+LEVERAGED_OR_INVERSE_BLOCKLIST = {
+    "TQQQ", "SQQQ", "SOXL", "SOXS", "TNA", "TZA",
+    "SPXL", "SPXS", "UVXY", "SVXY", "ZSL", "UGL",
+    "TSLL", "TSLS", "UVIX", "DUST",
+}
+
 # Keywords in longName that indicate product is not a tradeable stock
 ETF_KEYWORDS = {"ETF", "ETN", "FUND", "TRUST", "INDEX", "NOTE", "NOTES", "SECURITIES"}
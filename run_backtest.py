@@ -4,15 +4,8 @@ Run Backtest for Trade Labs Hybrid System
 Tests the system on historical data to validate performance.
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent))
-
 import logging
 from datetime import datetime, timedelta
-from ib_insync import IB, util
-
-from src.backtest import BacktestEngine
 
 # Setup logging
 logging.basicConfig(
@@ -25,6 +18,11 @@ logger = logging.getLogger(__name__)
 
 def main():
     """Run backtest."""
+    # Heavy imports deferred so merely importing this module (e.g. during
+    # test collection) doesn't load ib_insync and the backtest package.
+    from ib_insync import IB
+
+    from src.backtest import BacktestEngine
     
     print("\n" + "="*80)
     print("TRADE LABS - BACKTESTING ENGINE")
@@ -1,20 +1,45 @@
-from ib_insync import IB
+from ib_insync import IB, util
+import asyncio
 import sys
 
-# Try a range of client IDs to find one that works
-for client_id in range(10, 100):
+# Try a range of client IDs and report the lowest one that works.  IDs are
+# probed concurrently in ascending waves (bounded so TWS isn't hit with 90
+# simultaneous handshakes); the first wave with a success holds the answer,
+# since every lower ID has already failed.
+CLIENT_IDS = range(10, 100)
+MAX_CONCURRENT = 16
+
+
+async def try_id(client_id: int) -> int:
     ib = IB()
     try:
         print(f"Trying client ID: {client_id}")
-        ib.connect('127.0.0.1', 7497, clientId=client_id, timeout=5)
-        if ib.isConnected():
-            print(f"SUCCESS: Connected with client ID {client_id}")
-            ib.disconnect()
-            sys.exit(0)
+        await ib.connectAsync('127.0.0.1', 7497, clientId=client_id, timeout=5)
+        if not ib.isConnected():
+            raise ConnectionError("not connected")
+        return client_id
     except Exception as e:
         print(f"Failed with client ID {client_id}: {e}")
+        raise
     finally:
         if ib.isConnected():
             ib.disconnect()
+
+
+async def probe() -> int | None:
+    ids = list(CLIENT_IDS)
+    for i in range(0, len(ids), MAX_CONCURRENT):
+        wave = ids[i:i + MAX_CONCURRENT]
+        results = await asyncio.gather(*(try_id(cid) for cid in wave), return_exceptions=True)
+        ok = [r for r in results if isinstance(r, int)]
+        if ok:
+            return min(ok)
+    return None
+
+
+client_id = util.run(probe())
+if client_id is not None:
+    print(f"SUCCESS: Connected with client ID {client_id}")
+    sys.exit(0)
 print("No available client ID found in range 10-99.")
 sys.exit(1)
@@ -152,7 +152,8 @@ def save_scorecard_state() -> None:
                 "mfe": r.mfe, "mae": r.mae,
                 "open_ts": r.open_ts, "close_ts": r.close_ts,
             })
-        p.write_text(json.dumps(rows, indent=2))
+        # Machine-read and rewritten on every close: no pretty-printing.
+        p.write_text(json.dumps(rows, separators=(",", ":")))
         log.info("scorecard_saved records=%d path=%s", len(rows), p)
     except Exception:
         log.exception("scorecard_save_failed")
@@ -129,6 +129,7 @@ import requests
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Optional, Set, Tuple
 
@@ -2067,7 +2068,7 @@ def main() -> None:
             if _NEWS_CONSENSUS_DEBUG:
                 # show a few fingerprints and their provider sets
                 examples = []
-                for fp, provs in list(fp_providers.items())[:10]:
+                for fp, provs in islice(fp_providers.items(), 10):
                     examples.append(f"{fp[:8]}:{','.join(sorted(provs))}")
                 log.info("fp_provider_sets_sample=%s", " | ".join(examples))
             elif story_fp_consensus > 0:
@@ -3,22 +3,28 @@ CATALYST HUNTER - Multi-Source Catalyst Discovery Engine
 Scours the web (news, earnings, options, social, insiders) for swing trading catalysts.
 """
 
+import asyncio
 import logging
+import threading
 import requests
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Callable, List, Dict, NamedTuple, Optional, Set, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import feedparser
+import numpy as np
 from urllib.parse import quote
 import json
 
+from src.utils.rate_limit import get_with_backoff
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CatalystSignal:
-    """A single catalyst event for a stock."""
+    """A single catalyst event for a stock (immutable once built)."""
     symbol: str
     catalyst_type: str  # "earnings", "upgrade", "product", "acquisition", "volume_spike", "social_buzz", "insider_buy", "options_unusual"
     source: str  # "finnhub", "seeking_alpha", "yahoo", "reddit", "twitter", "options", "sec"
@@ -40,31 +46,65 @@ class CatalystSignal:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass
+class SignalArrays(NamedTuple):
+    """Column (struct-of-arrays) view of a signal list, one float64 array per field."""
+    confidence: np.ndarray
+    urgency: np.ndarray
+    magnitude: np.ndarray
+    direction: np.ndarray  # +1.0 bullish, -1.0 bearish
+
+
+def signal_arrays(signals: List[CatalystSignal]) -> SignalArrays:
+    """Stack the numeric fields of *signals* into arrays for vectorised scoring."""
+    n = len(signals)
+    return SignalArrays(
+        np.fromiter((s.confidence for s in signals), np.float64, n),
+        np.fromiter((s.urgency for s in signals), np.float64, n),
+        np.fromiter((s.magnitude for s in signals), np.float64, n),
+        np.fromiter((1.0 if s.bullish else -1.0 for s in signals), np.float64, n),
+    )
+
+
+# Per-type weights for CatalystStock.combined_score
+_COMBINED_TYPE_WEIGHTS = {
+    "earnings": 2.0,
+    "upgrade": 1.8,
+    "product": 1.5,
+    "acquisition": 2.0,
+    "volume_spike": 1.2,
+    "social_buzz": 0.8,
+    "insider_buy": 1.3,
+    "options_unusual": 1.4,
+}
+
+
+@dataclass(slots=True)
 class CatalystStock:
     """A stock with multiple catalyst signals."""
     symbol: str
     signals: List[CatalystSignal] = field(default_factory=list)
+    # (signal count, arrays) memo for .arrays; rebuilt when signals grow
+    _arrays: Optional[Tuple[int, SignalArrays]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def arrays(self) -> SignalArrays:
+        """SignalArrays for the current signals, built on first access."""
+        n = len(self.signals)
+        if self._arrays is None or self._arrays[0] != n:
+            self._arrays = (n, signal_arrays(self.signals))
+        return self._arrays[1]
     
     @property
     def combined_score(self) -> float:
         """Aggregate score from all signals."""
         if not self.signals:
             return 0.0
-        weights = {
-            "earnings": 2.0,
-            "upgrade": 1.8,
-            "product": 1.5,
-            "acquisition": 2.0,
-            "volume_spike": 1.2,
-            "social_buzz": 0.8,
-            "insider_buy": 1.3,
-            "options_unusual": 1.4,
-        }
-        total = sum(
-            (1.0 if s.bullish else -1.0) * s.confidence * s.urgency * weights.get(s.catalyst_type, 1.0)
-            for s in self.signals
+        a = self.arrays
+        type_w = np.fromiter(
+            (_COMBINED_TYPE_WEIGHTS.get(s.catalyst_type, 1.0) for s in self.signals),
+            np.float64, len(self.signals),
         )
+        total = float(np.einsum("i,i,i,i->", a.direction, a.confidence, a.urgency, type_w))
         # Normalize to 0-100
         return max(0, min(100, (total / len(self.signals)) * 25 + 50))
     
@@ -94,8 +134,9 @@ class CatalystHunter:
             "User-Agent": "Mozilla/5.0 (trading-labs catalyst-hunter)"
         })
         
-        # Cache for deduplication
+        # Cache for deduplication (sources run concurrently, see hunt_all_sources)
         self.seen_signals = set()
+        self._seen_lock = threading.Lock()
         self.catalyst_cache = {}
         self.cache_time = {}
         
@@ -114,7 +155,7 @@ class CatalystHunter:
         try:
             # Get company news
             url = f"https://finnhub.io/api/v1/news?category=general&minId=0&token={self.finnhub_key}"
-            resp = self.session.get(url, timeout=5)
+            resp = get_with_backoff(self.session, url, timeout=5)
             resp.raise_for_status()
             
             for article in resp.json()[:limit]:
@@ -159,7 +200,7 @@ class CatalystHunter:
             
             # Get earnings calendar with surprises
             url = f"https://finnhub.io/api/v1/calendar/earnings?token={self.finnhub_key}"
-            resp = self.session.get(url, timeout=5)
+            resp = get_with_backoff(self.session, url, timeout=5)
             resp.raise_for_status()
             
             earnings_data = resp.json()
@@ -553,18 +594,14 @@ class CatalystHunter:
     def _is_new_signal(self, signal: CatalystSignal) -> bool:
         """Check if signal is new (deduplication)."""
         sig_key = f"{signal.symbol}_{signal.catalyst_type}_{signal.headline[:30]}"
-        if sig_key in self.seen_signals:
-            return False
-        self.seen_signals.add(sig_key)
+        with self._seen_lock:
+            if sig_key in self.seen_signals:
+                return False
+            self.seen_signals.add(sig_key)
         return True
     
-    def hunt_all_sources(self) -> Dict[str, CatalystStock]:
-        """Run full catalyst hunt across all sources."""
-        logger.info("🔍 [CATALYST HUNTER] Starting multi-source scan...")
-        
-        all_catalysts = {}
-        
-        sources = [
+    def _sources(self) -> List[Tuple[str, Callable[[], Dict[str, CatalystStock]]]]:
+        return [
             ("Finnhub News", self.hunt_finnhub_news),
             ("Earnings Surprises", self.hunt_earnings_surprises),
             ("Yahoo Trending", self.hunt_yahoo_trending),
@@ -572,21 +609,57 @@ class CatalystHunter:
             ("Insider Activity", self.hunt_insider_activity),
             ("Options Unusual", self.hunt_options_unusual),
         ]
+    
+    def hunt_all_sources(self) -> Dict[str, CatalystStock]:
+        """
+        Run full catalyst hunt across all sources.
+
+        Every source is a blocking HTTP round-trip, so they run on a thread
+        pool and the hunt takes about as long as the slowest one.
+        """
+        logger.info("🔍 [CATALYST HUNTER] Starting multi-source scan...")
         
-        for source_name, source_fn in sources:
-            try:
+        sources = self._sources()
+        with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+            futures = []
+            for source_name, source_fn in sources:
                 logger.info(f"  Hunting {source_name}...")
-                results = source_fn()
-                
-                # Merge results
-                for symbol, stock in results.items():
-                    if symbol not in all_catalysts:
-                        all_catalysts[symbol] = stock
-                    else:
-                        all_catalysts[symbol].signals.extend(stock.signals)
-                
-            except Exception as e:
-                logger.error(f"Error in {source_name}: {e}")
+                futures.append(pool.submit(source_fn))
+            outcomes = []
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    outcomes.append(e)
+        
+        return self._merge_sources(sources, outcomes)
+    
+    async def hunt_all_sources_async(self) -> Dict[str, CatalystStock]:
+        """Awaitable hunt_all_sources(); sources run concurrently in threads."""
+        logger.info("🔍 [CATALYST HUNTER] Starting multi-source scan...")
+        
+        sources = self._sources()
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(source_fn) for _, source_fn in sources),
+            return_exceptions=True,
+        )
+        return self._merge_sources(sources, outcomes)
+    
+    def _merge_sources(self, sources, outcomes) -> Dict[str, CatalystStock]:
+        """Merge per-source results (in source order) and rank by score."""
+        all_catalysts = {}
+        
+        for (source_name, _), results in zip(sources, outcomes):
+            if isinstance(results, Exception):
+                logger.error(f"Error in {source_name}: {results}")
+                continue
+            
+            # Merge results
+            for symbol, stock in results.items():
+                if symbol not in all_catalysts:
+                    all_catalysts[symbol] = stock
+                else:
+                    all_catalysts[symbol].signals.extend(stock.signals)
         
         # Sort by combined score
         ranked = sorted(
@@ -8,6 +8,10 @@ from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from src.data.catalyst_hunter import signal_arrays
+
 logger = logging.getLogger(__name__)
 
 
@@ -94,8 +98,10 @@ class CatalystScorer:
                 reasoning="No catalyst signals found",
             )
         
+        arrays = getattr(catalyst_stock, "arrays", None) or signal_arrays(signals)
+        
         # 1. Calculate weighted catalyst score
-        catalyst_score = self._calculate_catalyst_score(signals)
+        catalyst_score = self._calculate_catalyst_score(signals, arrays)
         
         # 2. Get technical score (if available)
         # Default to 50.0 (neutral) if quant_scorer not available
@@ -119,9 +125,9 @@ class CatalystScorer:
         )[:3]
         
         # 5. Aggregate urgency/confidence/magnitude
-        avg_urgency = sum(s.urgency for s in signals) / len(signals)
-        avg_confidence = sum(s.confidence for s in signals) / len(signals)
-        avg_magnitude = sum(s.magnitude for s in signals) / len(signals)
+        avg_urgency = float(arrays.urgency.mean())
+        avg_confidence = float(arrays.confidence.mean())
+        avg_magnitude = float(arrays.magnitude.mean())
         
         # Boost confidence if multiple independent sources agree
         if len(signals) > 2:
@@ -144,7 +150,7 @@ class CatalystScorer:
             reasoning=reasoning,
         )
     
-    def _calculate_catalyst_score(self, signals: List) -> float:
+    def _calculate_catalyst_score(self, signals: List, arrays=None) -> float:
         """
         Calculate weighted score from multiple signals.
         
@@ -156,28 +162,20 @@ class CatalystScorer:
         
         if not signals:
             return 0.0
-        
-        total_weight = 0.0
-        total_score = 0.0
-        
-        for signal in signals:
-            # Base weight from catalyst type
-            base_weight = self.catalyst_weights.get(signal.catalyst_type, 1.0)
-            
-            # Adjust by source credibility
-            credibility = self.source_credibility.get(signal.source, 0.7)
-            
-            # Final weight
-            weight = base_weight * credibility * signal.confidence
-            
-            # Direction: bullish = positive, bearish = negative
-            direction = 1.0 if signal.bullish else -1.0
-            
-            # Contribution: weight × direction × signal quality
-            contribution = weight * direction * signal.magnitude
-            
-            total_weight += weight
-            total_score += contribution
+        if arrays is None:
+            arrays = signal_arrays(signals)
+        
+        n = len(signals)
+        # Base weight from catalyst type × source credibility
+        base_weight = np.fromiter(
+            (self.catalyst_weights.get(s.catalyst_type, 1.0) * self.source_credibility.get(s.source, 0.7)
+             for s in signals),
+            np.float64, n,
+        )
+        # Final weight per signal, then contribution = weight × direction × magnitude
+        weight = base_weight * arrays.confidence
+        total_weight = float(weight.sum())
+        total_score = float(np.einsum("i,i,i->", weight, arrays.direction, arrays.magnitude))
         
         # Normalize to 0-100
         if total_weight == 0:
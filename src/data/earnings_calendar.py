@@ -3,15 +3,36 @@ Earnings Calendar & Historical Analysis
 Tracks upcoming earnings and analyzes historical price movements post-earnings.
 """
 
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import time
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from pathlib import Path
+from typing import Any, List, Optional, Dict
 import requests
 
+from src.utils.rate_limit import get_with_backoff
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
+# Finnhub responses are kept on disk so repeated runs within a day don't
+# spend the free tier's 60 calls/min on data that hasn't changed.
+_CACHE_DIR = Path(os.environ.get("TL_FINNHUB_CACHE", "data/cache/finnhub"))
+UPCOMING_TTL_S = 6 * 3600
+HISTORICAL_TTL_S = 24 * 3600
+
 
 @dataclass
 class EarningsEvent:
@@ -66,16 +87,66 @@ class EarningsCalendar:
     Tracks earnings calendar and analyzes historical earnings performance.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         self.api_key = api_key or "demo"
         self.base_url = "https://finnhub.io/api/v1"
+        # Shared keep-alive session if given; plain requests otherwise
+        self.http = session or requests
+    
+    def _get(self, endpoint: str, params: Dict[str, Any], ttl: float, force_refresh: bool = False) -> Any:
+        """
+        GET ``{base_url}/{endpoint}`` and return the decoded JSON.
+
+        Served from the disk cache while the entry is younger than *ttl*
+        seconds (unless *force_refresh*); None on a non-200 reply.
+        """
+        raw_key = json.dumps([self.api_key, endpoint, params], sort_keys=True, default=str)
+        path = _CACHE_DIR / f"{hashlib.sha1(raw_key.encode()).hexdigest()}.json"
+        
+        if not force_refresh:
+            try:
+                if time.time() - path.stat().st_mtime <= ttl:
+                    return _loads(path.read_bytes())
+            except (OSError, ValueError):
+                pass
+        
+        response = get_with_backoff(
+            self.http,
+            f"{self.base_url}/{endpoint}",
+            params={**params, 'token': self.api_key},
+            timeout=10,
+        )
+        if response.status_code != 200:
+            logger.warning(f"Finnhub {endpoint} returned {response.status_code}")
+            return None
+        
+        # Decode the body once in C and cache the raw bytes as-is, so
+        # neither path round-trips through Python's json encoder.
+        body = response.content
+        data = _loads(body)
+        tmp_path = None
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(_CACHE_DIR), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Finnhub cache write failed: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+        return data
     
-    def get_upcoming_earnings(self, days_ahead: int = 30) -> List[EarningsEvent]:
+    def get_upcoming_earnings(self, days_ahead: int = 30, force_refresh: bool = False) -> List[EarningsEvent]:
         """
         Get upcoming earnings in next N days.
         
         Args:
             days_ahead: Number of days to look ahead
+            force_refresh: Bypass the disk cache
         
         Returns:
             List of EarningsEvent objects
@@ -86,18 +157,14 @@ class EarningsCalendar:
             from_date = datetime.now().strftime('%Y-%m-%d')
             to_date = (datetime.now() + timedelta(days=days_ahead)).strftime('%Y-%m-%d')
             
-            url = f"{self.base_url}/calendar/earnings"
             params = {
                 'from': from_date,
                 'to': to_date,
-                'token': self.api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            data = self._get('calendar/earnings', params, UPCOMING_TTL_S, force_refresh)
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if data is not None:
                 for item in data.get('earningsCalendar', []):
                     report_date = datetime.strptime(item['date'], '%Y-%m-%d')
                     days_until = (report_date - datetime.now()).days
@@ -117,8 +184,6 @@ class EarningsCalendar:
                     events.append(event)
                 
                 logger.info(f"Found {len(events)} upcoming earnings events")
-            else:
-                logger.warning(f"Finnhub earnings calendar returned {response.status_code}")
         
         except Exception as e:
             logger.error(f"Failed to fetch earnings calendar: {e}")
@@ -136,13 +201,14 @@ class EarningsCalendar:
         
         return [e for e in all_events if e.report_date == today]
     
-    def get_historical_earnings(self, symbol: str, limit: int = 8) -> List[HistoricalEarnings]:
+    def get_historical_earnings(self, symbol: str, limit: int = 8, force_refresh: bool = False) -> List[HistoricalEarnings]:
         """
         Get historical earnings results for a symbol.
         
         Args:
             symbol: Stock symbol
             limit: Number of past quarters to retrieve
+            force_refresh: Bypass the disk cache
         
         Returns:
             List of HistoricalEarnings
@@ -150,18 +216,14 @@ class EarningsCalendar:
         results = []
         
         try:
-            url = f"{self.base_url}/stock/earnings"
             params = {
                 'symbol': symbol,
                 'limit': limit,
-                'token': self.api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            data = self._get('stock/earnings', params, HISTORICAL_TTL_S, force_refresh)
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if data is not None:
                 for item in data:
                     eps_actual = item.get('actual')
                     eps_estimate = item.get('estimate')
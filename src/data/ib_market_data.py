@@ -1,6 +1,7 @@
 from ib_insync import IB, Stock, util
 import pandas as pd
 import math
+import time
 import os as _os
 HOST    = _os.getenv("IB_HOST", "127.0.0.1")
 PORT    = int(_os.getenv("IB_PORT", "7497"))
@@ -25,6 +26,27 @@ def get_history_bars(
         raise RuntimeError("No historical bars returned.")
     return df
 
+async def get_history_bars_async(
+    ib: IB,
+    contract,
+    duration: str = "30 D",
+    bar_size: str = "1 day"
+) -> pd.DataFrame:
+    """Awaitable get_history_bars, for gathering with other requests."""
+    bars = await ib.reqHistoricalDataAsync(
+        contract,
+        endDateTime="",
+        durationStr=duration,
+        barSizeSetting=bar_size,
+        whatToShow="TRADES",
+        useRTH=True,
+        formatDate=1
+    )
+    df = util.df(bars)
+    if df is None or df.empty:
+        raise RuntimeError("No historical bars returned.")
+    return df
+
 def connect_ib() -> IB:
     ib = IB()
     ib.connect(HOST, PORT, clientId=CLIENT_ID, timeout=10)
@@ -34,11 +56,21 @@ def get_spy_contract():
     # Always use SMART routing
     return Stock("SPY", "SMART", "USD")
 
+# NetLiquidation moves on a seconds timescale; per-intent callers share one
+# read within this window.  Keyed by IB instance so reconnects don't mix.
+EQUITY_TTL_SECONDS = 5.0
+_equity_cache: dict = {}  # id(ib) -> (monotonic ts, equity)
+
 def get_account_equity_usd(ib: IB) -> float:
+    hit = _equity_cache.get(id(ib))
+    if hit is not None and time.monotonic() - hit[0] < EQUITY_TTL_SECONDS:
+        return hit[1]
     summary = ib.accountSummary()
     for item in summary:
         if item.tag == "NetLiquidation" and item.currency == "USD":
-            return float(item.value)
+            equity = float(item.value)
+            _equity_cache[id(ib)] = (time.monotonic(), equity)
+            return equity
     raise RuntimeError("NetLiquidation (USD) not found.")
 
 def _is_valid_number(x) -> bool:
@@ -72,6 +104,23 @@ def get_last_price(ib: IB, contract) -> float:
         raise RuntimeError("No price available (snapshot + history both failed).")
     return float(df["close"].iloc[-1])
 
+async def get_last_price_async(ib: IB, contract) -> float:
+    """
+    Awaitable get_last_price: resolves when the snapshot ends rather than
+    after a fixed 1s sleep, with the same last/close/mid/history fallbacks.
+    """
+    tickers = await ib.reqTickersAsync(contract)
+    ticker = tickers[0] if tickers else None
+    if ticker is not None:
+        if _is_valid_number(ticker.last):
+            return float(ticker.last)
+        if _is_valid_number(ticker.close):
+            return float(ticker.close)
+        if _is_valid_number(ticker.bid) and _is_valid_number(ticker.ask):
+            return float((float(ticker.bid) + float(ticker.ask)) / 2.0)
+    df = await get_history_bars_async(ib, contract, duration="5 D", bar_size="1 day")
+    return float(df["close"].iloc[-1])
+
 def get_recent_price_from_history(ib: IB, contract) -> float:
     """
     Alias for get_last_price for backward compatibility.
@@ -0,0 +1,75 @@
+"""
+Short-lived market-data cache shared across the orchestrator's jobs.
+
+A pipeline run, a reconciliation and a stats refresh close together in
+time ask IB for the same symbols.  The orchestrator owns one cache and
+hands it to each consumer, so a value fetched by one job is reused by the
+next while it is still fresh.  Keys are namespaced
+``shared:market:IB:<symbol>:<kind>``; freshness depends on the kind.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# kind -> seconds a cached value stays fresh (bars move slower than quotes)
+TTL_SECONDS: Dict[str, float] = {
+    "bars_1m": 60.0,
+    "bars_1d": 60.0,
+    "ticker": 10.0,
+    "book": 5.0,
+}
+_DEFAULT_TTL = 60.0
+
+
+class MarketDataCache:
+    """Thread-safe TTL cache with LRU eviction beyond *maxsize* entries."""
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttls: Optional[Dict[str, float]] = None,
+        namespace: str = "shared:market:IB",
+    ):
+        self.maxsize = maxsize
+        self.ttls = {**TTL_SECONDS, **(ttls or {})}
+        self.namespace = namespace
+        # key -> (monotonic expiry, value), least recently used first
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, symbol: str, kind: str) -> str:
+        return f"{self.namespace}:{symbol}:{kind}"
+
+    def get(self, symbol: str, kind: str, default: Any = None) -> Any:
+        """Fresh value for (*symbol*, *kind*), else *default*."""
+        key = self.key(symbol, kind)
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None and hit[0] > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return hit[1]
+            if hit is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, symbol: str, kind: str, value: Any) -> None:
+        key = self.key(symbol, kind)
+        expires = time.monotonic() + self.ttls.get(kind, _DEFAULT_TTL)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -5,22 +5,50 @@ Primary provider: Benzinga (general news endpoint).
 Fallback: RSS (Google News).
 """
 
+import heapq
 import logging
 import os
 import requests
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import List, Optional, Dict
 from urllib.parse import quote
 import feedparser
 from bs4 import BeautifulSoup
 import re
 
+from src.utils.rate_limit import get_with_backoff, limiter_for
+
 
 logger = logging.getLogger(__name__)
 
+# Concurrent feed requests issued by NewsFetcher.fetch_news_for_symbols.
+MAX_FETCH_WORKERS = 10
+
+
+def make_http_session(pool_maxsize: int = 20) -> requests.Session:
+    """
+    requests.Session with a keep-alive pool of *pool_maxsize* connections
+    per host, to be shared by fetchers/scorers (one TLS handshake per
+    host instead of one per request).
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def shared_http_session() -> requests.Session:
+    """Process-wide session used by fetchers that are not handed one."""
+    return make_http_session(MAX_FETCH_WORKERS)
+
 
 # ── News Category Classification (Legend Phase 1) ────────────────────
 
@@ -197,11 +225,12 @@ def fetch_finnhub_news(max_items: int = 50) -> tuple[list[dict], str]:
 
     items: list[dict] = []
     try:
-        resp = requests.get(
-            _FINNHUB_NEWS_URL,
-            params={"category": "general", "minId": "0", "token": key},
-            timeout=10,
-        )
+        with limiter_for(_FINNHUB_NEWS_URL):
+            resp = requests.get(
+                _FINNHUB_NEWS_URL,
+                params={"category": "general", "minId": "0", "token": key},
+                timeout=10,
+            )
         if resp.status_code == 429:
             _finnhub_cooldown_until = time.time() + _FINNHUB_COOLDOWN_S
             logger.warning(
@@ -297,8 +326,14 @@ class NewsFetcher:
     Focuses on positive catalysts like earnings beats, upgrades, product launches.
     """
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Args:
+            session: HTTP session to issue requests on; defaults to the
+                process-wide shared_http_session().
+        """
         self.user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
+        self.session = session or shared_http_session()
         
     def fetch_google_news_rss(self, query: str = "stock market", max_articles: int = 50) -> List[NewsArticle]:
         """
@@ -318,7 +353,10 @@ class NewsFetcher:
             encoded_query = quote(query)
             rss_url = f"https://news.google.com/rss/search?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
             
-            feed = feedparser.parse(rss_url)
+            # Download over the pooled session, let feedparser only parse
+            resp = get_with_backoff(self.session, rss_url, headers={"User-Agent": self.user_agent}, timeout=10)
+            resp.raise_for_status()
+            feed = feedparser.parse(resp.content)
             
             for entry in feed.entries[:max_articles]:
                 # Try to extract stock symbol from title
@@ -417,22 +455,30 @@ class NewsFetcher:
         """
         news_by_symbol = {}
         
-        for symbol in symbols:
-            articles = self.fetch_news_for_symbol(symbol, days_back)
-            if articles:
-                news_by_symbol[symbol] = articles
+        # One RSS round-trip per symbol; overlap them instead of waiting on
+        # each in turn.  Results keep the order of *symbols*.
+        if symbols:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(symbols))) as pool:
+                fetched = pool.map(lambda sym: self.fetch_news_for_symbol(sym, days_back), symbols)
+                for symbol, articles in zip(symbols, fetched):
+                    if articles:
+                        news_by_symbol[symbol] = articles
         
         logger.info(f"Fetched news for {len(news_by_symbol)} symbols")
         
         return news_by_symbol
     
-    def get_most_talked_about_stocks(self, min_articles: int = 3, days_back: int = 1) -> List[Dict]:
+    def get_most_talked_about_stocks(
+        self, min_articles: int = 3, days_back: int = 1, top_limit: Optional[int] = None
+    ) -> List[Dict]:
         """
         Identify stocks with highest news volume (most talked about).
         
         Args:
             min_articles: Minimum number of articles required
             days_back: Days to look back
+            top_limit: Return only the top N symbols (heap select instead of
+                a full sort); None returns every qualifying symbol
         
         Returns:
             List of dicts with symbol, article_count, articles
@@ -458,12 +504,11 @@ class NewsFetcher:
                 symbol_counts[symbol] = len(recent_articles)
                 symbol_articles[symbol] = recent_articles
         
-        # Sort by article count
-        sorted_symbols = sorted(
-            symbol_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        # Rank by article count
+        if top_limit is None:
+            sorted_symbols = sorted(symbol_counts.items(), key=itemgetter(1), reverse=True)
+        else:
+            sorted_symbols = heapq.nlargest(top_limit, symbol_counts.items(), key=itemgetter(1))
         
         results = [
             {
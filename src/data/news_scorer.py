@@ -4,19 +4,22 @@ Integrates news sentiment and earnings catalysts with quantitative scoring.
 """
 
 import logging
+import sys
 from dataclasses import dataclass
 from typing import List, Optional, Dict
 from datetime import datetime
 
+import requests
+
 from src.data.news_fetcher import NewsArticle, NewsFetcher
-from src.data.news_sentiment import NewsSentimentAnalyzer, classify_news_catalyst
+from src.data.news_sentiment import SentimentAnalysis, classify_news_catalyst, get_default_analyzer
 from src.data.earnings_calendar import EarningsCalendar
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsScore:
     """News-based scoring for a symbol."""
     symbol: str
@@ -57,10 +60,10 @@ class NewsScorer:
     Designed to work alongside the quant scoring system.
     """
     
-    def __init__(self, earnings_api_key: Optional[str] = None):
-        self.news_fetcher = NewsFetcher()
-        self.sentiment_analyzer = NewsSentimentAnalyzer()
-        self.earnings_calendar = EarningsCalendar(api_key=earnings_api_key)
+    def __init__(self, earnings_api_key: Optional[str] = None, session: Optional[requests.Session] = None):
+        self.news_fetcher = NewsFetcher(session=session)
+        self.sentiment_analyzer = get_default_analyzer()
+        self.earnings_calendar = EarningsCalendar(api_key=earnings_api_key, session=session)
         
         logger.info("NewsScorer initialized")
     
@@ -86,76 +89,110 @@ class NewsScorer:
             # Analyze sentiment
             sentiments = self.sentiment_analyzer.analyze_articles(articles)
             
-            # Aggregate sentiment metrics
-            agg_sentiment = self.sentiment_analyzer.get_aggregate_sentiment(articles)
-            
-            # Identify catalysts
-            catalysts = [
-                classify_news_catalyst(article, sentiment)
-                for article, sentiment in zip(articles, sentiments)
-            ]
-            
-            positive_catalysts = [c for c in catalysts if c['is_catalyst'] and c['expected_impact'] in ['positive', 'strong_positive']]
-            
-            # Earnings analysis
-            earnings_score, earnings_info = self._analyze_earnings(symbol)
-            
-            # Calculate component scores
-            sentiment_score = self._calculate_sentiment_score(agg_sentiment)
-            catalyst_score = self._calculate_catalyst_score(positive_catalysts)
-            volume_score = self._calculate_volume_score(len(articles), days_back)
-            
-            # Weighted total score
-            total_score = (
-                sentiment_score * 0.35 +
-                catalyst_score * 0.30 +
-                volume_score * 0.15 +
-                earnings_score * 0.20
-            )
-            
-            # Determine signal
-            signal = self._determine_signal(total_score, sentiment_score, catalyst_score)
-            
-            # Confidence based on article count and sentiment agreement
-            confidence = self._calculate_confidence(articles, agg_sentiment)
-            
-            # Extract catalyst types
-            catalyst_types = list(set([c['catalyst_type'] for c in positive_catalysts]))
-            strongest = self._get_strongest_catalyst(positive_catalysts)
-            
-            return NewsScore(
-                symbol=symbol,
-                timestamp=datetime.now().isoformat(),
-                total_news_score=round(total_score, 2),
-                sentiment_score=round(sentiment_score, 2),
-                catalyst_score=round(catalyst_score, 2),
-                volume_score=round(volume_score, 2),
-                earnings_score=round(earnings_score, 2),
-                article_count=len(articles),
-                positive_article_count=agg_sentiment['positive_count'],
-                avg_sentiment=round(agg_sentiment['avg_sentiment'], 3),
-                has_catalyst=len(positive_catalysts) > 0,
-                catalyst_types=catalyst_types,
-                strongest_catalyst=strongest,
-                has_upcoming_earnings=earnings_info['has_upcoming'],
-                days_until_earnings=earnings_info['days_until'],
-                historical_beat_rate=earnings_info['beat_rate'],
-                news_signal=signal,
-                confidence=round(confidence, 2)
-            )
+            return self._build_score(symbol, articles, sentiments, days_back)
             
         except Exception as e:
             logger.error(f"{symbol}: Failed to score news - {e}", exc_info=True)
             return None
     
+    def _build_score(
+        self,
+        symbol: str,
+        articles: List[NewsArticle],
+        sentiments: List[SentimentAnalysis],
+        days_back: int,
+    ) -> NewsScore:
+        """NewsScore for *symbol* from its already-analyzed articles."""
+        
+        # Aggregate sentiment metrics
+        agg_sentiment = self.sentiment_analyzer.get_aggregate_sentiment(articles)
+        
+        # Identify catalysts
+        catalysts = [
+            classify_news_catalyst(article, sentiment)
+            for article, sentiment in zip(articles, sentiments)
+        ]
+        
+        positive_catalysts = [c for c in catalysts if c['is_catalyst'] and c['expected_impact'] in ['positive', 'strong_positive']]
+        
+        # Earnings analysis
+        earnings_score, earnings_info = self._analyze_earnings(symbol)
+        
+        # Calculate component scores
+        sentiment_score = self._calculate_sentiment_score(agg_sentiment)
+        catalyst_score = self._calculate_catalyst_score(positive_catalysts)
+        volume_score = self._calculate_volume_score(len(articles), days_back)
+        
+        # Weighted total score
+        total_score = (
+            sentiment_score * 0.35 +
+            catalyst_score * 0.30 +
+            volume_score * 0.15 +
+            earnings_score * 0.20
+        )
+        
+        # Determine signal
+        signal = self._determine_signal(total_score, sentiment_score, catalyst_score)
+        
+        # Confidence based on article count and sentiment agreement
+        confidence = self._calculate_confidence(articles, agg_sentiment)
+        
+        # Extract catalyst types
+        catalyst_types = list(set([c['catalyst_type'] for c in positive_catalysts]))
+        strongest = self._get_strongest_catalyst(positive_catalysts)
+        
+        return NewsScore(
+            symbol=symbol,
+            timestamp=datetime.now().isoformat(),
+            total_news_score=round(total_score, 2),
+            sentiment_score=round(sentiment_score, 2),
+            catalyst_score=round(catalyst_score, 2),
+            volume_score=round(volume_score, 2),
+            earnings_score=round(earnings_score, 2),
+            article_count=len(articles),
+            positive_article_count=agg_sentiment['positive_count'],
+            avg_sentiment=round(agg_sentiment['avg_sentiment'], 3),
+            has_catalyst=len(positive_catalysts) > 0,
+            catalyst_types=catalyst_types,
+            strongest_catalyst=strongest,
+            has_upcoming_earnings=earnings_info['has_upcoming'],
+            days_until_earnings=earnings_info['days_until'],
+            historical_beat_rate=earnings_info['beat_rate'],
+            news_signal=signal,
+            confidence=round(confidence, 2)
+        )
+    
+    def score_symbols_batch(self, symbols: List[str], days_back: int = 7) -> Dict[str, Optional[NewsScore]]:
+        """
+        Score several symbols at once: symbol -> NewsScore (None if no news).
+
+        News for all symbols is fetched concurrently, and sentiment runs once
+        over the combined article list instead of once per symbol.
+        """
+        news_by_symbol = self.news_fetcher.fetch_news_for_symbols(symbols, days_back)
+        
+        all_articles = [a for articles in news_by_symbol.values() for a in articles]
+        all_sentiments = self.sentiment_analyzer.analyze_articles(all_articles)
+        
+        results: Dict[str, Optional[NewsScore]] = {symbol: None for symbol in symbols}
+        start = 0
+        for symbol, articles in news_by_symbol.items():
+            sentiments = all_sentiments[start:start + len(articles)]
+            start += len(articles)
+            try:
+                results[symbol] = self._build_score(symbol, articles, sentiments, days_back)
+            except Exception as e:
+                logger.error(f"{symbol}: Failed to score news - {e}", exc_info=True)
+        
+        return results
+    
     def score_symbols(self, symbols: List[str], days_back: int = 7) -> List[NewsScore]:
         """Score multiple symbols and return sorted by total score."""
-        scores = []
-        
-        for symbol in symbols:
-            score = self.score_symbol(symbol, days_back)
-            if score and score.total_news_score > 50:  # Filter low scores
-                scores.append(score)
+        scores = [
+            score
+            for score in self.score_symbols_batch(symbols, days_back).values()
+            if score and score.total_news_score > 50  # Filter low scores
+        ]
         
         # Sort by total score (descending)
         scores.sort(key=lambda s: s.total_news_score, reverse=True)
@@ -356,22 +393,30 @@ class NewsScorer:
         return strongest['catalyst_type']
 
 
+_NEWS_BAR = "=" * 100
+_NEWS_TABLE_HEAD = (
+    f"{'Rank':<6}{'Symbol':<8}{'Score':<8}{'Signal':<12}{'Sentiment':<11}"
+    f"{'Catalyst':<10}{'Buzz':<7}{'Articles':<10}{'Strongest Catalyst':<25}\n"
+    + "-" * 100
+)
+
+
 def display_news_scores(scores: List[NewsScore], top_n: int = 20):
-    """Pretty print news scores."""
-    print(f"\n{'='*100}")
-    print(f"TOP {min(top_n, len(scores))} NEWS-DRIVEN OPPORTUNITIES")
-    print(f"{'='*100}\n")
-    
-    print(f"{'Rank':<6}{'Symbol':<8}{'Score':<8}{'Signal':<12}{'Sentiment':<11}"
-          f"{'Catalyst':<10}{'Buzz':<7}{'Articles':<10}{'Strongest Catalyst':<25}")
-    print("-" * 100)
+    """Pretty print news scores (the whole table in one stdout write)."""
+    lines = [
+        f"\n{_NEWS_BAR}",
+        f"TOP {min(top_n, len(scores))} NEWS-DRIVEN OPPORTUNITIES",
+        f"{_NEWS_BAR}\n",
+        _NEWS_TABLE_HEAD,
+    ]
     
     for i, score in enumerate(scores[:top_n], 1):
         catalyst_str = score.strongest_catalyst[:22] if score.strongest_catalyst else "N/A"
         
-        print(f"{i:<6}{score.symbol:<8}{score.total_news_score:<8.1f}"
-              f"{score.news_signal:<12}{score.avg_sentiment:>+6.3f}     "
-              f"{score.catalyst_score:<10.1f}{score.volume_score:<7.1f}"
-              f"{score.article_count:<10}{catalyst_str:<25}")
+        lines.append(f"{i:<6}{score.symbol:<8}{score.total_news_score:<8.1f}"
+                     f"{score.news_signal:<12}{score.avg_sentiment:>+6.3f}     "
+                     f"{score.catalyst_score:<10.1f}{score.volume_score:<7.1f}"
+                     f"{score.article_count:<10}{catalyst_str:<25}")
     
-    print(f"\n{'='*100}\n")
+    lines.append(f"\n{_NEWS_BAR}\n\n")
+    sys.stdout.write("\n".join(lines))
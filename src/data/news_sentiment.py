@@ -4,15 +4,26 @@ Analyzes sentiment of news articles to identify positive catalysts.
 """
 
 import logging
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 from dataclasses import dataclass
 import re
 
+import numpy as np
+
 from src.data.news_fetcher import NewsArticle
 
 
 logger = logging.getLogger(__name__)
 
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+def _tokens(text: str) -> List[str]:
+    """Lower-cased words of *text* with punctuation stripped."""
+    strip = _PUNCT_RE.sub
+    return [strip('', w) for w in text.lower().split()]
+
 
 @dataclass
 class SentimentAnalysis:
@@ -30,6 +41,71 @@ class SentimentAnalysis:
     negative_keywords: List[str]
 
 
+@lru_cache(maxsize=1)
+def _load_lexicon() -> Tuple[dict, dict, dict, dict]:
+    """
+    Keyword lexicon shared by every analyzer in the process.
+
+    Built on first use; later NewsSentimentAnalyzer instances reuse the
+    same (read-only) tables instead of rebuilding them.
+    """
+    # Positive keywords (bullish indicators)
+    positive_keywords = {
+        # Earnings/Financial
+        'beat': 3.0, 'exceed': 2.5, 'strong': 2.0, 'record': 2.5,
+        'surge': 3.0, 'soar': 3.0, 'rally': 2.5, 'gain': 2.0,
+        'growth': 2.0, 'revenue': 1.5, 'profit': 2.0,
+        
+        # Analyst/Market
+        'upgrade': 3.0, 'outperform': 2.5, 'buy': 2.0, 'bullish': 2.5,
+        'raised': 2.0, 'increase': 1.5, 'positive': 2.0,
+        'momentum': 1.5, 'breakout': 2.5,
+        
+        # Business
+        'expansion': 2.0, 'launch': 1.5, 'innovation': 2.0,
+        'partnership': 1.5, 'acquisition': 1.5, 'deal': 1.5,
+        'contract': 1.5, 'win': 2.0, 'success': 2.0,
+        
+        # Superlatives
+        'best': 2.0, 'top': 1.5, 'leading': 1.5, 'excellent': 2.0,
+        'outstanding': 2.5, 'impressive': 2.0
+    }
+    
+    # Negative keywords (bearish indicators)
+    negative_keywords = {
+        # Earnings/Financial
+        'miss': -3.0, 'disappoint': -2.5, 'weak': -2.0, 'decline': -2.0,
+        'fall': -2.0, 'drop': -2.5, 'plunge': -3.0, 'crash': -3.5,
+        'loss': -2.5, 'losses': -2.5, 'deficit': -2.0,
+        
+        # Analyst/Market
+        'downgrade': -3.0, 'underperform': -2.5, 'sell': -2.5,
+        'bearish': -2.5, 'cut': -2.0, 'reduce': -2.0,
+        'negative': -2.0, 'concern': -1.5, 'worry': -1.5,
+        
+        # Business
+        'lawsuit': -2.0, 'investigation': -2.0, 'scandal': -3.0,
+        'layoff': -2.5, 'bankruptcy': -3.5, 'delay': -1.5,
+        'recall': -2.5, 'failure': -2.5, 'problem': -1.5,
+        
+        # Superlatives
+        'worst': -2.5, 'poor': -2.0, 'bad': -1.5, 'terrible': -2.5
+    }
+    
+    # Modifiers (amplify or reduce sentiment)
+    amplifiers = {
+        'very': 1.5, 'extremely': 1.8, 'significantly': 1.6,
+        'substantially': 1.6, 'remarkably': 1.5, 'surprisingly': 1.4
+    }
+    
+    reducers = {
+        'slightly': 0.5, 'somewhat': 0.6, 'moderately': 0.7,
+        'relatively': 0.7, 'fairly': 0.7
+    }
+    
+    return positive_keywords, negative_keywords, amplifiers, reducers
+
+
 class NewsSentimentAnalyzer:
     """
     Analyzes sentiment of news articles using keyword-based approach.
@@ -37,59 +113,12 @@ class NewsSentimentAnalyzer:
     """
     
     def __init__(self):
-        # Positive keywords (bullish indicators)
-        self.positive_keywords = {
-            # Earnings/Financial
-            'beat': 3.0, 'exceed': 2.5, 'strong': 2.0, 'record': 2.5,
-            'surge': 3.0, 'soar': 3.0, 'rally': 2.5, 'gain': 2.0,
-            'growth': 2.0, 'revenue': 1.5, 'profit': 2.0,
-            
-            # Analyst/Market
-            'upgrade': 3.0, 'outperform': 2.5, 'buy': 2.0, 'bullish': 2.5,
-            'raised': 2.0, 'increase': 1.5, 'positive': 2.0,
-            'momentum': 1.5, 'breakout': 2.5,
-            
-            # Business
-            'expansion': 2.0, 'launch': 1.5, 'innovation': 2.0,
-            'partnership': 1.5, 'acquisition': 1.5, 'deal': 1.5,
-            'contract': 1.5, 'win': 2.0, 'success': 2.0,
-            
-            # Superlatives
-            'best': 2.0, 'top': 1.5, 'leading': 1.5, 'excellent': 2.0,
-            'outstanding': 2.5, 'impressive': 2.0
-        }
-        
-        # Negative keywords (bearish indicators)
-        self.negative_keywords = {
-            # Earnings/Financial
-            'miss': -3.0, 'disappoint': -2.5, 'weak': -2.0, 'decline': -2.0,
-            'fall': -2.0, 'drop': -2.5, 'plunge': -3.0, 'crash': -3.5,
-            'loss': -2.5, 'losses': -2.5, 'deficit': -2.0,
-            
-            # Analyst/Market
-            'downgrade': -3.0, 'underperform': -2.5, 'sell': -2.5,
-            'bearish': -2.5, 'cut': -2.0, 'reduce': -2.0,
-            'negative': -2.0, 'concern': -1.5, 'worry': -1.5,
-            
-            # Business
-            'lawsuit': -2.0, 'investigation': -2.0, 'scandal': -3.0,
-            'layoff': -2.5, 'bankruptcy': -3.5, 'delay': -1.5,
-            'recall': -2.5, 'failure': -2.5, 'problem': -1.5,
-            
-            # Superlatives
-            'worst': -2.5, 'poor': -2.0, 'bad': -1.5, 'terrible': -2.5
-        }
-        
-        # Modifiers (amplify or reduce sentiment)
-        self.amplifiers = {
-            'very': 1.5, 'extremely': 1.8, 'significantly': 1.6,
-            'substantially': 1.6, 'remarkably': 1.5, 'surprisingly': 1.4
-        }
-        
-        self.reducers = {
-            'slightly': 0.5, 'somewhat': 0.6, 'moderately': 0.7,
-            'relatively': 0.7, 'fairly': 0.7
-        }
+        (
+            self.positive_keywords,
+            self.negative_keywords,
+            self.amplifiers,
+            self.reducers,
+        ) = _load_lexicon()
     
     def analyze_article(self, article: NewsArticle) -> SentimentAnalysis:
         """
@@ -166,18 +195,21 @@ class NewsSentimentAnalyzer:
                 'positive_ratio': 0.0
             }
         
-        sentiments = [a.sentiment_score for a in articles if a.sentiment_score is not None]
-        
-        if not sentiments:
-            sentiments = [0.0]
+        scores = np.fromiter(
+            (a.sentiment_score for a in articles if a.sentiment_score is not None),
+            dtype=np.float64,
+        )
+        if scores.size == 0:
+            scores = np.zeros(1)
         
-        positive_count = sum(1 for s in sentiments if s > 0.2)
-        negative_count = sum(1 for s in sentiments if s < -0.2)
-        neutral_count = len(sentiments) - positive_count - negative_count
+        positive_count = int((scores > 0.2).sum())
+        negative_count = int((scores < -0.2).sum())
+        neutral_count = scores.size - positive_count - negative_count
+        mid = scores.size // 2
         
         return {
-            'avg_sentiment': sum(sentiments) / len(sentiments),
-            'median_sentiment': sorted(sentiments)[len(sentiments) // 2],
+            'avg_sentiment': float(scores.mean()),
+            'median_sentiment': float(np.partition(scores, mid)[mid]),
             'positive_count': positive_count,
             'negative_count': negative_count,
             'neutral_count': neutral_count,
@@ -190,19 +222,15 @@ class NewsSentimentAnalyzer:
         if not text:
             return 0.0
         
-        text_lower = text.lower()
-        words = text_lower.split()
+        words = _tokens(text)
         
         scores = []
         
         for i, word in enumerate(words):
-            # Clean word
-            word = re.sub(r'[^\w\s]', '', word)
-            
             # Check for modifiers before this word
             modifier = 1.0
             if i > 0:
-                prev_word = re.sub(r'[^\w\s]', '', words[i-1].lower())
+                prev_word = words[i-1]
                 if prev_word in self.amplifiers:
                     modifier = self.amplifiers[prev_word]
                 elif prev_word in self.reducers:
@@ -242,11 +270,10 @@ class NewsSentimentAnalyzer:
         if not text:
             return 0.0
         
-        words = text.lower().split()
+        words = _tokens(text)
         keyword_count = 0
         
         for word in words:
-            word = re.sub(r'[^\w\s]', '', word)
             if word in self.positive_keywords or word in self.negative_keywords:
                 keyword_count += 1
         
@@ -268,6 +295,12 @@ class NewsSentimentAnalyzer:
         return found
 
 
+@lru_cache(maxsize=1)
+def get_default_analyzer() -> "NewsSentimentAnalyzer":
+    """Process-wide NewsSentimentAnalyzer (the analyzer holds no per-call state)."""
+    return NewsSentimentAnalyzer()
+
+
 def classify_news_catalyst(article: NewsArticle, sentiment: SentimentAnalysis) -> dict:
     """
     Classify news as a trading catalyst.
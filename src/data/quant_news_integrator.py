@@ -4,6 +4,7 @@ Combines quantitative technical analysis with news sentiment for multi-factor sc
 """
 
 import logging
+import sys
 from dataclasses import dataclass
 from typing import List, Optional, Dict
 from datetime import datetime
@@ -15,7 +16,7 @@ from src.data.news_scorer import NewsScorer, NewsScore
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedScore:
     """Combined quant + news scoring for a symbol."""
     symbol: str
@@ -52,6 +53,44 @@ class UnifiedScore:
     stop_price: Optional[float] = None
     target_price: Optional[float] = None
     risk_reward_ratio: Optional[float] = None
+    
+    def format_detailed(self, quant_weight: float = 0.60, news_weight: float = 0.40) -> str:
+        """Multi-line breakdown of every component (unset sub-scores omitted)."""
+        lines = [
+            f"\nDETAILED BREAKDOWN - Top Opportunity: {self.symbol}",
+            "-" * 80,
+            f"  Total Score: {self.total_score:.1f}/100",
+            f"  Quant Score: {self.quant_score:.1f}/100 (weight: {quant_weight:.0%})",
+            f"  News Score: {self.news_score:.1f}/100 (weight: {news_weight:.0%})",
+            "\n  Quant Components:",
+        ]
+        if self.momentum_score:
+            lines.append(f"    - Momentum: {self.momentum_score:.1f}/100")
+        if self.mean_reversion_score:
+            lines.append(f"    - Mean Reversion: {self.mean_reversion_score:.1f}/100")
+        if self.volatility_score:
+            lines.append(f"    - Volatility: {self.volatility_score:.1f}/100")
+        lines.append("\n  News Components:")
+        if self.sentiment_score:
+            lines.append(f"    - Sentiment: {self.sentiment_score:.1f}/100")
+        if self.catalyst_score:
+            lines.append(f"    - Catalyst: {self.catalyst_score:.1f}/100")
+        lines.append(
+            f"\n  Signal Analysis:\n"
+            f"    - Unified Signal: {self.unified_signal}\n"
+            f"    - Quant Signal: {self.quant_signal}\n"
+            f"    - News Signal: {self.news_signal}\n"
+            f"    - Confidence: {self.confidence:.0f}%"
+        )
+        if self.entry_price:
+            lines.append(
+                f"\n  Trading Plan:\n"
+                f"    - Entry: ${self.entry_price:.2f}\n"
+                f"    - Stop: ${self.stop_price:.2f}\n"
+                f"    - Target: ${self.target_price:.2f}\n"
+                f"    - Risk:Reward = 1:{self.risk_reward_ratio:.1f}"
+            )
+        return "\n".join(lines)
 
 
 class QuantNewsIntegrator:
@@ -61,7 +100,7 @@ class QuantNewsIntegrator:
     """
     
     def __init__(self, quant_weight: float = 0.60, news_weight: float = 0.40,
-                 earnings_api_key: Optional[str] = None):
+                 earnings_api_key: Optional[str] = None, session=None):
         """
         Initialize integrator.
         
@@ -69,6 +108,7 @@ class QuantNewsIntegrator:
             quant_weight: Weight for quant score (default 60%)
             news_weight: Weight for news score (default 40%)
             earnings_api_key: Optional Finnhub API key
+            session: Optional shared requests.Session for news/earnings HTTP
         """
         if not abs(quant_weight + news_weight - 1.0) < 0.01:
             raise ValueError("quant_weight + news_weight must equal 1.0")
@@ -77,7 +117,7 @@ class QuantNewsIntegrator:
         self.news_weight = news_weight
         
         self.quant_scorer = QuantScorer()
-        self.news_scorer = NewsScorer(earnings_api_key=earnings_api_key)
+        self.news_scorer = NewsScorer(earnings_api_key=earnings_api_key, session=session)
         
         logger.info(f"QuantNewsIntegrator initialized (quant:{quant_weight:.0%}, news:{news_weight:.0%})")
     
@@ -376,15 +416,22 @@ class QuantNewsIntegrator:
         return False
 
 
+_UNIFIED_BAR = "=" * 120
+_UNIFIED_TABLE_HEAD = (
+    f"{'Rank':<6}{'Symbol':<8}{'Total':<8}{'Quant':<8}{'News':<8}"
+    f"{'Signal':<14}{'Conf':<7}{'Entry':<10}{'Stop':<10}{'Target':<10}{'R:R':<6}\n"
+    + "-" * 120
+)
+
+
 def display_unified_scores(scores: List[UnifiedScore], top_n: int = 20):
-    """Pretty print unified scores."""
-    print(f"\n{'='*120}")
-    print(f"TOP {min(top_n, len(scores))} UNIFIED OPPORTUNITIES (Quant + News)")
-    print(f"{'='*120}\n")
-    
-    print(f"{'Rank':<6}{'Symbol':<8}{'Total':<8}{'Quant':<8}{'News':<8}"
-          f"{'Signal':<14}{'Conf':<7}{'Entry':<10}{'Stop':<10}{'Target':<10}{'R:R':<6}")
-    print("-" * 120)
+    """Pretty print unified scores (the whole table in one stdout write)."""
+    lines = [
+        f"\n{_UNIFIED_BAR}",
+        f"TOP {min(top_n, len(scores))} UNIFIED OPPORTUNITIES (Quant + News)",
+        f"{_UNIFIED_BAR}\n",
+        _UNIFIED_TABLE_HEAD,
+    ]
     
     for i, score in enumerate(scores[:top_n], 1):
         entry_str = f"${score.entry_price:.2f}" if score.entry_price else "N/A"
@@ -392,9 +439,10 @@ def display_unified_scores(scores: List[UnifiedScore], top_n: int = 20):
         target_str = f"${score.target_price:.2f}" if score.target_price else "N/A"
         rr_str = f"{score.risk_reward_ratio:.1f}" if score.risk_reward_ratio else "N/A"
         
-        print(f"{i:<6}{score.symbol:<8}{score.total_score:<8.1f}"
-              f"{score.quant_score:<8.1f}{score.news_score:<8.1f}"
-              f"{score.unified_signal:<14}{score.confidence:<7.0f}"
-              f"{entry_str:<10}{stop_str:<10}{target_str:<10}{rr_str:<6}")
+        lines.append(f"{i:<6}{score.symbol:<8}{score.total_score:<8.1f}"
+                     f"{score.quant_score:<8.1f}{score.news_score:<8.1f}"
+                     f"{score.unified_signal:<14}{score.confidence:<7.0f}"
+                     f"{entry_str:<10}{stop_str:<10}{target_str:<10}{rr_str:<6}")
     
-    print(f"\n{'='*120}\n")
+    lines.append(f"\n{_UNIFIED_BAR}\n\n")
+    sys.stdout.write("\n".join(lines))
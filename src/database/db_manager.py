@@ -5,8 +5,9 @@ High-level interface for all database operations.
 Handles reads, writes, migrations, exports.
 """
 
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import Iterator, List, Dict, Optional, Any
 import json
 
 from sqlalchemy.orm import Session
@@ -21,13 +22,60 @@ from src.database.models import (
 class TradeLabsDB:
     """Modern SQLite database manager."""
     
-    def __init__(self, db_path: str = "data/trade_labs.db"):
+    def __init__(self, db_path: str = "data/trade_labs.db", wal: bool = False):
+        """
+        Args:
+            db_path: SQLite file
+            wal: Open connections in WAL mode with synchronous=NORMAL
+                (see models.get_engine)
+        """
         self.db_path = db_path
-        create_database(db_path)
+        self.wal = wal
+        # Session shared by every call inside transaction(), else None
+        self._tx: Optional[Session] = None
+        create_database(db_path, wal)
     
     def get_session(self) -> Session:
-        """Get a database session."""
-        return get_session(self.db_path)
+        """Get a database session (the open transaction's, if any)."""
+        if self._tx is not None:
+            return self._tx
+        return get_session(self.db_path, self.wal)
+    
+    @contextmanager
+    def transaction(self) -> Iterator["TradeLabsDB"]:
+        """
+        Group several record/update calls into one SQLite transaction.
+
+        Inside the block every method shares one session and only flushes;
+        the block commits once on exit (one fsync instead of one per call)
+        or rolls everything back if it raises.
+        """
+        if self._tx is not None:  # already inside one; join it
+            yield self
+            return
+        session = get_session(self.db_path, self.wal)
+        self._tx = session
+        try:
+            yield self
+            session.commit()
+        except BaseException:
+            session.rollback()
+            raise
+        finally:
+            self._tx = None
+            session.close()
+    
+    def _commit(self, session: Session) -> None:
+        """Commit, or just flush (assigning ids) inside transaction()."""
+        if session is self._tx:
+            session.flush()
+        else:
+            session.commit()
+    
+    def _release(self, session: Session) -> None:
+        """Close a per-call session; the transaction's stays open."""
+        if session is not self._tx:
+            session.close()
     
     # ========================
     # RUN OPERATIONS
@@ -58,7 +106,7 @@ class TradeLabsDB:
         )
         
         session.add(run)
-        session.commit()
+        self._commit(session)
         
         # Return dict before closing session
         result = {
@@ -69,21 +117,21 @@ class TradeLabsDB:
             "armed": run.armed,
         }
         
-        session.close()
+        self._release(session)
         return result
     
     def get_runs(self, limit: int = 100) -> List[Run]:
         """Get recent pipeline runs."""
         session = self.get_session()
         runs = session.query(Run).order_by(Run.timestamp.desc()).limit(limit).all()
-        session.close()
+        self._release(session)
         return runs
     
     def get_run_by_id(self, run_id: str) -> Optional[Run]:
         """Get a specific run by ID."""
         session = self.get_session()
         run = session.query(Run).filter(Run.run_id == run_id).first()
-        session.close()
+        self._release(session)
         return run
     
     # ========================
@@ -119,8 +167,8 @@ class TradeLabsDB:
         )
         
         session.add(trade)
-        session.commit()
-        session.close()
+        self._commit(session)
+        self._release(session)
         
         return trade
     
@@ -135,7 +183,7 @@ class TradeLabsDB:
         trade = session.query(Trade).filter(Trade.id == trade_id).first()
         
         if not trade:
-            session.close()
+            self._release(session)
             return None
         
         exit_time = datetime.fromisoformat(exit_timestamp) if isinstance(exit_timestamp, str) else (datetime.utcnow() if exit_timestamp is None else exit_timestamp)
@@ -156,8 +204,8 @@ class TradeLabsDB:
         trade.realized_pnl_pct = round(realized_pnl_pct, 4)
         trade.duration_seconds = int(duration_secs)
         
-        session.commit()
-        session.close()
+        self._commit(session)
+        self._release(session)
         
         return trade
     
@@ -177,7 +225,7 @@ class TradeLabsDB:
             query = query.filter(Trade.status == status)
         
         trades = query.order_by(Trade.entry_timestamp.desc()).limit(limit).all()
-        session.close()
+        self._release(session)
         
         return trades
     
@@ -196,7 +244,7 @@ class TradeLabsDB:
             )
         ).all()
         
-        session.close()
+        self._release(session)
         return trades
     
     # ========================
@@ -223,8 +271,8 @@ class TradeLabsDB:
         )
         
         session.add(signal)
-        session.commit()
-        session.close()
+        self._commit(session)
+        self._release(session)
         
         return signal
     
@@ -268,8 +316,8 @@ class TradeLabsDB:
         
         position.reconciliation_status = "PENDING"
         
-        session.commit()
-        session.close()
+        self._commit(session)
+        self._release(session)
         
         return position
     
@@ -277,7 +325,7 @@ class TradeLabsDB:
         """Get all open positions."""
         session = self.get_session()
         positions = session.query(Position).filter(Position.quantity > 0).all()
-        session.close()
+        self._release(session)
         return positions
     
     def close_position(self, symbol: str):
@@ -289,9 +337,9 @@ class TradeLabsDB:
             position.quantity = 0
             position.unrealized_pnl = 0.0
             position.unrealized_pnl_pct = 0.0
-            session.commit()
+            self._commit(session)
         
-        session.close()
+        self._release(session)
     
     # ========================
     # METRICS OPERATIONS
@@ -333,8 +381,8 @@ class TradeLabsDB:
         )
         
         session.add(metrics)
-        session.commit()
-        session.close()
+        self._commit(session)
+        self._release(session)
         
         return metrics
     
@@ -375,8 +423,8 @@ class TradeLabsDB:
             summary.first_trade_date = first_trade.entry_timestamp
             summary.last_trade_date = last_trade.exit_timestamp
         
-        session.commit()
-        session.close()
+        self._commit(session)
+        self._release(session)
         
         return summary
     
@@ -405,38 +453,54 @@ class TradeLabsDB:
             "avg_trade_pnl": round(total_pnl / len(closed_trades), 2) if closed_trades else 0,
         }
         
-        session.close()
+        self._release(session)
         return stats
     
     # ========================
     # EXPORT
     # ========================
     
-    def export_trades_to_json(self, filename: str = "trades_export.json"):
-        """Export all trades to JSON."""
-        import json
-        
-        trades = self.get_trades()
-        data = []
-        
-        for trade in trades:
-            data.append({
-                "symbol": trade.symbol,
-                "side": trade.side,
-                "quantity": trade.quantity,
-                "entry_price": trade.entry_price,
-                "entry_timestamp": trade.entry_timestamp.isoformat() if trade.entry_timestamp else None,
-                "exit_price": trade.exit_price,
-                "exit_timestamp": trade.exit_timestamp.isoformat() if trade.exit_timestamp else None,
-                "stop_loss": trade.stop_loss,
-                "realized_pnl": trade.realized_pnl,
-                "realized_pnl_pct": trade.realized_pnl_pct,
-                "status": trade.status,
-                "duration_seconds": trade.duration_seconds,
-            })
-        
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        print(f"✓ Exported {len(data)} trades to {filename}")
+    def export_trades_to_json(
+        self,
+        filename: str = "trades_export.json",
+        limit: Optional[int] = 1000,
+    ):
+        """
+        Export trades (newest first, at most *limit*; None for all) to JSON.
+
+        Rows are streamed from the cursor in batches and written one object
+        per line as they arrive, so memory stays flat however many trades
+        the table holds.
+        """
+        session = self.get_session()
+        query = session.query(Trade).order_by(Trade.entry_timestamp.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        
+        count = 0
+        try:
+            with open(filename, 'w') as f:
+                f.write("[")
+                for trade in query.yield_per(1000):
+                    f.write(",\n  " if count else "\n  ")
+                    json.dump({
+                        "symbol": trade.symbol,
+                        "side": trade.side,
+                        "quantity": trade.quantity,
+                        "entry_price": trade.entry_price,
+                        "entry_timestamp": trade.entry_timestamp.isoformat() if trade.entry_timestamp else None,
+                        "exit_price": trade.exit_price,
+                        "exit_timestamp": trade.exit_timestamp.isoformat() if trade.exit_timestamp else None,
+                        "stop_loss": trade.stop_loss,
+                        "realized_pnl": trade.realized_pnl,
+                        "realized_pnl_pct": trade.realized_pnl_pct,
+                        "status": trade.status,
+                        "duration_seconds": trade.duration_seconds,
+                    }, f)
+                    count += 1
+                f.write("\n]\n" if count else "]\n")
+        finally:
+            self._release(session)
+        
+        print(f"✓ Exported {count} trades to {filename}")
         return filename
@@ -5,9 +5,11 @@ Define database schema using SQLAlchemy ORM.
 Supports trades, runs, signals, positions, metrics.
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text
+from functools import lru_cache
+
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, Session
+from sqlalchemy.orm import relationship, sessionmaker, Session
 from datetime import datetime
 
 Base = declarative_base()
@@ -206,17 +208,39 @@ class PerformanceSummary(Base):
         return f"<PerfSummary trades={self.total_trades} pnl=${self.total_pnl}>"
 
 
-def create_database(db_path: str = "data/trade_labs.db"):
-    """Create database and all tables."""
+@lru_cache(maxsize=None)
+def get_engine(db_path: str = "data/trade_labs.db", wal: bool = False):
+    """
+    One engine (and connection pool) per database file.
+
+    With *wal*, every connection runs in WAL mode with synchronous=NORMAL:
+    commits no longer fsync the main file, at the cost of possibly losing
+    the last transactions (never corrupting) on power loss.
+    """
     engine = create_engine(f"sqlite:///{db_path}")
+    if wal:
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_conn, _record):
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+    return engine
+
+
+@lru_cache(maxsize=None)
+def _session_factory(db_path: str, wal: bool) -> sessionmaker:
+    return sessionmaker(bind=get_engine(db_path, wal))
+
+
+def create_database(db_path: str = "data/trade_labs.db", wal: bool = False):
+    """Create database and all tables."""
+    engine = get_engine(db_path, wal)
     Base.metadata.create_all(engine)
     print(f"✓ Database created/verified: {db_path}")
     return engine
 
 
-def get_session(db_path: str = "data/trade_labs.db") -> Session:
+def get_session(db_path: str = "data/trade_labs.db", wal: bool = False) -> Session:
     """Get a database session."""
-    engine = create_engine(f"sqlite:///{db_path}")
-    from sqlalchemy.orm import sessionmaker
-    SessionLocal = sessionmaker(bind=engine)
-    return SessionLocal()
+    return _session_factory(db_path, wal)()
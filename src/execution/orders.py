@@ -56,53 +56,33 @@ def place_order(req: OrderRequest, ib: Optional[IB] = None) -> OrderResult:
     backend = execution_backend()
     armed = is_armed()
 
-    # Hard block LIVE forever for now
-    if not is_paper():
+    def result(ok: bool, message: str, **order_ids) -> OrderResult:
+        # Every outcome shares the request/gate fields; only the verdict,
+        # message and (on submission) order ids differ.
         return OrderResult(
-            ok=False, mode=mode, backend=backend, armed=armed,
+            ok=ok, mode=mode, backend=backend, armed=armed,
             symbol=req.symbol, side=req.side, quantity=req.quantity,
             order_type=req.order_type, stop_loss=req.stop_loss,
-            timestamp=ts,
-            message="LIVE mode blocked (not enabled)."
+            timestamp=ts, message=message, **order_ids,
         )
 
+    # Hard block LIVE forever for now
+    if not is_paper():
+        return result(False, "LIVE mode blocked (not enabled).")
+
     # SAFE DEFAULT: SIM always allowed, never hits broker
     if backend == "SIM":
-        return OrderResult(
-            ok=True, mode=mode, backend=backend, armed=armed,
-            symbol=req.symbol, side=req.side, quantity=req.quantity,
-            order_type=req.order_type, stop_loss=req.stop_loss,
-            timestamp=ts,
-            message="SIM order accepted (no broker submission)."
-        )
+        return result(True, "SIM order accepted (no broker submission).")
 
     # IB backend requires ARMED=1
     if backend == "IB" and not armed:
-        return OrderResult(
-            ok=False, mode=mode, backend=backend, armed=armed,
-            symbol=req.symbol, side=req.side, quantity=req.quantity,
-            order_type=req.order_type, stop_loss=req.stop_loss,
-            timestamp=ts,
-            message="BLOCKED: TRADE_LABS_ARMED=0. Set TRADE_LABS_ARMED=1 to allow IB paper orders."
-        )
+        return result(False, "BLOCKED: TRADE_LABS_ARMED=0. Set TRADE_LABS_ARMED=1 to allow IB paper orders.")
 
     if backend != "IB":
-        return OrderResult(
-            ok=False, mode=mode, backend=backend, armed=armed,
-            symbol=req.symbol, side=req.side, quantity=req.quantity,
-            order_type=req.order_type, stop_loss=req.stop_loss,
-            timestamp=ts,
-            message=f"Unknown backend: {backend}"
-        )
+        return result(False, f"Unknown backend: {backend}")
 
     if ib is None:
-        return OrderResult(
-            ok=False, mode=mode, backend=backend, armed=armed,
-            symbol=req.symbol, side=req.side, quantity=req.quantity,
-            order_type=req.order_type, stop_loss=req.stop_loss,
-            timestamp=ts,
-            message="IB backend requires an active IB connection passed in."
-        )
+        return result(False, "IB backend requires an active IB connection passed in.")
 
     # ---- REAL IB PAPER ORDER SUBMISSION ----
     # DEPRECATED PATH: this market-entry + stop helper predates the bracket
@@ -138,12 +118,8 @@ def place_order(req: OrderRequest, ib: Optional[IB] = None) -> OrderResult:
         ib.sleep(1.0)
         stop_id = stop_order.orderId
 
-    return OrderResult(
-        ok=True, mode=mode, backend=backend, armed=armed,
-        symbol=req.symbol, side=req.side, quantity=req.quantity,
-        order_type=req.order_type, stop_loss=req.stop_loss,
-        timestamp=ts,
-        message="IB PAPER order submitted (check TWS).",
+    return result(
+        True, "IB PAPER order submitted (check TWS).",
         parent_order_id=parent_id,
         stop_order_id=stop_id
     )
\ No newline at end of file
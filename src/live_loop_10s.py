@@ -148,7 +148,7 @@ BREADTH_CACHE_SECONDS = 300
 BREADTH_ADV_THRESHOLD = 0.65
 BREADTH_SCAN_LIMIT = 15
 # Trade history for loss-streak tracking
-TRADES_FILE = Path("data/trade_history/trades.json")
+TRADES_DB_DIR = "data/trade_history"
 # ---- Bracket Throttling & Safety ----
 MAX_NEW_BRACKETS_PER_LOOP = int(os.getenv("TRADE_LABS_MAX_NEW_BRACKETS_PER_LOOP", "4"))
 # Loss-triggered cooldown: applied per-symbol ONLY after a LOSING exit on that
@@ -842,12 +842,10 @@ def get_scan_breadth_pct(ib: IB, scan_results: List) -> Optional[float]:
 
 
 def load_closed_trades() -> List[Dict[str, float]]:
-    if not TRADES_FILE.exists():
-        return []
     try:
-        with open(TRADES_FILE) as f:
-            trades = json.load(f)
-        return [t for t in trades if t.get("status") == "CLOSED" and t.get("pnl") is not None]
+        from src.utils.trade_history_db import get_shared_db
+        trades = get_shared_db(TRADES_DB_DIR).get_trade_history(status="CLOSED")
+        return [t for t in trades if t.get("pnl") is not None]
     except Exception:
         return []
 
@@ -12,26 +12,39 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from datetime import datetime, timezone
 from typing import Optional
 
 from src.config.settings import settings
+from src.utils.clock import utc_iso_now
+
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:  # pragma: no cover - orjson is optional
+    def _dumps(obj: dict) -> str:
+        return json.dumps(obj, default=str)
 
 
 class _JsonFormatter(logging.Formatter):
     """Formats log records as single-line JSON objects."""
 
     def format(self, record: logging.LogRecord) -> str:
+        d = record.__dict__
         payload = {
-            "ts": datetime.now(timezone.utc).isoformat(),
+            "ts": utc_iso_now(),
             "level": record.levelname,
-            "arm": getattr(record, "arm", "unknown"),
-            "mode": getattr(record, "mode", settings.trade_mode.value),
+            "arm": d.get("arm", "unknown"),
+            "mode": d.get("mode", settings.trade_mode.value),
             "msg": record.getMessage(),
         }
         if record.exc_info and record.exc_info[1]:
-            payload["exception"] = self.formatException(record.exc_info)
-        return json.dumps(payload, default=str)
+            # Formatted once per record, as logging.Formatter.format does.
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            payload["exception"] = record.exc_text
+        return _dumps(payload)
 
 
 class _HumanFormatter(logging.Formatter):
@@ -40,10 +53,9 @@ class _HumanFormatter(logging.Formatter):
     fmt_str = "%(asctime)s [%(levelname)-5s] %(arm)s | %(message)s"
 
     def format(self, record: logging.LogRecord) -> str:
-        if not hasattr(record, "arm"):
-            record.arm = "unknown"  # type: ignore[attr-defined]
-        if not hasattr(record, "mode"):
-            record.mode = settings.trade_mode.value  # type: ignore[attr-defined]
+        d = record.__dict__
+        d.setdefault("arm", "unknown")
+        d.setdefault("mode", settings.trade_mode.value)
         self._style._fmt = self.fmt_str
         return super().format(record)
 
@@ -94,15 +106,16 @@ def get_logger(arm_name: str, level: Optional[str] = None) -> logging.Logger:
     logger.setLevel(getattr(logging, (level or settings.log_level).upper(), logging.INFO))
     logger.propagate = False
 
-    # Inject default extra fields so %(arm)s never errors out.
+    # Inject default extra fields so %(arm)s never errors out.  Plain dict
+    # setdefault rather than hasattr(): no AttributeError round-trip per
+    # record, and caller-supplied extra={"arm": ...} still wins.
     old_factory = logger.makeRecord
 
     def _make_record(*args, **kwargs):  # type: ignore[override]
         record = old_factory(*args, **kwargs)
-        if not hasattr(record, "arm"):
-            record.arm = arm_name  # type: ignore[attr-defined]
-        if not hasattr(record, "mode"):
-            record.mode = settings.trade_mode.value  # type: ignore[attr-defined]
+        d = record.__dict__
+        d.setdefault("arm", arm_name)
+        d.setdefault("mode", settings.trade_mode.value)
         return record
 
     logger.makeRecord = _make_record  # type: ignore[assignment]
@@ -1,13 +1,112 @@
 """
 Hyper-Swing Quant Filters — Phase 2 Signal Quality
 Pure functions; no IB dependency. Operate on DataFrames / scalars.
+
+The numeric inner loops live in ``_k_*`` kernels over float64 arrays,
+compiled with numba when it is installed (plain Python/NumPy otherwise).
+The public functions keep their DataFrame signatures and convert each
+column once.
 """
 
 import math
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 from typing import Optional
 
+from src.utils.jit import njit
+
+
+def _col(df: pd.DataFrame, name: str) -> np.ndarray:
+    return df[name].to_numpy(dtype=np.float64)
+
+
+# ---------------------------------------------------------------------------
+# Kernels (float64 arrays in, scalars out)
+# ---------------------------------------------------------------------------
+
+@njit(cache=True)
+def _k_vwap(high, low, close, volume):
+    # Final value of the cumulative VWAP == sum(tp * vol) / sum(vol).
+    num = 0.0
+    den = 0.0
+    for i in range(close.size):
+        num += (high[i] + low[i] + close[i]) / 3.0 * volume[i]
+        den += volume[i]
+    return num / den
+
+
+@njit(cache=True)
+def _k_ema_last(x, span):
+    # pandas ewm(span, adjust=False).mean().iloc[-1], skipping NaNs.
+    alpha = 2.0 / (span + 1.0)
+    y = np.nan
+    for i in range(x.size):
+        v = x[i]
+        if v != v:
+            continue
+        if y != y:
+            y = v
+        else:
+            y = alpha * v + (1.0 - alpha) * y
+    return y
+
+
+@njit(cache=True)
+def _k_true_range(high, low, close):
+    n = close.size
+    tr = np.empty(n)
+    for i in range(n):
+        r = high[i] - low[i]
+        if i > 0:
+            pc = close[i - 1]
+            a = abs(high[i] - pc)
+            b = abs(low[i] - pc)
+            if a > r:
+                r = a
+            if b > r:
+                r = b
+        tr[i] = r
+    return tr
+
+
+@njit(cache=True)
+def _k_atr14_20d_avg(high, low, close):
+    # Last value of tr.rolling(14).mean().rolling(20).mean(); NaN if short.
+    tr = _k_true_range(high, low, close)
+    n = tr.size
+    if n < 14 + 20 - 1:
+        return np.nan
+    total = 0.0
+    for j in range(n - 20, n):
+        s = 0.0
+        for i in range(j - 13, j + 1):
+            s += tr[i]
+        total += s / 14.0
+    return total / 20.0
+
+
+@njit(cache=True)
+def _k_trend_chunks(closes):
+    # Score the last 15 closes as three 5-bar chunks (HH / HL pattern).
+    c = closes[closes.size - 15:]
+    h0 = c[0:5].max()
+    h1 = c[5:10].max()
+    h2 = c[10:15].max()
+    l0 = c[0:5].min()
+    l1 = c[5:10].min()
+    l2 = c[10:15].min()
+    score = 0.0
+    if h2 > h1 and h1 > h0:
+        score += 30.0
+    elif h2 > h1:
+        score += 15.0
+    if l2 > l1 and l1 > l0:
+        score += 30.0
+    elif l2 > l1:
+        score += 15.0
+    return score
+
 
 # ---------------------------------------------------------------------------
 # VWAP
@@ -23,18 +122,16 @@ def calc_vwap(df_5m: pd.DataFrame) -> float:
     if df_5m is None or df_5m.empty:
         return float("nan")
 
-    if "volume" in df_5m.columns and df_5m["volume"].sum() > 0:
-        typical = (df_5m["high"] + df_5m["low"] + df_5m["close"]) / 3.0
-        cum_tp_vol = (typical * df_5m["volume"]).cumsum()
-        cum_vol = df_5m["volume"].cumsum()
-        vwap_series = cum_tp_vol / cum_vol
-        val = float(vwap_series.iloc[-1])
-        if math.isfinite(val):
-            return val
+    close = _col(df_5m, "close")
+    if "volume" in df_5m.columns:
+        volume = _col(df_5m, "volume")
+        if np.nansum(volume) > 0:
+            val = float(_k_vwap(_col(df_5m, "high"), _col(df_5m, "low"), close, volume))
+            if math.isfinite(val):
+                return val
 
     # Fallback: EMA-20 of close
-    ema = df_5m["close"].ewm(span=20, adjust=False).mean()
-    return float(ema.iloc[-1])
+    return float(_k_ema_last(close, 20.0))
 
 
 # ---------------------------------------------------------------------------
@@ -53,8 +150,9 @@ def calc_momentum(df_5m: pd.DataFrame, minutes: int = 30) -> float:
     if len(df_5m) < bars_needed + 1:
         return 0.0
 
-    cur = float(df_5m["close"].iloc[-1])
-    prev = float(df_5m["close"].iloc[-1 - bars_needed])
+    closes = _col(df_5m, "close")
+    cur = float(closes[-1])
+    prev = float(closes[-1 - bars_needed])
     if prev <= 0:
         return 0.0
     return (cur - prev) / prev
@@ -116,22 +214,10 @@ def estimate_atr14_20d_avg(daily_df: pd.DataFrame) -> Optional[float]:
     if daily_df is None or daily_df.empty or len(daily_df) < 20:
         return None
 
-    high = daily_df["high"]
-    low = daily_df["low"]
-    close = daily_df["close"]
-    prev_close = close.shift(1)
-
-    tr = pd.concat([
-        high - low,
-        (high - prev_close).abs(),
-        (low - prev_close).abs(),
-    ], axis=1).max(axis=1)
-
-    atr14 = tr.rolling(14).mean()
-    avg_20 = atr14.rolling(20).mean().dropna()
-    if avg_20.empty:
-        return None
-    return float(avg_20.iloc[-1])
+    val = float(_k_atr14_20d_avg(
+        _col(daily_df, "high"), _col(daily_df, "low"), _col(daily_df, "close")
+    ))
+    return val if math.isfinite(val) else None
 
 
 # ---------------------------------------------------------------------------
@@ -163,28 +249,16 @@ def calc_trend_structure(df_5m: pd.DataFrame, vwap: float) -> float:
         return 0.0
 
     score = 0.0
-    cur_px = float(df_5m["close"].iloc[-1])
+    closes = _col(df_5m, "close")
+    cur_px = float(closes[-1])
 
     # Above VWAP
     if math.isfinite(vwap) and cur_px > vwap:
         score += 40.0
 
     # Simple higher-high / higher-low over recent 5-bar chunks
-    closes = df_5m["close"].values
-    if len(closes) >= 15:
-        chunks = np.array_split(closes[-15:], 3)
-        highs = [float(c.max()) for c in chunks]
-        lows = [float(c.min()) for c in chunks]
-
-        if highs[2] > highs[1] > highs[0]:
-            score += 30.0
-        elif highs[2] > highs[1]:
-            score += 15.0
-
-        if lows[2] > lows[1] > lows[0]:
-            score += 30.0
-        elif lows[2] > lows[1]:
-            score += 15.0
+    if closes.size >= 15:
+        score += float(_k_trend_chunks(closes))
 
     return min(score, 100.0)
 
@@ -211,13 +285,10 @@ def _normalise(value: float, lo: float, hi: float) -> float:
     return ((clamped - lo) / (hi - lo)) * 100.0
 
 
-def quant_score_components(metrics: dict) -> dict:
-    """
-    Return normalized sub-scores plus composite score.
-
-    Expects keys: momentum_30m, volume_accel, rel_strength_vs_spy,
-                  atr_expansion, trend_structure_score, playbook_score.
-    """
+@lru_cache(maxsize=1024)
+def _quant_score_cached(items: tuple) -> dict:
+    # Pure function of the metric values; keyed on the sorted item tuple.
+    metrics = dict(items)
     mom = _normalise(metrics.get("momentum_30m", 0.0), -0.005, 0.0075)
     vol = _normalise(metrics.get("volume_accel", 1.0), 0.2, 1.7)
     rs = _normalise(metrics.get("rel_strength_vs_spy", 0.0), -0.004, 0.00475)
@@ -245,6 +316,22 @@ def quant_score_components(metrics: dict) -> dict:
     }
 
 
+def quant_score_components(metrics: dict) -> dict:
+    """
+    Return normalized sub-scores plus composite score.
+
+    Expects keys: momentum_30m, volume_accel, rel_strength_vs_spy,
+                  atr_expansion, trend_structure_score, playbook_score.
+
+    Results are memoized per distinct metrics dict; a fresh copy is returned
+    so callers may mutate it.
+    """
+    try:
+        return dict(_quant_score_cached(tuple(sorted(metrics.items()))))
+    except TypeError:  # unhashable / unorderable values: compute directly
+        return dict(_quant_score_cached.__wrapped__(tuple(metrics.items())))
+
+
 def quant_score(metrics: dict) -> float:
     """
     Combine components into a single 0-100 score.
@@ -252,5 +339,7 @@ def quant_score(metrics: dict) -> float:
     Expects keys: momentum_30m, volume_accel, rel_strength_vs_spy,
                   atr_expansion, trend_structure_score, playbook_score.
     """
-    components = quant_score_components(metrics)
-    return components["composite"]
+    try:
+        return _quant_score_cached(tuple(sorted(metrics.items())))["composite"]
+    except TypeError:
+        return _quant_score_cached.__wrapped__(tuple(metrics.items()))["composite"]
@@ -278,20 +278,32 @@ class PortfolioRiskManager:
         
         return approved_positions
     
+    @staticmethod
+    def _mark(position: PortfolioPosition, current_price: float):
+        """Set a position's current price and recalculate its P&L."""
+        position.current_price = current_price
+        
+        if position.direction == "LONG":
+            position.unrealized_pnl = (current_price - position.entry_price) * position.quantity
+        else:
+            position.unrealized_pnl = (position.entry_price - current_price) * position.quantity
+        
+        position.unrealized_pnl_pct = (position.unrealized_pnl / position.position_size) * 100
+    
     def update_position_price(self, symbol: str, current_price: float):
         """Update current price for a position and recalculate P&L."""
         for position in self.positions:
             if position.symbol == symbol:
-                position.current_price = current_price
-                
-                if position.direction == "LONG":
-                    position.unrealized_pnl = (current_price - position.entry_price) * position.quantity
-                else:
-                    position.unrealized_pnl = (position.entry_price - current_price) * position.quantity
-                
-                position.unrealized_pnl_pct = (position.unrealized_pnl / position.position_size) * 100
+                self._mark(position, current_price)
                 break
     
+    def update_position_prices(self, prices: Dict[str, float]):
+        """Update many positions (symbol -> price) in one pass over the book."""
+        for position in self.positions:
+            price = prices.get(position.symbol)
+            if price is not None:
+                self._mark(position, price)
+    
     def close_position(self, symbol: str, exit_price: float) -> Optional[Dict]:
         """Close a position and return P&L details."""
         for i, position in enumerate(self.positions):
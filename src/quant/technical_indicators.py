@@ -2,6 +2,10 @@
 Technical Indicators Library
 Hundreds of calculations for swing trading signal generation.
 Focused on momentum, mean reversion, volatility, volume, and price action.
+
+The element-by-element loops (EMA, ATR, CMF) run in ``_k_*`` kernels
+compiled with numba ``nogil=True`` when it is installed, so callers can
+score many symbols from a thread pool without serialising on the GIL.
 """
 
 import numpy as np
@@ -10,6 +14,49 @@ from dataclasses import dataclass
 from typing import List, Optional
 from collections import deque
 
+from src.utils.jit import njit
+
+
+# ---------------------------------------------------------------------------
+# Kernels (float64 arrays in, scalars out)
+# ---------------------------------------------------------------------------
+
+@njit(cache=True, nogil=True)
+def _k_ema(prices, period):
+    # Seed with the SMA of the first *period* values, then smooth forward.
+    multiplier = 2.0 / (period + 1)
+    ema = np.mean(prices[:period])
+    for i in range(period, prices.size):
+        ema = prices[i] * multiplier + ema * (1 - multiplier)
+    return ema
+
+
+@njit(cache=True, nogil=True)
+def _k_atr(highs, lows, closes, period):
+    # Mean true range over the last *period* bars (needs period + 1 closes).
+    total = 0.0
+    for i in range(-period, 0):
+        h = highs[i]
+        l = lows[i]
+        c = closes[i - 1]
+        total += max(h - l, abs(h - c), abs(l - c))
+    return total / period
+
+
+@njit(cache=True, nogil=True)
+def _k_cmf(highs, lows, closes, volumes, period):
+    # (sum of money-flow volume, sum of volume) over the last *period* bars.
+    flow = 0.0
+    vol = 0.0
+    for i in range(-period, 0):
+        h = highs[i]
+        l = lows[i]
+        c = closes[i]
+        if h != l:
+            flow += ((c - l) - (h - c)) / (h - l) * volumes[i]
+        vol += volumes[i]
+    return flow, vol
+
 
 @dataclass
 class IndicatorResponse:
@@ -87,7 +134,7 @@ class TechnicalIndicators:
         if len(prices) < period + 1:
             return None
         
-        prices_array = np.array(prices[-period-1:], dtype=float)
+        prices_array = np.asarray(prices[-period-1:], dtype=float)
         deltas = np.diff(prices_array)
         
         gains = np.where(deltas > 0, deltas, 0)
@@ -109,7 +156,7 @@ class TechnicalIndicators:
         if len(prices) < 26:
             return None, None, None
         
-        prices_array = np.array(prices[-26:], dtype=float)
+        prices_array = np.asarray(prices[-26:], dtype=float)
         
         ema_12 = self._ema(prices_array, 12)
         ema_26 = self._ema(prices_array, 26)
@@ -152,7 +199,7 @@ class TechnicalIndicators:
         if len(prices) < period:
             return None, None, None, None
         
-        recent = np.array(prices[-period:], dtype=float)
+        recent = np.asarray(prices[-period:], dtype=float)
         ma = np.mean(recent)
         std = np.std(recent)
         
@@ -175,34 +222,21 @@ class TechnicalIndicators:
         if len(closes) < period + 1:
             return None
         
-        tr_values = []
-        for i in range(-period, 0):
-            h = highs[i]
-            l = lows[i]
-            c = closes[i - 1] if i > -len(closes) else closes[0]
-            
-            tr = max(h - l, abs(h - c), abs(l - c))
-            tr_values.append(tr)
-        
-        atr = np.mean(tr_values)
+        atr = _k_atr(np.asarray(highs, dtype=np.float64),
+                     np.asarray(lows, dtype=np.float64),
+                     np.asarray(closes, dtype=np.float64), period)
         return float(atr)
     
     def calculate_ema(self, prices: List[float], period: int) -> Optional[float]:
         """Exponential Moving Average."""
-        return self._ema(np.array(prices[-period:], dtype=float), period)
+        return self._ema(np.asarray(prices[-period:], dtype=float), period)
     
     def _ema(self, prices: np.ndarray, period: int) -> Optional[float]:
         """Calculate EMA for given prices."""
         if len(prices) < period:
             return None
         
-        multiplier = 2.0 / (period + 1)
-        ema = np.mean(prices[:period])
-        
-        for i in range(period, len(prices)):
-            ema = prices[i] * multiplier + ema * (1 - multiplier)
-        
-        return float(ema)
+        return float(_k_ema(np.asarray(prices, dtype=np.float64), period))
     
     def calculate_sma(self, prices: List[float], period: int) -> Optional[float]:
         """Simple Moving Average."""
@@ -216,7 +250,7 @@ class TechnicalIndicators:
         if len(prices) < period:
             return None
         
-        recent = np.array(prices[-period:], dtype=float)
+        recent = np.asarray(prices[-period:], dtype=float)
         mean = np.mean(recent)
         std = np.std(recent)
         
@@ -265,23 +299,11 @@ class TechnicalIndicators:
         if len(closes) < period:
             return None
         
-        cmf_values = []
-        for i in range(-period, 0):
-            h = highs[i]
-            l = lows[i]
-            c = closes[i]
-            v = volumes[i]
-            
-            if h == l:
-                cmf_val = 0
-            else:
-                money_flow_multiplier = ((c - l) - (h - c)) / (h - l)
-                cmf_val = money_flow_multiplier * v
-            
-            cmf_values.append(cmf_val)
-        
-        total_cmf = sum(cmf_values)
-        total_volume = sum(volumes[-period:])
+        total_cmf, total_volume = _k_cmf(np.asarray(highs, dtype=np.float64),
+                                         np.asarray(lows, dtype=np.float64),
+                                         np.asarray(closes, dtype=np.float64),
+                                         np.asarray(volumes, dtype=np.float64),
+                                         period)
         
         if total_volume == 0:
             return 0.0
@@ -306,7 +328,7 @@ class TechnicalIndicators:
         if len(prices) < period + 1:
             return None
         
-        returns = np.diff(np.log(np.array(prices[-period-1:], dtype=float)))
+        returns = np.diff(np.log(np.asarray(prices[-period-1:], dtype=float)))
         volatility = np.std(returns) * np.sqrt(252) * 100  # Annualized %
         
         return float(volatility)
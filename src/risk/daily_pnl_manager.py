@@ -56,19 +56,13 @@ def record_session_start_equity(equity: float):
 def get_realized_pnl() -> float:
     """
     Calculate realized P&L from closed trades.
-    Reads trades.json and sums up pnl for CLOSED status trades.
+    Reads the trade history and sums up pnl for CLOSED status trades.
     """
-    trades_file = Path("data/trade_history/trades.json")
-    if not trades_file.exists():
-        return 0.0
-    
-    with open(trades_file) as f:
-        trades = json.load(f)
-    
+    from src.utils.trade_history_db import get_shared_db
+
     realized = sum(
         (t.get("pnl") or 0.0)
-        for t in trades
-        if t.get("status") == "CLOSED"
+        for t in get_shared_db().get_trade_history(status="CLOSED")
     )
     return realized
 
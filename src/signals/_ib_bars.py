@@ -0,0 +1,199 @@
+"""
+Shared IB bar-fetch helpers for the signal path.
+
+score_candidates and signal_validator used to carry their own copies of the
+contract / bar / ATR helpers.  They live here once so that both share a
+single qualified-contract cache, one util.df memo and one set of live 1-min
+bar streams.  Caching policy (TTL, on-disk) stays with the callers.
+"""
+
+import math
+import weakref
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+from ib_insync import IB, BarDataList, Contract, Stock, util
+
+
+# ── contracts ────────────────────────────────────────────────────────────────
+# symbol -> qualified SMART/USD stock contract.  Qualification is a round-trip
+# and a contract's conId never changes within a session, so do it once.
+_qualified: Dict[str, Contract] = {}
+
+
+def qualified_contract(ib: IB, symbol: str) -> Contract:
+    """Return a qualified ``Stock(symbol, "SMART", "USD")``, cached per symbol."""
+    c = _qualified.get(symbol)
+    if c is not None:
+        return c
+    c = Stock(symbol, "SMART", "USD")
+    ib.qualifyContracts(c)
+    if c.conId:
+        _qualified[symbol] = c
+    return c
+
+
+# ── BarDataList → DataFrame ─────────────────────────────────────────────────
+# bars list -> (len, last bar, DataFrame).  Weak keys so dead bar lists
+# (cancelled streams, one-shot requests) drop their DataFrame with them.
+_df_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def df_from_bars(bars) -> pd.DataFrame:
+    """
+    Memoized ``util.df(bars)``.
+
+    Rebuilds only when the list grew or its last bar was replaced (a
+    keepUpToDate update), otherwise returns the previously built frame.
+    Callers must treat the result as read-only.
+    """
+    if not bars:
+        return pd.DataFrame()
+    n, last = len(bars), bars[-1]
+    try:
+        hit = _df_cache.get(bars)
+    except TypeError:  # not weak-referenceable (e.g. plain list)
+        df = util.df(bars)
+        return df if df is not None else pd.DataFrame()
+    if hit is not None and hit[0] == n and hit[1] is last:
+        return hit[2]
+    df = util.df(bars)
+    if df is None:
+        df = pd.DataFrame()
+    _df_cache[bars] = (n, last, df)
+    return df
+
+
+# ── intraday 1-min (streamed) ────────────────────────────────────────────────
+# Live 1-min bar subscriptions (symbol -> (owning IB, BarDataList kept current
+# by IB)).  The first request for a symbol downloads the 2h window once;
+# afterwards IB streams only new/updated bars and ib_insync mutates the list
+# in place.  A stream only lives as long as the connection that opened it.
+_intraday_1m_subs: Dict[str, Tuple[IB, BarDataList]] = {}
+# IB caps concurrent keepUpToDate streams; beyond this fall back to one-shot.
+MAX_INTRADAY_1M_SUBS = 40
+
+
+def _cancel_stream(owner: IB, bars: BarDataList) -> None:
+    if owner.isConnected():
+        try:
+            owner.cancelHistoricalData(bars)
+        except Exception:
+            pass
+
+
+def fetch_intraday_1m(ib: IB, symbol: str) -> pd.DataFrame:
+    """2 hours of 1-min bars, kept up to date by IB after the first call."""
+    sub = _intraday_1m_subs.get(symbol)
+    if sub is not None:
+        owner, bars = sub
+        if owner is ib and ib.isConnected():
+            return df_from_bars(bars)
+        # Stream belongs to a dead or replaced connection; resubscribe below.
+        del _intraday_1m_subs[symbol]
+        _cancel_stream(owner, bars)
+
+    c = qualified_contract(ib, symbol)
+
+    keep = len(_intraday_1m_subs) < MAX_INTRADAY_1M_SUBS
+    # 2 hours of 1-min bars = 7200 seconds (IB duration units must be S/D/W/M/Y)
+    bars = ib.reqHistoricalData(
+        c,
+        endDateTime="",
+        durationStr="7200 S",
+        barSizeSetting="1 min",
+        whatToShow="TRADES",
+        useRTH=False,
+        formatDate=1,
+        keepUpToDate=keep,
+    )
+    if keep and bars:
+        _intraday_1m_subs[symbol] = (ib, bars)
+    return df_from_bars(bars)
+
+
+def cancel_intraday_1m_subscriptions(ib: IB) -> None:
+    """Cancel all live 1-min bar streams on the connections that opened them."""
+    for owner, bars in _intraday_1m_subs.values():
+        _cancel_stream(owner, bars)
+    _intraday_1m_subs.clear()
+
+
+# ── one-shot history ─────────────────────────────────────────────────────────
+
+def fetch_intraday_5m(ib: IB, symbol: str) -> pd.DataFrame:
+    """1 day of 5-minute bars (uncached; empty frame if IB returns nothing)."""
+    bars = ib.reqHistoricalData(
+        qualified_contract(ib, symbol),
+        endDateTime="",
+        durationStr="1 D",
+        barSizeSetting="5 mins",
+        whatToShow="TRADES",
+        useRTH=False,
+        formatDate=1,
+    )
+    return df_from_bars(bars)
+
+
+def fetch_daily_30d(ib: IB, symbol: str) -> pd.DataFrame:
+    """30 calendar days of RTH daily bars (uncached; empty frame if none)."""
+    bars = ib.reqHistoricalData(
+        qualified_contract(ib, symbol),
+        endDateTime="",
+        durationStr="30 D",
+        barSizeSetting="1 day",
+        whatToShow="TRADES",
+        useRTH=True,
+        formatDate=1,
+    )
+    return df_from_bars(bars)
+
+
+async def fetch_bars_async(
+    ib: IB,
+    symbol: str,
+    duration: str,
+    bar_size: str,
+    use_rth: bool = True,
+) -> pd.DataFrame:
+    """Awaitable one-shot history request, for gathering many symbols at once."""
+    c = _qualified.get(symbol)
+    if c is None:
+        c = Stock(symbol, "SMART", "USD")
+        await ib.qualifyContractsAsync(c)
+        if c.conId:
+            _qualified[symbol] = c
+    bars = await ib.reqHistoricalDataAsync(
+        c,
+        endDateTime="",
+        durationStr=duration,
+        barSizeSetting=bar_size,
+        whatToShow="TRADES",
+        useRTH=use_rth,
+        formatDate=1,
+    )
+    return df_from_bars(bars)
+
+
+# ── ATR ──────────────────────────────────────────────────────────────────────
+
+def atr14(df: pd.DataFrame) -> float:
+    """
+    Latest 14-period ATR from daily bars; 0.0 if fewer than 14 bars.
+
+    Only the latest value is needed, i.e. the mean of the last 14 true
+    ranges, so work on raw arrays instead of a 3-column frame + rolling().
+    """
+    if df is None or df.empty or not {"high", "low", "close"} <= set(df.columns):
+        return 0.0
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    close = df["close"].to_numpy(dtype=np.float64)
+    if close.size < 14:
+        return 0.0
+    tr = high - low
+    prev = close[:-1]
+    tr[1:] = np.maximum(tr[1:], np.maximum(np.abs(high[1:] - prev), np.abs(low[1:] - prev)))
+    val = float(tr[-14:].mean())
+    return val if math.isfinite(val) else 0.0
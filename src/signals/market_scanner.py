@@ -5,7 +5,11 @@ from typing import List, Optional, Tuple
 from ib_insync import IB, ScannerSubscription, Stock
 
 from src.broker.ib_session import get_ib
-from config.universe_filter import STOCK_ALLOWLIST, STOCK_BLOCKLIST
+from config.universe_filter import (
+    LEVERAGED_OR_INVERSE_BLOCKLIST,
+    STOCK_ALLOWLIST,
+    STOCK_BLOCKLIST,
+)
 
 log = logging.getLogger(__name__)
 
@@ -222,8 +226,39 @@ def get_quote(ib: IB, symbol: str) -> Tuple[Optional[float], Optional[float], Op
     return bid, ask, last
 
 
-def passes_quality_filters(
-    symbol: str,
+async def get_quote_async(ib: IB, symbol: str) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """
+    Awaitable :func:`get_quote`.
+
+    Resolves as soon as IB ends the snapshot instead of sleeping a fixed
+    second, so many symbols can be quoted concurrently with ``asyncio.gather``.
+    """
+    contract = to_contract(symbol)
+    await ib.qualifyContractsAsync(contract)
+    tickers = await ib.reqTickersAsync(contract)
+    if not tickers:
+        return None, None, None
+    t = tickers[0]
+
+    bid = float(t.bid) if t.bid is not None else None
+    ask = float(t.ask) if t.ask is not None else None
+    last = float(t.last) if t.last is not None else None
+    return bid, ask, last
+
+
+def prefilter_symbol(symbol: str, block_leveraged_etfs: bool = False) -> bool:
+    """
+    Ticker-only part of the quality filter.  Run before quoting so symbols
+    that can never pass don't cost a market-data round-trip.
+    """
+    if symbol in STOCK_BLOCKLIST:
+        return False
+    if block_leveraged_etfs and symbol in LEVERAGED_OR_INVERSE_BLOCKLIST:
+        return False
+    return True
+
+
+def postfilter_quote(
     bid: Optional[float],
     ask: Optional[float],
     last: Optional[float],
@@ -231,7 +266,7 @@ def passes_quality_filters(
     max_spread_pct: float = 0.0015,
 ) -> bool:
     """
-    Basic liquidity/quality filters.
+    Quote-dependent part of the quality filter (price floor, spread).
     """
     # determine price
     if last is None:
@@ -251,8 +286,22 @@ def passes_quality_filters(
     if spread / price > max_spread_pct:
         return False
 
-    # blocklist safety
-    if symbol in STOCK_BLOCKLIST:
-        return False
+    return True
 
-    return True
\ No newline at end of file
+
+def passes_quality_filters(
+    symbol: str,
+    bid: Optional[float],
+    ask: Optional[float],
+    last: Optional[float],
+    min_price: float = 2.0,
+    max_spread_pct: float = 0.0015,
+    block_leveraged_etfs: bool = False,
+) -> bool:
+    """
+    Basic liquidity/quality filters.
+    """
+    return (
+        postfilter_quote(bid, ask, last, min_price=min_price, max_spread_pct=max_spread_pct)
+        and prefilter_symbol(symbol, block_leveraged_etfs)
+    )
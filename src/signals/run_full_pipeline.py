@@ -1,13 +1,16 @@
+import asyncio
 import math
 import os
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from ib_insync import IB, Stock, util
 import pandas as pd
 
 from config.identity import SYSTEM_NAME, HUMAN_NAME
 from src.data.ib_market_data import connect_ib, get_account_equity_usd
+from src.data.market_data_cache import MarketDataCache
+from src.signals._ib_bars import fetch_bars_async
 from src.signals.signal_engine import get_trade_intents_from_scan
 from src.utils.trade_history_db import TradeHistoryDB
 
@@ -59,6 +62,47 @@ def get_daily_30d(ib: IB, symbol: str) -> pd.DataFrame:
     return df
 
 
+async def _fetch_candidates(
+    ib: IB,
+    symbols: Sequence[str],
+    concurrency: int = 8,
+    cache: Optional[MarketDataCache] = None,
+) -> Dict[str, Union[Tuple[float, pd.DataFrame], BaseException]]:
+    """
+    symbol -> (last 1-min close, 30 daily bars), fetched concurrently.
+
+    Same data as get_recent_price_1m + get_daily_30d, but every candidate's
+    requests are in flight together on the one connection, at most
+    *concurrency* symbols at a time to stay well inside IB's pacing limits.
+    A failed symbol maps to its exception instead of sinking the batch.
+    Bars still fresh in *cache* are not requested again.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def bars(symbol: str, kind: str, duration: str, bar_size: str, use_rth: bool) -> pd.DataFrame:
+        df = cache.get(symbol, kind) if cache is not None else None
+        if df is None:
+            df = await fetch_bars_async(ib, symbol, duration, bar_size, use_rth=use_rth)
+            if cache is not None and not df.empty:
+                cache.put(symbol, kind, df)
+        return df
+
+    async def one(symbol: str) -> Tuple[float, pd.DataFrame]:
+        async with sem:
+            df_1m, df_d = await asyncio.gather(
+                bars(symbol, "bars_1m", "1 D", "1 min", False),
+                bars(symbol, "bars_1d", "30 D", "1 day", True),
+            )
+        if df_1m.empty:
+            raise RuntimeError(f"No 1-min bars for {symbol}")
+        if df_d.empty:
+            raise RuntimeError(f"No daily bars for {symbol}")
+        return float(df_1m["close"].iloc[-1]), df_d
+
+    results = await asyncio.gather(*(one(s) for s in symbols), return_exceptions=True)
+    return dict(zip(symbols, results))
+
+
 def atr14_from_daily(df: pd.DataFrame) -> float:
     high = df["high"].astype(float)
     low = df["low"].astype(float)
@@ -101,14 +145,17 @@ def run_full_pipeline(
     use_spy_only: bool = False,
     logger: Optional[Any] = None,
     ib: Optional[IB] = None,
+    db: Optional[TradeHistoryDB] = None,
     **kwargs
 ) -> Dict[str, Any]:
     """
     Orchestrator entrypoint.
 
     Compatibility:
-    - Orchestrator calls run_full_pipeline(...) WITHOUT passing ib
-    - So we create an IB connection here if not provided.
+    - The orchestrator passes its long-lived connection as ib
+    - Other callers may omit it; we then connect here and disconnect after.
+    - Likewise db: the orchestrator passes its TradeHistoryDB (inside a
+      batched() block); otherwise one is opened on data/trade_history.
 
     Behavior:
     - Scan + score candidates via signal_engine
@@ -128,7 +175,8 @@ def run_full_pipeline(
         run_id = str(uuid.uuid4())[:8]
         backend = os.getenv("TRADE_LABS_EXECUTION_BACKEND", "SIM")
         armed = os.getenv("TRADE_LABS_ARMED", "0") == "1"
-        db = TradeHistoryDB("data/trade_history")
+        if db is None:
+            db = TradeHistoryDB("data/trade_history")
 
         if logger and hasattr(logger, "scan_started"):
             logger.scan_started(run_id)
@@ -162,6 +210,15 @@ def run_full_pipeline(
         risk_pct = float(kwargs.get("risk_pct", 0.005))   # 0.5% per trade
         atr_mult = float(kwargs.get("atr_mult", 2.0))
 
+        # All candidates' bars in one concurrent round instead of two
+        # blocking requests per candidate inside the loop below.
+        market_data = ib.run(_fetch_candidates(
+            ib,
+            [i.symbol for i in intents],
+            concurrency=int(kwargs.get("fetch_concurrency", 8)),
+            cache=kwargs.get("market_cache"),
+        ))
+
         executed = 0
         successful = 0
 
@@ -172,8 +229,10 @@ def run_full_pipeline(
             print("─" * 52)
 
             try:
-                entry_price = get_recent_price_1m(ib, intent.symbol)
-                df_d = get_daily_30d(ib, intent.symbol)
+                fetched = market_data[intent.symbol]
+                if isinstance(fetched, BaseException):
+                    raise fetched
+                entry_price, df_d = fetched
                 atr14 = atr14_from_daily(df_d)
 
                 if math.isnan(atr14) or atr14 <= 0:
@@ -242,8 +301,6 @@ def run_full_pipeline(
                     reason="suggested",
                 )
 
-            ib.sleep(0.15)
-
         if logger and hasattr(logger, "pipeline_completed"):
             logger.pipeline_completed(run_id, executed, successful)
 
@@ -1,10 +1,22 @@
 from dataclasses import dataclass
 from typing import List
+import logging
 import math
 
-from ib_insync import IB, Stock, util
+from ib_insync import IB
+import numpy as np
 import pandas as pd
 
+from config.universe_filter import LEVERAGED_OR_INVERSE_BLOCKLIST
+from src.signals._ib_bars import (
+    atr14 as _atr14_from_daily,
+    cancel_intraday_1m_subscriptions,
+    fetch_daily_30d as _get_daily_30d,
+    fetch_intraday_1m as _get_intraday_1m,
+)
+
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class ScoredCandidate:
@@ -16,12 +28,6 @@ class ScoredCandidate:
     reason: str
 
 
-LEVERAGED_OR_INVERSE_BLOCKLIST = {
-    "TQQQ", "SQQQ", "SOXL", "SOXS", "TNA", "TZA",
-    "SPXL", "SPXS", "UVXY", "SVXY", "ZSL", "UGL",
-    "TSLL", "TSLS", "UVIX", "DUST",
-}
-
 ETF_ALLOWLIST = {"SPY", "QQQ"}
 ETF_BLOCKLIST = {"BITO"}
 
@@ -32,25 +38,6 @@ MIN_ATR14 = 0.25
 MIN_AVG_DOLLAR_VOL_20D = 10_000_000  # $10M/day average dollar volume (was $25M, too restrictive)
 
 
-def _contract(symbol: str) -> Stock:
-    return Stock(symbol, "SMART", "USD")
-
-
-def _atr14_from_daily(df: pd.DataFrame) -> float:
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
-    prev_close = close.shift(1)
-
-    tr1 = high - low
-    tr2 = (high - prev_close).abs()
-    tr3 = (low - prev_close).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-    atr = tr.rolling(14).mean().dropna()
-    return float(atr.iloc[-1]) if not atr.empty else float("nan")
-
-
 def _avg_dollar_volume_20d(df: pd.DataFrame) -> float:
     # IB daily bars include volume. Dollar volume ~ close * volume.
     if df is None or df.empty:
@@ -64,57 +51,22 @@ def _avg_dollar_volume_20d(df: pd.DataFrame) -> float:
 def _last_close(df: pd.DataFrame) -> float:
     if df is None or df.empty:
         return float("nan")
-    return float(df["close"].astype(float).iloc[-1])
+    return float(df["close"].to_numpy(dtype=np.float64)[-1])
 
 
 def _momentum_pct_60m(df_1m: pd.DataFrame) -> float:
     if df_1m is None or df_1m.empty:
         return float("nan")
-    closes = df_1m["close"].astype(float)
-    if len(closes) < 61:
+    closes = df_1m["close"].to_numpy(dtype=np.float64)
+    if closes.size < 61:
         return float("nan")
-    last = float(closes.iloc[-1])
-    past = float(closes.iloc[-61])
+    last = float(closes[-1])
+    past = float(closes[-61])
     if past <= 0:
         return float("nan")
     return (last / past - 1.0) * 100.0
 
 
-def _get_intraday_1m(ib: IB, symbol: str) -> pd.DataFrame:
-    c = _contract(symbol)
-    ib.qualifyContracts(c)
-
-    # 2 hours of 1-min bars = 7200 seconds (IB duration units must be S/D/W/M/Y)
-    bars = ib.reqHistoricalData(
-        c,
-        endDateTime="",
-        durationStr="7200 S",
-        barSizeSetting="1 min",
-        whatToShow="TRADES",
-        useRTH=False,
-        formatDate=1
-    )
-    df = util.df(bars)
-    return df if df is not None else pd.DataFrame()
-
-
-def _get_daily_30d(ib: IB, symbol: str) -> pd.DataFrame:
-    c = _contract(symbol)
-    ib.qualifyContracts(c)
-
-    bars = ib.reqHistoricalData(
-        c,
-        endDateTime="",
-        durationStr="30 D",
-        barSizeSetting="1 day",
-        whatToShow="TRADES",
-        useRTH=True,
-        formatDate=1
-    )
-    df = util.df(bars)
-    return df if df is not None else pd.DataFrame()
-
-
 def score_scan_results(
     ib: IB,
     scan_results: List,
@@ -128,19 +80,19 @@ def score_scan_results(
     scored: List[ScoredCandidate] = []
     rejected_summary = {"price": 0, "adv": 0, "atr": 0, "momentum": 0, "blocklist": 0}
 
-    for r in scan_results[:max_scan]:
-        sym = getattr(r, "symbol", None)
+    # Cheap static rejects up front so blocklisted symbols never cost an IB call.
+    window = scan_results[:max_scan]
+    named = [r for r in window if getattr(r, "symbol", None)]
+    candidates = [
+        r for r in named
+        if r.symbol not in LEVERAGED_OR_INVERSE_BLOCKLIST
+        and (r.symbol in ETF_ALLOWLIST or r.symbol not in ETF_BLOCKLIST)
+    ]
+    rejected_summary["blocklist"] = len(named) - len(candidates)
+
+    for r in candidates:
+        sym = r.symbol
         rank = int(getattr(r, "rank", 9999))
-        if not sym:
-            continue
-
-        if sym in LEVERAGED_OR_INVERSE_BLOCKLIST:
-            rejected_summary["blocklist"] += 1
-            continue
-
-        if sym in ETF_BLOCKLIST and sym not in ETF_ALLOWLIST:
-            rejected_summary["blocklist"] += 1
-            continue
 
         try:
             # Pull daily first for filters (cheaper than intraday sometimes)
@@ -152,12 +104,16 @@ def score_scan_results(
             # HARD filters (silent except summary)
             if math.isnan(px) or px < MIN_PRICE:
                 rejected_summary["price"] += 1
+                log.debug("[SCORE] %s rejected: price $%.2f < $%.2f", sym, px, MIN_PRICE)
                 continue
             if math.isnan(adv20) or adv20 < MIN_AVG_DOLLAR_VOL_20D:
                 rejected_summary["adv"] += 1
+                log.debug("[SCORE] %s rejected: ADV20 $%.1fM < $%.1fM",
+                          sym, adv20 / 1e6, MIN_AVG_DOLLAR_VOL_20D / 1e6)
                 continue
             if math.isnan(atr14) or atr14 < MIN_ATR14:
                 rejected_summary["atr"] += 1
+                log.debug("[SCORE] %s rejected: ATR14 %.2f < %.2f", sym, atr14, MIN_ATR14)
                 continue
 
             # Momentum (60 minutes)
@@ -165,6 +121,7 @@ def score_scan_results(
             mom = _momentum_pct_60m(df_1m)
             if math.isnan(mom):
                 rejected_summary["momentum"] += 1
+                log.debug("[SCORE] %s rejected: insufficient 1-min bars for momentum", sym)
                 continue
 
             # Score: momentum dominates; ATR gives swing preference
@@ -174,8 +131,7 @@ def score_scan_results(
                 f"Momentum60m={mom:.2f}% | ATR14={atr14:.2f} | "
                 f"LastClose=${px:.2f} | ADV20=${adv20/1e6:.1f}M | score={score:.2f}"
             )
-            
-            print(f"  [SCORE] {sym} ✓ {reason}")
+            log.debug("[SCORE] %s accepted: %s", sym, reason)
 
             scored.append(ScoredCandidate(
                 symbol=sym,
@@ -195,7 +151,7 @@ def score_scan_results(
     scored.sort(key=lambda x: x.score, reverse=True)
     
     # Summary line
-    total_scanned = len(scan_results[:max_scan])
+    total_scanned = len(window)
     total_rejected = sum(rejected_summary.values())
     if total_rejected > 0:
         details = ", ".join(f"{k}={v}" for k, v in rejected_summary.items() if v > 0)
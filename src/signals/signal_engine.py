@@ -6,7 +6,6 @@ from src.contracts.trade_intent import TradeIntent
 from src.signals.market_scanner import scan_us_most_active_stocks
 from src.signals.score_candidates import score_scan_results
 
-
 def get_trade_intents_from_scan(
     ib: IB,
     limit: int = 20,
@@ -9,11 +9,21 @@ All IB requests use aggressive caching to stay within pacing limits.
 import math
 import time
 import os
+import tempfile
 from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
 from typing import Dict, Optional, Tuple, List
 
 import pandas as pd
-from ib_insync import IB, Stock, util
+from ib_insync import IB
+
+from src.signals._ib_bars import (
+    atr14 as _atr14_from_daily,
+    fetch_daily_30d as _fetch_daily_30d,
+    fetch_intraday_5m as _fetch_intraday_5m,
+)
+from src.utils.market_hours import CLOSE_MIN, ET
 
 from src.quant.hyper_swing_filters import (
     calc_vwap,
@@ -33,12 +43,20 @@ from src.patterns.playbook_miner import (
 
 
 # ── cache store ──────────────────────────────────────────────────────────────
-_cache: Dict[str, Tuple[float, object]] = {}   # key → (ts, value)
+_cache: Dict[str, Tuple[float, object]] = {}   # key → (ts | bar epoch, value)
 
 # Cache TTLs (seconds)
-_TTL_5M = 60       # 5-min bars: refresh every 60s
 _TTL_DAILY = 600   # daily bars:  10 min
-_TTL_SPY = 60      # SPY 5-min
+
+# 5-min series (incl. SPY) are keyed to the 5-minute bar they were fetched
+# in rather than a wall-clock TTL: every symbol scored within one bar shares
+# the same snapshot, and the refetch happens once, right after the bar closes.
+_BAR_5M_SEC = 300
+
+
+def _bar_epoch(sec: int = _BAR_5M_SEC) -> int:
+    """Index of the current *sec*-aligned bar; changes exactly at bar close."""
+    return int(time.time() // sec)
 
 
 def _get_cached(key: str, ttl: float):
@@ -56,34 +74,80 @@ def _put_cache(key: str, val):
     _cache[key] = (time.time(), val)
 
 
-# ── IB data helpers ──────────────────────────────────────────────────────────
+# ── on-disk daily bar cache ──────────────────────────────────────────────────
+# Daily bars survive restarts as data/cache/daily/{SYM}_{YYYY-MM-DD}.parquet.
+# A file written after the close (or on a weekend) holds final bars and is
+# good for the rest of the day; one written before the close (suffix "_rth")
+# either lacks today's bar or has a live one, so it is only trusted for
+# _TTL_DAILY, same as the in-memory copy.
+_DAILY_DISK_DIR = Path(os.environ.get("TL_DAILY_BAR_CACHE", "data/cache/daily"))
+
+try:
+    import pyarrow  # noqa: F401  (pd.read_parquet / to_parquet engine)
+    _PARQUET_OK = True
+except ImportError:  # pragma: no cover - optional dependency
+    _PARQUET_OK = False
+
+
+def _daily_disk_paths(symbol: str) -> Tuple[Path, Path]:
+    stem = f"{symbol}_{datetime.now(ET).strftime('%Y-%m-%d')}"
+    return _DAILY_DISK_DIR / f"{stem}.parquet", _DAILY_DISK_DIR / f"{stem}_rth.parquet"
+
+
+def _session_closed() -> bool:
+    """True once today's daily bar can no longer change."""
+    now = datetime.now(ET)
+    return now.weekday() >= 5 or now.hour * 60 + now.minute >= CLOSE_MIN
+
+
+def _load_daily_disk(symbol: str) -> Optional[pd.DataFrame]:
+    if not _PARQUET_OK:
+        return None
+    final, rth = _daily_disk_paths(symbol)
+    try:
+        if final.exists():
+            return pd.read_parquet(final)
+        if rth.exists() and time.time() - rth.stat().st_mtime <= _TTL_DAILY:
+            return pd.read_parquet(rth)
+    except Exception:
+        pass
+    return None
+
+
+def _save_daily_disk(symbol: str, df: pd.DataFrame) -> None:
+    if not _PARQUET_OK:
+        return
+    final, rth = _daily_disk_paths(symbol)
+    path = final if _session_closed() else rth
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        os.close(fd)
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+    except Exception:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
-def _contract(symbol: str) -> Stock:
-    return Stock(symbol, "SMART", "USD")
 
+# ── IB data helpers ──────────────────────────────────────────────────────────
 
 def fetch_intraday_5m(ib: IB, symbol: str) -> Optional[pd.DataFrame]:
-    """Fetch 1-day of 5-minute bars.  Cached for 60 s."""
+    """Fetch 1-day of 5-minute bars.  Cached until the current 5-min bar closes."""
     key = f"5m:{symbol}"
-    cached = _get_cached(key, _TTL_5M)
-    if cached is not None:
-        return cached
+    epoch = _bar_epoch()
+    entry = _cache.get(key)
+    if entry is not None and entry[0] == epoch:
+        return entry[1]
 
     try:
-        c = _contract(symbol)
-        ib.qualifyContracts(c)
-        bars = ib.reqHistoricalData(
-            c,
-            endDateTime="",
-            durationStr="1 D",
-            barSizeSetting="5 mins",
-            whatToShow="TRADES",
-            useRTH=False,
-            formatDate=1,
-        )
-        df = util.df(bars)
+        df = _fetch_intraday_5m(ib, symbol)
         if df is not None and not df.empty:
-            _put_cache(key, df)
+            _cache[key] = (epoch, df)
             return df
     except Exception:
         pass
@@ -91,56 +155,33 @@ def fetch_intraday_5m(ib: IB, symbol: str) -> Optional[pd.DataFrame]:
 
 
 def fetch_spy_5m(ib: IB) -> Optional[pd.DataFrame]:
-    """Fetch SPY 5-min bars.  Cached for 60 s."""
+    """Fetch SPY 5-min bars.  Cached until the current 5-min bar closes."""
     return fetch_intraday_5m(ib, "SPY")
 
 
 def fetch_daily_30d(ib: IB, symbol: str) -> Optional[pd.DataFrame]:
-    """Fetch 30 calendar days of daily bars.  Cached 10 min."""
+    """Fetch 30 calendar days of daily bars.  Cached 10 min in memory, per day on disk."""
     key = f"daily:{symbol}"
     cached = _get_cached(key, _TTL_DAILY)
     if cached is not None:
         return cached
 
+    df = _load_daily_disk(symbol)
+    if df is not None and not df.empty:
+        _put_cache(key, df)
+        return df
+
     try:
-        c = _contract(symbol)
-        ib.qualifyContracts(c)
-        bars = ib.reqHistoricalData(
-            c,
-            endDateTime="",
-            durationStr="30 D",
-            barSizeSetting="1 day",
-            whatToShow="TRADES",
-            useRTH=True,
-            formatDate=1,
-        )
-        df = util.df(bars)
+        df = _fetch_daily_30d(ib, symbol)
         if df is not None and not df.empty:
             _put_cache(key, df)
+            _save_daily_disk(symbol, df)
             return df
     except Exception:
         pass
     return None
 
 
-# ── ATR helper ─────────────────────────────────────────────────────────────
-
-def _atr14_from_daily(df: pd.DataFrame) -> float:
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
-    prev = close.shift(1)
-    tr = pd.concat([
-        high - low,
-        (high - prev).abs(),
-        (low - prev).abs(),
-    ], axis=1).max(axis=1)
-    atr = tr.rolling(14).mean().dropna()
-    if atr.empty:
-        return 0.0
-    return float(atr.iloc[-1])
-
-
 def _adv20_dollars(df_daily: pd.DataFrame) -> float:
     """Average daily dollar volume over most recent 20 trading days."""
     if df_daily is None or df_daily.empty:
@@ -192,10 +233,34 @@ def compute_candidate_metrics(
 
     If *spy_mom_30m* is provided it will be reused; otherwise SPY bars are fetched.
     """
+    df_d = fetch_daily_30d(ib, symbol)
+    if df_d is None or df_d.empty or len(df_d) < 15:
+        return CandidateMetrics(symbol=symbol, ok=False, error="insufficient daily data")
+
+    df_5 = fetch_intraday_5m(ib, symbol)
+
+    if spy_mom_30m is None:
+        spy_df = fetch_spy_5m(ib)
+        spy_mom_30m = calc_momentum(spy_df, 30) if spy_df is not None else 0.0
+
+    return metrics_from_bars(symbol, df_d, df_5, spy_mom_30m)
+
+
+def metrics_from_bars(
+    symbol: str,
+    df_d: Optional[pd.DataFrame],
+    df_5: Optional[pd.DataFrame],
+    spy_mom_30m: float,
+) -> CandidateMetrics:
+    """
+    Pure-compute half of :func:`compute_candidate_metrics` (no IB access).
+
+    Takes already-fetched daily / 5-min bars, so callers holding bars
+    (or running off the IB thread) can score without touching IB.
+    """
     m = CandidateMetrics(symbol=symbol)
 
     # ---------- daily bars → ATR, ADV ----------
-    df_d = fetch_daily_30d(ib, symbol)
     if df_d is None or df_d.empty or len(df_d) < 15:
         m.ok = False
         m.error = "insufficient daily data"
@@ -236,7 +301,6 @@ def compute_candidate_metrics(
         m.playbook_score = 50.0
 
     # ---------- intraday 5-min → momentum, volume, VWAP, trend ----------
-    df_5 = fetch_intraday_5m(ib, symbol)
     if df_5 is not None and not df_5.empty:
         m.momentum_30m = calc_momentum(df_5, minutes=30)
         m.volume_accel = calc_volume_accel(df_5, window=3, baseline=8)
@@ -250,10 +314,6 @@ def compute_candidate_metrics(
         m.trend_structure_score = 0.0
 
     # ---------- relative strength vs SPY ----------
-    if spy_mom_30m is None:
-        spy_df = fetch_spy_5m(ib)
-        spy_mom_30m = calc_momentum(spy_df, 30) if spy_df is not None else 0.0
-
     m.rel_strength_vs_spy = calc_relative_strength(m.momentum_30m, spy_mom_30m)
 
     # ---------- composite quant score ----------
@@ -1,6 +1,13 @@
+import asyncio
+
 from config.identity import SYSTEM_NAME, HUMAN_NAME
 from src.data.ib_market_data import connect_ib
-from src.signals.market_scanner import scan_us_most_active, get_quote, passes_quality_filters
+from src.signals.market_scanner import (
+    scan_us_most_active,
+    get_quote_async,
+    prefilter_symbol,
+    postfilter_quote,
+)
 
 
 def main():
@@ -10,18 +17,30 @@ def main():
     raw = scan_us_most_active(ib, limit=50)
 
     kept = []
-    rejected = 0
-
-    for s in raw:
-        bid, ask, last = get_quote(ib, s.symbol)
-        ok = passes_quality_filters(
-            symbol=s.symbol,
+    # Ticker-only rejects (blocklist, leveraged ETFs) never get quoted.
+    scanned = len(raw)
+    raw = [s for s in raw if prefilter_symbol(s.symbol, block_leveraged_etfs=True)]
+    rejected = scanned - len(raw)
+
+    # Quote every symbol concurrently (one snapshot RTT total, not one per
+    # symbol), then filter in rank order so "first 15 kept" is unchanged.
+    raw = sorted(raw, key=lambda s: s.rank)
+    quotes = ib.run(asyncio.gather(
+        *(get_quote_async(ib, s.symbol) for s in raw),
+        return_exceptions=True,
+    ))
+
+    for s, q in zip(raw, quotes):
+        if isinstance(q, BaseException):
+            rejected += 1
+            continue
+        bid, ask, last = q
+        ok = postfilter_quote(
             bid=bid,
             ask=ask,
             last=last,
             min_price=5.0,
             max_spread_pct=0.0015,   # 0.15%
-            block_leveraged_etfs=True
         )
         if ok:
             kept.append((s.rank, s.symbol, bid, ask, last))
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 from config.identity import SYSTEM_NAME, HUMAN_NAME
@@ -7,8 +8,8 @@ from src.execution.pipeline import execute_trade_intent_paper
 from src.data.ib_market_data import (
     connect_ib,
     get_spy_contract,
-    get_history_bars,
-    get_recent_price_from_history,
+    get_history_bars_async,
+    get_last_price_async,
     get_account_equity_usd,
 )
 from src.indicators.atr import compute_atr
@@ -39,8 +40,11 @@ def main():
     ib = connect_ib()
     contract = get_spy_contract()
 
-    entry_price = get_recent_price_from_history(ib, contract)
-    bars_df = get_history_bars(ib, contract, duration="30 D", bar_size="1 day")
+    # Price snapshot and daily history are independent: request both at once.
+    entry_price, bars_df = ib.run(asyncio.gather(
+        get_last_price_async(ib, contract),
+        get_history_bars_async(ib, contract, duration="30 D", bar_size="1 day"),
+    ))
     atr = compute_atr(bars_df, period=14)
     equity = get_account_equity_usd(ib)
     open_risk = estimate_open_risk_usd(ib, atr=atr, atr_multiplier=2.0)
@@ -18,23 +18,39 @@ from utils.logging import setup_logging
 logger = setup_logging(__name__)
 
 
+def check_connection(ib: IB | None = None):
+    """
+    Return ``(connected, managed_accounts)``.
+
+    Pass an existing *ib* to reuse its session (health checks in a loop pay
+    no handshake); it is connected only if needed and left open.  Without
+    one, a temporary connection is made and closed again.
+    """
+    owned = ib is None
+    ib = ib or IB()
+    try:
+        if not ib.isConnected():
+            logger.info(f"Connecting to IB at {IB_HOST}:{IB_PORT} clientId={IB_CLIENT_ID}")
+            ib.connect(IB_HOST, IB_PORT, clientId=IB_CLIENT_ID, timeout=5)
+        return ib.isConnected(), ib.managedAccounts()
+    finally:
+        if owned:
+            try:
+                if ib.isConnected():
+                    ib.disconnect()
+            except Exception:
+                pass
+
+
 def main():
-    ib = IB()
     try:
-        logger.info(f"Connecting to IB at {IB_HOST}:{IB_PORT} clientId={IB_CLIENT_ID}")
-        ib.connect(IB_HOST, IB_PORT, clientId=IB_CLIENT_ID, timeout=5)
-        print("Connected:", ib.isConnected())
-        print("Accounts:", ib.managedAccounts())
+        connected, accounts = check_connection()
+        print("Connected:", connected)
+        print("Accounts:", accounts)
     except Exception as exc:
         logger.exception("Connection failed")
         print("Connection failed:", exc)
         sys.exit(1)
-    finally:
-        try:
-            if ib.isConnected():
-                ib.disconnect()
-        except Exception:
-            pass
 
 
 if __name__ == "__main__":
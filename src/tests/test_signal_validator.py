@@ -6,6 +6,7 @@ Pulls metrics for SPY, NVDA, and a sample small-cap.  Prints all computed
 metrics + pass/fail reasons.  No order placement.
 """
 
+import asyncio
 import sys
 import os
 import math
@@ -20,8 +21,9 @@ from config.risk_limits import (
     MIN_ADV20_DOLLARS, MIN_ATR_PCT, MIN_VOLUME_ACCEL, MIN_RS_VS_SPY,
     PRICE_MIN, PRICE_MAX, PRICE_MAX_ALLOWLIST, MIN_UNIFIED_SCORE,
 )
+from src.signals._ib_bars import fetch_bars_async
 from src.signals.signal_validator import (
-    compute_candidate_metrics,
+    metrics_from_bars,
     passes_hyper_swing_filters,
     fetch_spy_5m,
 )
@@ -138,9 +140,21 @@ def main():
         ("SOFI (mid-cap swing)", "SOFI"),
     ]
 
+    # Request every symbol's daily + 5-min history up front so the IB
+    # round-trips overlap, then compute metrics from the fetched frames.
+    syms = [sym for _, sym in test_symbols]
+    fetched = ib.run(asyncio.gather(
+        *(fetch_bars_async(ib, s, "30 D", "1 day") for s in syms),
+        *(fetch_bars_async(ib, s, "1 D", "5 mins", use_rth=False) for s in syms),
+        return_exceptions=True,
+    ))
+    fetched = [None if isinstance(f, BaseException) else f for f in fetched]
+    daily = dict(zip(syms, fetched[:len(syms)]))
+    intraday = dict(zip(syms, fetched[len(syms):]))
+
     for label, sym in test_symbols:
         try:
-            m = compute_candidate_metrics(ib, sym, spy_mom_30m=spy_mom)
+            m = metrics_from_bars(sym, daily[sym], intraday[sym], spy_mom)
             components = quant_score_components({
                 "momentum_30m": m.momentum_30m,
                 "volume_accel": m.volume_accel,
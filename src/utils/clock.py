@@ -0,0 +1,41 @@
+"""
+Cheap wall-clock timestamps for hot logging paths.
+
+``datetime.now(timezone.utc).isoformat()`` allocates a datetime and runs the
+formatter on every call.  Here the ISO prefix is rebuilt only when the
+integer second changes; milliseconds are appended from ``time.time()``.
+"""
+
+import time
+from datetime import datetime, timezone
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") — one tuple so readers on other
+# threads never see a second paired with another second's string.
+_sec_cache = (0, "")
+
+
+def utc_iso_now() -> str:
+    """Current UTC time as ``YYYY-MM-DDTHH:MM:SS.mmm+00:00``."""
+    global _sec_cache
+    t = time.time()
+    s = int(t)
+    sec, prefix = _sec_cache
+    if s != sec:
+        prefix = datetime.fromtimestamp(s, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _sec_cache = (s, prefix)
+    return f"{prefix}.{int((t - s) * 1000):03d}+00:00"
+
+
+# ("YYYY-MM-DD", epoch second of the next UTC midnight)
+_day_cache = ("", 0.0)
+
+
+def utc_today() -> str:
+    """Current UTC date as ``YYYY-MM-DD``, reformatted only after midnight."""
+    global _day_cache
+    t = time.time()
+    day, rollover = _day_cache
+    if t >= rollover:
+        day = datetime.fromtimestamp(t, tz=timezone.utc).strftime("%Y-%m-%d")
+        _day_cache = (day, (t // 86400 + 1) * 86400)
+    return day
@@ -0,0 +1,18 @@
+"""
+Optional numba JIT.
+
+``njit`` is numba's decorator when numba is installed and a pass-through
+otherwise, so kernels written against it run compiled where possible and
+as plain Python everywhere else.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit``: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+__all__ = ["njit"]
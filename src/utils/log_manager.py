@@ -1,8 +1,20 @@
 import json
 import os
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.utils.clock import utc_iso_now
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:  # pragma: no cover - orjson is optional
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
 
 
 # Module-level singleton so get_logger() works from anywhere after setup
@@ -20,15 +32,20 @@ def setup_logging(name: str = "trade_labs", log_dir: str = "logs") -> str:
     os.makedirs(final_dir, exist_ok=True)
 
     global _logger_instance
+    if _logger_instance is not None:
+        _logger_instance.close()
     _logger_instance = PipelineLogger(name=name, log_dir=log_dir)
     return final_dir
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineLogger:
     """
     Minimal logger used by orchestrator / pipeline.
     Stores events in memory and writes jsonl to disk.
+
+    Usable as a context manager; the file is also flushed at every run
+    stage and closed by pipeline_completed() (the next event reopens it).
     """
 
     name: str = "pipeline"
@@ -37,6 +54,10 @@ class PipelineLogger:
         default_factory=lambda: datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     )
     events: List[Dict[str, Any]] = field(default_factory=list)
+    # Derived in __post_init__; declared so the slotted class has room for them.
+    base_dir: str = field(init=False)
+    filepath: str = field(init=False)
+    _fh: Any = field(init=False, repr=False)
 
     def __post_init__(self):
         self.base_dir = os.path.join(self.log_dir, self.name)
@@ -44,6 +65,31 @@ class PipelineLogger:
         self.filepath = os.path.join(
             self.base_dir, f"events_{self.run_id}.jsonl"
         )
+        # Opened on the first event: one block-buffered handle per run
+        # instead of open/write/close per event.
+        self._fh = None
+
+    def __enter__(self) -> "PipelineLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        """Push buffered events to disk and the console."""
+        if self._fh is not None:
+            self._fh.flush()
+        try:
+            sys.stdout.flush()
+        except (ValueError, OSError):  # stdout already closed at shutdown
+            pass
+
+    def close(self) -> None:
+        """Flush and close the jsonl file (safe to call more than once)."""
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            fh.close()
+        self.flush()
 
     # ---- class-level accessor ----
     @staticmethod
@@ -68,19 +114,27 @@ class PipelineLogger:
         level: str = "INFO",
     ):
         rec = {
-            "ts": datetime.utcnow().isoformat(),
+            "ts": utc_iso_now(),
             "level": level,
             "event": event,
             "payload": payload or {},
         }
         self.events.append(rec)
-        print(f"[{rec['level']}] {rec['event']}")
-        with open(self.filepath, "a", encoding="utf-8") as f:
-            f.write(json.dumps(rec) + "\n")
+        # Straight to the stream rather than print(): one preformatted write,
+        # no sep/end handling.  sys.stdout is looked up per call so redirects
+        # and test capture still apply; on a pipe it is block-buffered, so
+        # console lines are batched and pushed out per run stage / on errors.
+        sys.stdout.write(f"[{level}] {event}\n")
+        if self._fh is None:
+            self._fh = open(self.filepath, "a", encoding="utf-8", buffering=1 << 16)
+        self._fh.write(_dumps(rec) + "\n")
+        if level in ("ERROR", "CRITICAL"):
+            self.flush()
 
     # ---- pipeline lifecycle helpers ----
     def scan_started(self, run_id: str):
         self.log("scan_started", {"run_id": run_id})
+        self.flush()
 
     def execution_completed(self, run_id: str, symbol: str, shares: int,
                             entry_price: float, stop_loss: float,
@@ -91,11 +145,13 @@ class PipelineLogger:
             "entry_price": entry_price, "stop_loss": stop_loss,
             "order_id": order_id, "ok": ok, "reason": reason,
         })
+        self.flush()
 
     def pipeline_completed(self, run_id: str, executed: int, successful: int):
         self.log("pipeline_completed", {
             "run_id": run_id, "executed": executed, "successful": successful,
         })
+        self.close()
 
     def summary(self) -> Dict[str, Any]:
         return {
@@ -103,3 +159,7 @@ class PipelineLogger:
             "event_count": len(self.events),
             "log_file": self.filepath,
         }
+
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Iterate recorded events without copying the list (summary() omits them)."""
+        yield from self.events
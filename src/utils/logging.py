@@ -1,13 +1,57 @@
 """Minimal logging setup for the project."""
 import logging
+import os
+from logging.handlers import RotatingFileHandler
+from typing import List, Optional
 
+_FMT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+# Built once per process and attached to every setup_logging() logger, so
+# callers share one console handler and at most one open log file.
+_handlers: List[logging.Handler] = []
+# Logger levels an operator can override from the environment, e.g.
+# TL_SCORE_LOG_LEVEL=DEBUG for the per-symbol scoring detail.
+_ENV_LEVELS = {"src.signals.score_candidates": "TL_SCORE_LOG_LEVEL"}
 
-def setup_logging(name: str = __name__) -> logging.Logger:
+
+def _shared_handlers(log_file: Optional[str]) -> List[logging.Handler]:
+    if not _handlers:
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter(_FMT))
+        _handlers.append(console)
+    if log_file and not any(isinstance(h, RotatingFileHandler) for h in _handlers):
+        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+        fh = RotatingFileHandler(log_file, maxBytes=10_000_000, backupCount=5, encoding="utf-8")
+        fh.setFormatter(logging.Formatter(_FMT))
+        _handlers.append(fh)
+    return _handlers
+
+
+def apply_env_levels() -> None:
+    """Apply the _ENV_LEVELS overrides that are set; invalid values are ignored."""
+    for name, var in _ENV_LEVELS.items():
+        value = os.getenv(var)
+        if not value:
+            continue
+        try:
+            logging.getLogger(name).setLevel(value.upper())
+        except ValueError:
+            logging.getLogger(__name__).warning("Ignoring %s=%r: not a log level", var, value)
+
+
+def setup_logging(name: str = __name__, log_file: Optional[str] = None) -> logging.Logger:
+    """
+    Return logger *name* wired to the shared handlers.
+
+    The console handler is always attached.  A size-rotated file handler
+    (10 MB x 5) is added only when *log_file* or ``TL_LOG_FILE`` names one;
+    the first path requested is the one used for the whole process.
+    Environment level overrides (see apply_env_levels) are applied too.
+    """
     logger = logging.getLogger(name)
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        fmt = "%(asctime)s %(levelname)s %(name)s: %(message)s"
-        handler.setFormatter(logging.Formatter(fmt))
-        logger.addHandler(handler)
+    for handler in _shared_handlers(log_file or os.getenv("TL_LOG_FILE")):
+        if handler not in logger.handlers:
+            logger.addHandler(handler)
+    if logger.level == logging.NOTSET:
         logger.setLevel(logging.INFO)
+    apply_env_levels()
     return logger
@@ -1,11 +1,29 @@
 """
 Market hours utility: check if US equity market is open now.
 """
+import time
 from datetime import datetime
-import pytz
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
 # US Eastern timezone (market timezone)
-ET = pytz.timezone("US/Eastern")
+ET = ZoneInfo("US/Eastern")
+
+# Market hours: 9:30 AM to 4:00 PM ET, as minutes since midnight
+OPEN_MIN = 9 * 60 + 30
+CLOSE_MIN = 16 * 60
+
+
+@lru_cache(maxsize=1)
+def _is_open_at_minute(epoch_minute: int) -> bool:
+    now = datetime.fromtimestamp(epoch_minute * 60, ET)
+
+    # Market is closed on weekends (5=Sat, 6=Sun)
+    if now.weekday() >= 5:
+        return False
+
+    m = now.hour * 60 + now.minute
+    return OPEN_MIN <= m < CLOSE_MIN
 
 
 def is_market_open() -> bool:
@@ -14,15 +32,8 @@ def is_market_open() -> bool:
     - Monday-Friday only
     - 9:30 AM - 4:00 PM ET
     Returns True if market is open, False otherwise.
+
+    The answer only changes on minute boundaries, so it is computed once per
+    wall-clock minute and served from cache for the rest of that minute.
     """
-    now = datetime.now(ET)
-    
-    # Market is closed on weekends (5=Sat, 6=Sun)
-    if now.weekday() >= 5:
-        return False
-    
-    # Market hours: 9:30 AM to 4:00 PM ET
-    market_open_time = now.replace(hour=9, minute=30, second=0, microsecond=0)
-    market_close_time = now.replace(hour=16, minute=0, second=0, microsecond=0)
-    
-    return market_open_time <= now < market_close_time
+    return _is_open_at_minute(int(time.time() // 60))
@@ -0,0 +1,21 @@
+"""
+Directory helpers for repeatedly-invoked writers.
+
+``Path.mkdir(parents=True, exist_ok=True)`` still stats (and may walk) the
+path on every call; scheduled report / reconciliation jobs write into the
+same few directories all day, so remember which ones this process made.
+"""
+
+from pathlib import Path
+from typing import Set, Union
+
+_created_dirs: Set[Path] = set()
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """Create *path* (and parents) once per process; return it as a Path."""
+    p = Path(path)
+    if p not in _created_dirs:
+        p.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(p)
+    return p
@@ -11,35 +11,99 @@ Reconciles open positions from trade history against actual positions in IB:
 Ensures our records match reality.
 """
 
+import json
+import math
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 from ib_insync import IB
 
 from src.data.ib_market_data import connect_ib
-from src.utils.trade_history_db import TradeHistoryDB
+from src.data.market_data_cache import MarketDataCache
+from src.utils.paths import ensure_dir
+from src.utils.trade_history_db import TradeHistoryDB, get_shared_db
+
+try:
+    import orjson
+
+    def _dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str)
+except ImportError:  # pragma: no cover - orjson is optional
+    def _dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode()
+
+# Row template for the matched-positions table, parsed once at import.
+_MATCH_ROW = (
+    "{symbol:<8} {quantity:<8} ${entry_avg:<11.2f} ${current_price:<11.2f} "
+    "${unrealized_pnl:<11.2f} {unrealized_pnl_percent:<7.2f}%"
+).format
 
 
 class PositionReconciler:
     """Reconcile trade records against actual positions."""
     
-    def __init__(self, db: Optional[TradeHistoryDB] = None):
-        self.db = db or TradeHistoryDB("data/trade_history")
+    def __init__(self, db: Optional[TradeHistoryDB] = None, cache: Optional[MarketDataCache] = None):
+        self.db = db or get_shared_db()
+        # Optional shared quote cache; positions priced within its ticker
+        # TTL skip the reqTickers round-trip.
+        self.cache = cache
     
-    def get_open_positions_ib(self, ib: IB) -> Dict[str, Dict[str, Any]]:
-        """Fetch all open positions from IB."""
+    def get_open_positions_ib(
+        self, ib: IB, market_data_type: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch all open positions from IB.
+
+        Prices come from one reqTickers batch: snapshot requests that IB
+        answers once and cancels itself, so no market-data lines are left
+        subscribed.  *market_data_type* (1 live, 3 delayed, ...) is sent via
+        reqMarketDataType first when given; by default the connection's
+        current setting is left alone.  Symbols with a fresh price in the
+        shared cache are left out of the batch.
+        """
         positions = {}
         
         try:
-            for position in ib.positions():
+            ib_positions = list(ib.positions())
+            if not ib_positions:
+                return positions
+            
+            # One batched snapshot for every position instead of a
+            # ticker()+sleep() round-trip per symbol.  Position contracts
+            # carry a conId but often no routing exchange, which reqTickers
+            # needs, so route via SMART and qualify them all in one call.
+            cache = self.cache
+            cached = {}
+            if cache is not None:
+                for p in ib_positions:
+                    px = cache.get(p.contract.symbol, "ticker")
+                    if px is not None:
+                        cached[p.contract.symbol] = px
+            contracts = [p.contract for p in ib_positions if p.contract.symbol not in cached]
+            by_con_id = {}
+            if contracts:
+                if market_data_type is not None:
+                    ib.reqMarketDataType(market_data_type)
+                for c in contracts:
+                    if not c.exchange:
+                        c.exchange = "SMART"
+                ib.qualifyContracts(*contracts)
+                tickers = ib.reqTickers(*contracts)
+                by_con_id = {t.contract.conId: t for t in tickers}
+            
+            for position in ib_positions:
                 symbol = position.contract.symbol
                 qty = position.position
                 
-                # Get current market price
-                ticker = ib.ticker(position.contract)
-                ib.sleep(0.01)  # Small delay to let ticker populate
-                
-                current_price = ticker.last if ticker.last > 0 else ticker.midpoint()
+                current_price = cached.get(symbol)
+                if current_price is None:
+                    ticker = by_con_id.get(position.contract.conId)
+                    if ticker is None:
+                        current_price = 0.0
+                    else:
+                        current_price = ticker.last if ticker.last > 0 else ticker.midpoint()
+                        if cache is not None and math.isfinite(current_price) and current_price > 0:
+                            cache.put(symbol, "ticker", current_price)
                 
                 positions[symbol] = {
                     "symbol": symbol,
@@ -64,34 +128,29 @@ class PositionReconciler:
         for trade in trades:
             symbol = trade["symbol"]
             
-            if symbol not in positions:
-                positions[symbol] = {
+            pos = positions.get(symbol)
+            if pos is None:
+                # Scalars only: reconcile() never needs the individual trades,
+                # so don't keep every open trade dict alive per symbol.
+                pos = positions[symbol] = {
                     "symbol": symbol,
                     "quantity": 0,
                     "cost_basis": 0.0,
                     "entry_price": 0.0,
                     "stop_loss": 0.0,
-                    "trades": [],
                     "source": "TradeHistory",
                 }
             
-            # Add to aggregate position
+            # Add to aggregate position (signed, so shorts net correctly)
             qty = trade.get("quantity", 0)
-            price = trade.get("entry_price", 0)
-            
-            positions[symbol]["quantity"] += qty if trade["side"] == "BUY" else -qty
-            positions[symbol]["cost_basis"] += qty * price
-            positions[symbol]["trades"].append(trade)
+            signed_qty = qty if trade["side"] == "BUY" else -qty
+            pos["quantity"] += signed_qty
+            pos["cost_basis"] += signed_qty * trade.get("entry_price", 0)
             
             # Track stop loss (most conservative)
-            if trade.get("stop_loss", 0) > 0:
-                if positions[symbol]["stop_loss"] == 0:
-                    positions[symbol]["stop_loss"] = trade["stop_loss"]
-                else:
-                    positions[symbol]["stop_loss"] = min(
-                        positions[symbol]["stop_loss"],
-                        trade["stop_loss"]
-                    )
+            trade_sl = trade.get("stop_loss", 0)
+            if trade_sl > 0:
+                pos["stop_loss"] = trade_sl if pos["stop_loss"] == 0 else min(pos["stop_loss"], trade_sl)
         
         return positions
     
@@ -100,8 +159,9 @@ class PositionReconciler:
         ib_positions = self.get_open_positions_ib(ib)
         history_positions = self.get_open_positions_trade_history()
         
-        # Gather all symbols
-        all_symbols = set(ib_positions.keys()) | set(history_positions.keys())
+        # Gather all symbols (dict merge keeps insertion order; output lists
+        # are only sorted for display)
+        all_symbols = {**history_positions, **ib_positions}
         
         reconciliation = {
             "timestamp": datetime.utcnow().isoformat(),
@@ -112,7 +172,7 @@ class PositionReconciler:
             "status": "OK",
         }
         
-        for symbol in sorted(all_symbols):
+        for symbol in all_symbols:
             ib_pos = ib_positions.get(symbol)
             hist_pos = history_positions.get(symbol)
             
@@ -189,29 +249,20 @@ class PositionReconciler:
         print(f"Status: {reconciliation['status']}\n")
         
         # Matched positions
-        matches = reconciliation.get("matches", [])
+        matches = sorted(reconciliation.get("matches", []), key=lambda p: p["symbol"])
         if matches:
             print(f"✓ Matched Positions ({len(matches)})\n")
             print(f"{'Symbol':<8} {'Qty':<8} {'Avg Entry':<12} {'Current':<12} {'Unrealized':<12} {'%':<8}")
             print(f"{'-'*70}")
             
-            total_unrealized = 0
-            for pos in matches:
-                print(
-                    f"{pos['symbol']:<8} "
-                    f"{pos['quantity']:<8} "
-                    f"${pos['entry_avg']:<11.2f} "
-                    f"${pos['current_price']:<11.2f} "
-                    f"${pos['unrealized_pnl']:<11.2f} "
-                    f"{pos['unrealized_pnl_percent']:<7.2f}%"
-                )
-                total_unrealized += pos['unrealized_pnl']
+            print("\n".join(_MATCH_ROW(**pos) for pos in matches))
+            total_unrealized = sum(pos['unrealized_pnl'] for pos in matches)
             
             print(f"{'-'*70}")
             print(f"{'TOTAL':<8} {'':<8} {'':<12} {'':<12} ${total_unrealized:<11.2f}\n")
         
         # Quantity mismatches
-        mismatches = reconciliation.get("quantity_mismatch", [])
+        mismatches = sorted(reconciliation.get("quantity_mismatch", []), key=lambda p: p["symbol"])
         if mismatches:
             print(f"⚠ Quantity Mismatches ({len(mismatches)})\n")
             for pos in mismatches:
@@ -219,7 +270,7 @@ class PositionReconciler:
             print()
         
         # IB only
-        ib_only = reconciliation.get("ib_only", [])
+        ib_only = sorted(reconciliation.get("ib_only", []), key=lambda p: p["symbol"])
         if ib_only:
             print(f"? IB Only ({len(ib_only)}) - Not in trade history\n")
             for pos in ib_only:
@@ -227,7 +278,7 @@ class PositionReconciler:
             print()
         
         # History only
-        hist_only = reconciliation.get("history_only", [])
+        hist_only = sorted(reconciliation.get("history_only", []), key=lambda p: p["symbol"])
         if hist_only:
             print(f"? History Only ({len(hist_only)}) - Expected open but not in IB\n")
             for pos in hist_only:
@@ -238,15 +289,10 @@ class PositionReconciler:
     
     def export_reconciliation_json(self, reconciliation: Dict[str, Any], filename: str = "position_reconciliation.json"):
         """Save reconciliation as JSON for analysis."""
-        import json
-        from pathlib import Path
-        
-        reports_dir = Path("data/reports")
-        reports_dir.mkdir(parents=True, exist_ok=True)
+        reports_dir = ensure_dir("data/reports")
         
         filepath = reports_dir / filename
         
-        with open(filepath, "w") as f:
-            json.dump(reconciliation, f, indent=2, default=str)
+        filepath.write_bytes(_dumps_pretty(reconciliation))
         
         print(f"✓ Reconciliation saved to {filepath}")
@@ -0,0 +1,98 @@
+"""
+Per-host HTTP throttling for the news / catalyst / earnings fetchers.
+
+The fetchers now issue requests from thread pools, which would otherwise
+run straight into Finnhub's 60 calls/min free tier and Google News' soft
+caps.  Each host gets one shared limiter: a semaphore bounding in-flight
+requests plus a token bucket bounding the request rate.  get_with_backoff()
+adds retry on HTTP 429, honouring ``Retry-After``.
+"""
+
+import threading
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+# host -> (requests per window, window seconds, max in flight)
+HOST_LIMITS: Dict[str, Tuple[int, float, int]] = {
+    "finnhub.io": (60, 60.0, 4),
+    "news.google.com": (120, 60.0, 10),
+}
+
+
+class RateLimiter:
+    """Thread-safe token bucket plus concurrency cap; use as ``with limiter:``."""
+
+    def __init__(self, rate: int, per: float, max_concurrent: int):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self._sem = threading.BoundedSemaphore(max_concurrent)
+
+    def acquire_token(self) -> None:
+        """Block until the bucket has a token, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate / self.per)
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) * self.per / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self._sem.acquire()
+        try:
+            self.acquire_token()
+        except BaseException:
+            self._sem.release()
+            raise
+        return self
+
+    def __exit__(self, *exc):
+        self._sem.release()
+        return False
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(url_or_host: str) -> RateLimiter:
+    """Shared limiter for the host of *url_or_host* (unknown hosts: 4 in flight, 120/min)."""
+    host = urlsplit(url_or_host).hostname if "//" in url_or_host else url_or_host
+    host = host or ""
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = RateLimiter(*HOST_LIMITS.get(host, (120, 60.0, 4)))
+        return limiter
+
+
+def _retry_after_s(resp, attempt: int) -> float:
+    value = resp.headers.get("Retry-After") if resp.headers else None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return float(2 ** attempt)
+
+
+def get_with_backoff(http, url: str, retries: int = 3, **kwargs):
+    """
+    ``http.get(url, **kwargs)`` under the host's limiter, retrying HTTP 429
+    up to *retries* times (``Retry-After`` seconds, else 1, 2, 4 ... s).
+    Returns the last response.
+    """
+    limiter = limiter_for(url)
+    attempt = 0
+    while True:
+        with limiter:
+            resp = http.get(url, **kwargs)
+        if resp.status_code != 429 or attempt >= retries:
+            return resp
+        time.sleep(_retry_after_s(resp, attempt))
+        attempt += 1
@@ -11,37 +11,94 @@ Parses trade history and generates performance reports:
 Generated reports are saved to CSV and markdown for easy reviewing.
 """
 
+import asyncio
 import json
 import csv
+import os
+import warnings
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from collections import defaultdict
+from functools import lru_cache
 
-from src.utils.trade_history_db import TradeHistoryDB
+import numpy as np
+
+from src.utils.clock import utc_today
+from src.utils.paths import ensure_dir
+from src.utils.trade_history_db import TradeHistoryDB, get_shared_db
+
+# Below this many trades the fused Python loop beats NumPy's setup cost.
+_NUMPY_MIN_TRADES = 256
 
 
 class ReportGenerator:
     """Generate trading performance reports from trade history."""
     
     def __init__(self, db: Optional[TradeHistoryDB] = None, reports_dir: str = "data/reports"):
-        self.db = db or TradeHistoryDB("data/trade_history")
-        self.reports_dir = Path(reports_dir)
-        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.db = db or get_shared_db()
+        self.reports_dir = Path(reports_dir)  # created on first save
+        # Per-instance so the cache dies with the generator (and its db).
+        self._closed_trades_cached = lru_cache(maxsize=8)(self._load_closed_trades)
+    
+    def _load_closed_trades(self, date_from: str, date_to: str, stamp) -> tuple:
+        # *stamp* only keys the cache; see _closed_trades().  Streamed, so a
+        # cold history is never loaded whole just to report one period.
+        # Guarantee a numeric "pnl" so the report loops can index it directly.
+        # Copies: iter_trades may hand out the db's cached records, which
+        # must not be edited here.
+        return tuple(
+            dict(t, pnl=t.get("pnl") or 0.0)
+            for t in self.db.iter_trades(status="CLOSED", date_from=date_from, date_to=date_to)
+        )
+    
+    @staticmethod
+    def _summarize(trades: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Trade count, total PnL, wins, losses and win rate in one pass."""
+        total_pnl = 0.0
+        wins = losses = 0
+        for t in trades:
+            p = t["pnl"]
+            total_pnl += p
+            wins += p > 0
+            losses += p < 0
+        return {
+            "trades": len(trades),
+            "total_pnl": round(total_pnl, 2),
+            "wins": wins,
+            "losses": losses,
+            "win_rate": round((wins / len(trades) * 100) if trades else 0.0, 2),
+        }
+    
+    def _closed_trades(self, date_from: str, date_to: str) -> List[Dict[str, Any]]:
+        """
+        Closed trades with entry in ``[date_from, date_to)``.
+
+        Memoized on the trades file's (mtime, size): regenerating a report
+        over unchanged history is a stat() instead of a re-read + JSON parse.
+        Any write to the file changes the stamp and invalidates the entry.
+        """
+        try:
+            st = os.stat(self.db.trades_file)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            stamp = None
+        return list(self._closed_trades_cached(date_from, date_to, stamp))
     
     def generate_daily_report(self, date: Optional[str] = None) -> Dict[str, Any]:
         """Generate a report for a specific day."""
         if date is None:
-            date = datetime.utcnow().strftime("%Y-%m-%d")
+            date = utc_today()
         
-        summary = self.db.get_daily_summary(date)
-        trades = [t for t in self.db.get_trade_history(status="CLOSED") 
-                  if t["entry_timestamp"].startswith(date)]
+        next_day = (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+        trades = self._closed_trades(date, next_day)
         
         report = {
             "date": date,
             "generated_at": datetime.utcnow().isoformat(),
-            "summary": summary,
+            # Same figures as db.get_daily_summary(date), from the day's
+            # trades already in hand rather than a pass over all history.
+            "summary": {"date": date, **self._summarize(trades)},
             "trades": trades,
             "metrics": self._calculate_metrics(trades),
         }
@@ -58,23 +115,12 @@ class ReportGenerator:
         week_end_date = datetime.strptime(week_start, "%Y-%m-%d") + timedelta(days=7)
         week_end = week_end_date.strftime("%Y-%m-%d")
         
-        trades = [t for t in self.db.get_trade_history(status="CLOSED")
-                  if week_start <= t["entry_timestamp"][:10] < week_end]
-        
-        total_pnl = sum(t.get("pnl", 0.0) for t in trades)
-        wins = sum(1 for t in trades if t.get("pnl", 0) > 0)
-        losses = sum(1 for t in trades if t.get("pnl", 0) < 0)
+        trades = self._closed_trades(week_start, week_end)
         
         report = {
             "period": f"{week_start} to {week_end}",
             "generated_at": datetime.utcnow().isoformat(),
-            "summary": {
-                "trades": len(trades),
-                "total_pnl": round(total_pnl, 2),
-                "wins": wins,
-                "losses": losses,
-                "win_rate": round((wins / len(trades) * 100) if trades else 0, 2),
-            },
+            "summary": self._summarize(trades),
             "trades": trades,
             "metrics": self._calculate_metrics(trades),
         }
@@ -86,23 +132,14 @@ class ReportGenerator:
         if month is None:
             month = datetime.utcnow().strftime("%Y-%m")
         
-        trades = [t for t in self.db.get_trade_history(status="CLOSED")
-                  if t["entry_timestamp"].startswith(month)]
-        
-        total_pnl = sum(t.get("pnl", 0.0) for t in trades)
-        wins = sum(1 for t in trades if t.get("pnl", 0) > 0)
-        losses = sum(1 for t in trades if t.get("pnl", 0) < 0)
+        year, mon = (int(x) for x in month.split("-"))
+        next_month = f"{year + mon // 12:04d}-{mon % 12 + 1:02d}"
+        trades = self._closed_trades(f"{month}-01", f"{next_month}-01")
         
         report = {
             "period": month,
             "generated_at": datetime.utcnow().isoformat(),
-            "summary": {
-                "trades": len(trades),
-                "total_pnl": round(total_pnl, 2),
-                "wins": wins,
-                "losses": losses,
-                "win_rate": round((wins / len(trades) * 100) if trades else 0, 2),
-            },
+            "summary": self._summarize(trades),
             "trades": trades,
             "metrics": self._calculate_metrics(trades),
         }
@@ -121,29 +158,57 @@ class ReportGenerator:
                 "avg_trade_duration": 0,
             }
         
-        winning_trades = [t for t in trades if t.get("pnl", 0) > 0]
-        losing_trades = [t for t in trades if t.get("pnl", 0) < 0]
-        
-        avg_win = sum(t.get("pnl", 0) for t in winning_trades) / len(winning_trades) if winning_trades else 0
-        avg_loss = sum(t.get("pnl", 0) for t in losing_trades) / len(losing_trades) if losing_trades else 0
+        if len(trades) >= _NUMPY_MIN_TRADES:
+            # Large monthly / yearly reports: let NumPy do the numeric work
+            # instead of boxing a float per trade in the interpreter.
+            pnl = np.fromiter(
+                ((t.get("pnl", 0) or 0) for t in trades),
+                dtype=np.float64, count=len(trades),
+            )
+            wins = pnl[pnl > 0]
+            losses = pnl[pnl < 0]
+            win_sum, win_cnt = float(wins.sum()), int(wins.size)
+            loss_sum, loss_cnt = float(losses.sum()), int(losses.size)
+            largest_win = float(wins.max()) if win_cnt else 0
+            largest_loss = float(losses.min()) if loss_cnt else 0
+            dur_sum, dur_cnt = self._duration_hours_sum(trades)
+        else:
+            # One pass accumulating every statistic in local scalars, rather
+            # than separate win/loss lists plus a sum/max/min pass over each.
+            win_sum = loss_sum = 0.0
+            win_cnt = loss_cnt = 0
+            largest_win = largest_loss = 0
+            dur_sum = 0.0
+            dur_cnt = 0
+            for t in trades:
+                pnl = t.get("pnl", 0) or 0
+                if pnl > 0:
+                    win_sum += pnl
+                    win_cnt += 1
+                    if pnl > largest_win:
+                        largest_win = pnl
+                elif pnl < 0:
+                    loss_sum += pnl
+                    loss_cnt += 1
+                    if pnl < largest_loss:
+                        largest_loss = pnl
+                
+                exit_ts = t.get("exit_timestamp")
+                entry_ts = t.get("entry_timestamp")
+                if exit_ts and entry_ts:
+                    entry = datetime.fromisoformat(entry_ts)
+                    exit_time = datetime.fromisoformat(exit_ts)
+                    dur_sum += (exit_time - entry).total_seconds() / 3600  # hours
+                    dur_cnt += 1
         
-        largest_win = max((t.get("pnl", 0) for t in winning_trades), default=0)
-        largest_loss = min((t.get("pnl", 0) for t in losing_trades), default=0)
+        avg_win = win_sum / win_cnt if win_cnt else 0
+        avg_loss = loss_sum / loss_cnt if loss_cnt else 0
         
-        gross_profit = sum(t.get("pnl", 0) for t in winning_trades)
-        gross_loss = abs(sum(t.get("pnl", 0) for t in losing_trades))
+        gross_profit = win_sum
+        gross_loss = abs(loss_sum)
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf')
         
-        # Calculate average trade duration
-        durations = []
-        for t in trades:
-            if t.get("exit_timestamp") and t.get("entry_timestamp"):
-                entry = datetime.fromisoformat(t["entry_timestamp"])
-                exit_time = datetime.fromisoformat(t["exit_timestamp"])
-                duration = (exit_time - entry).total_seconds() / 3600  # hours
-                durations.append(duration)
-        
-        avg_duration = sum(durations) / len(durations) if durations else 0
+        avg_duration = dur_sum / dur_cnt if dur_cnt else 0
         
         return {
             "avg_win": round(avg_win, 2),
@@ -154,13 +219,44 @@ class ReportGenerator:
             "avg_trade_duration_hours": round(avg_duration, 2),
         }
     
+    @staticmethod
+    def _duration_hours_sum(trades: List[Dict[str, Any]]) -> tuple:
+        """
+        (total hours held, count) over trades with both timestamps.
+
+        Parses all timestamps in one numpy datetime64 conversion instead of
+        two datetime.fromisoformat() calls per trade.  NumPy has no notion
+        of UTC offsets, so any offset-bearing timestamp (or anything else it
+        rejects) sends the batch back through the exact per-trade path.
+        """
+        pairs = [
+            (t["entry_timestamp"], t["exit_timestamp"])
+            for t in trades
+            if t.get("exit_timestamp") and t.get("entry_timestamp")
+        ]
+        if not pairs:
+            return 0.0, 0
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                stamps = np.array(pairs, dtype="datetime64[us]")
+        except (ValueError, TypeError, UserWarning, DeprecationWarning):
+            dur_sum = 0.0
+            for entry_ts, exit_ts in pairs:
+                entry = datetime.fromisoformat(entry_ts)
+                exit_time = datetime.fromisoformat(exit_ts)
+                dur_sum += (exit_time - entry).total_seconds() / 3600  # hours
+            return dur_sum, len(pairs)
+        micros = (stamps[:, 1] - stamps[:, 0]).astype(np.int64)
+        return float(micros.sum()) / 3.6e9, len(pairs)
+    
     def save_report_csv(self, report: Dict[str, Any], filename: Optional[str] = None):
         """Save trades from report as CSV."""
         if filename is None:
             period = report.get("period", report.get("date", "all"))
             filename = f"report_{period}.csv"
         
-        csv_path = self.reports_dir / filename
+        csv_path = ensure_dir(self.reports_dir) / filename
         
         trades = report.get("trades", [])
         if not trades:
@@ -173,11 +269,11 @@ class ReportGenerator:
         ]
         
         with open(csv_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            # extrasaction="ignore" drops the other trade keys inside the
+            # writer, and restval="" fills missing ones, so rows go in as-is.
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore", restval="")
             writer.writeheader()
-            
-            for trade in trades:
-                writer.writerow({k: trade.get(k, "") for k in fieldnames})
+            writer.writerows(trades)
     
     def save_report_markdown(self, report: Dict[str, Any], filename: Optional[str] = None):
         """Save report summary as Markdown."""
@@ -185,58 +281,63 @@ class ReportGenerator:
             period = report.get("period", report.get("date", "all"))
             filename = f"report_{period}.md"
         
-        md_path = self.reports_dir / filename
+        md_path = ensure_dir(self.reports_dir) / filename
         
-        with open(md_path, "w") as f:
-            # Header
-            period = report.get("period", report.get("date", "Unknown"))
-            f.write(f"# Trading Report: {period}\n\n")
-            f.write(f"*Generated: {report.get('generated_at', 'Unknown')}*\n\n")
-            
-            # Summary
-            f.write("## Summary\n\n")
-            summary = report.get("summary", {})
-            f.write(f"| Metric | Value |\n")
-            f.write(f"|--------|-------|\n")
-            f.write(f"| Trades | {summary.get('trades', 0)} |\n")
-            f.write(f"| Total PnL | ${summary.get('total_pnl', 0):,.2f} |\n")
-            f.write(f"| Wins | {summary.get('wins', 0)} |\n")
-            f.write(f"| Losses | {summary.get('losses', 0)} |\n")
-            f.write(f"| Win Rate | {summary.get('win_rate', 0):.2f}% |\n\n")
-            
-            # Metrics
-            f.write("## Metrics\n\n")
-            metrics = report.get("metrics", {})
-            f.write(f"| Metric | Value |\n")
-            f.write(f"|--------|-------|\n")
-            f.write(f"| Avg Win | ${metrics.get('avg_win', 0):,.2f} |\n")
-            f.write(f"| Avg Loss | ${metrics.get('avg_loss', 0):,.2f} |\n")
-            f.write(f"| Largest Win | ${metrics.get('largest_win', 0):,.2f} |\n")
-            f.write(f"| Largest Loss | ${metrics.get('largest_loss', 0):,.2f} |\n")
-            f.write(f"| Profit Factor | {metrics.get('profit_factor', 0)} |\n")
-            f.write(f"| Avg Trade Duration | {metrics.get('avg_trade_duration_hours', 0)} hours |\n\n")
+        # Assemble in memory and write once instead of one write() per line.
+        parts: List[str] = []
+        w = parts.append
+        
+        # Header
+        period = report.get("period", report.get("date", "Unknown"))
+        w(f"# Trading Report: {period}\n\n")
+        w(f"*Generated: {report.get('generated_at', 'Unknown')}*\n\n")
+        
+        # Summary
+        w("## Summary\n\n")
+        summary = report.get("summary", {})
+        w(f"| Metric | Value |\n")
+        w(f"|--------|-------|\n")
+        w(f"| Trades | {summary.get('trades', 0)} |\n")
+        w(f"| Total PnL | ${summary.get('total_pnl', 0):,.2f} |\n")
+        w(f"| Wins | {summary.get('wins', 0)} |\n")
+        w(f"| Losses | {summary.get('losses', 0)} |\n")
+        w(f"| Win Rate | {summary.get('win_rate', 0):.2f}% |\n\n")
+        
+        # Metrics
+        w("## Metrics\n\n")
+        metrics = report.get("metrics", {})
+        w(f"| Metric | Value |\n")
+        w(f"|--------|-------|\n")
+        w(f"| Avg Win | ${metrics.get('avg_win', 0):,.2f} |\n")
+        w(f"| Avg Loss | ${metrics.get('avg_loss', 0):,.2f} |\n")
+        w(f"| Largest Win | ${metrics.get('largest_win', 0):,.2f} |\n")
+        w(f"| Largest Loss | ${metrics.get('largest_loss', 0):,.2f} |\n")
+        w(f"| Profit Factor | {metrics.get('profit_factor', 0)} |\n")
+        w(f"| Avg Trade Duration | {metrics.get('avg_trade_duration_hours', 0)} hours |\n\n")
+        
+        # Trades
+        if report.get("trades"):
+            w("## Trades\n\n")
+            w(f"| Symbol | Side | Entry | Exit | Shares | PnL | PnL% |\n")
+            w(f"|--------|------|-------|------|--------|-----|------|\n")
             
-            # Trades
-            if report.get("trades"):
-                f.write("## Trades\n\n")
-                f.write(f"| Symbol | Side | Entry | Exit | Shares | PnL | PnL% |\n")
-                f.write(f"|--------|------|-------|------|--------|-----|------|\n")
-                
-                for trade in report.get("trades", []):
-                    f.write(
-                        f"| {trade.get('symbol', 'N/A')} | "
-                        f"{trade.get('side', 'N/A')} | "
-                        f"${trade.get('entry_price', 0):.2f} | "
-                        f"${trade.get('exit_price', 0):.2f} | "
-                        f"{trade.get('quantity', 0)} | "
-                        f"${trade.get('pnl', 0):,.2f} | "
-                        f"{trade.get('pnl_percent', 0):.2f}% |\n"
-                    )
+            for trade in report.get("trades", []):
+                w(
+                    f"| {trade.get('symbol', 'N/A')} | "
+                    f"{trade.get('side', 'N/A')} | "
+                    f"${trade.get('entry_price', 0):.2f} | "
+                    f"${trade.get('exit_price', 0):.2f} | "
+                    f"{trade.get('quantity', 0)} | "
+                    f"${trade.get('pnl', 0):,.2f} | "
+                    f"{trade.get('pnl_percent', 0):.2f}% |\n"
+                )
+        
+        md_path.write_text("".join(parts))
     
     def generate_all_reports_for_date(self, date: Optional[str] = None):
         """Generate all report types (markdown + CSV) for a date."""
         if date is None:
-            date = datetime.utcnow().strftime("%Y-%m-%d")
+            date = utc_today()
         
         report = self.generate_daily_report(date)
         
@@ -247,6 +348,25 @@ class ReportGenerator:
         print(f"✓ Generated daily reports for {date}")
         return report
     
+    async def generate_all_reports_for_dates(
+        self, dates: List[str], concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Backfill daily reports for many dates concurrently.
+
+        Each date runs generate_all_reports_for_date in a worker thread, at
+        most *concurrency* at a time, so markdown/CSV writes for one date
+        overlap metric work for another.  Reports come back in *dates* order.
+        Run with ``asyncio.run(gen.generate_all_reports_for_dates([...]))``.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def _one(date: str) -> Dict[str, Any]:
+            async with sem:
+                return await asyncio.to_thread(self.generate_all_reports_for_date, date)
+        
+        return list(await asyncio.gather(*(_one(d) for d in dates)))
+    
     def display_report(self, report: Dict[str, Any]):
         """Pretty-print a report to console."""
         period = report.get("period", report.get("date", "Unknown"))
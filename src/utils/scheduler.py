@@ -11,33 +11,96 @@ Uses APScheduler for robust scheduling with timezone support.
 """
 
 import pytz
-from datetime import datetime, time
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Optional, Callable, Any
 from abc import ABC, abstractmethod
 
 try:
+    from apscheduler.executors.pool import ThreadPoolExecutor
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
     from apscheduler.schedulers.background import BackgroundScheduler
     from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.util import localize
     HAS_APSCHEDULER = True
 except ImportError:
     HAS_APSCHEDULER = False
     print("WARNING: APScheduler not installed. Scheduler will not work.")
     print("Install with: pip install apscheduler")
 
+try:
+    import pandas_market_calendars as mcal
+    HAS_MARKET_CALENDARS = True
+except ImportError:  # optional: without it holidays still fire (weekday-only)
+    HAS_MARKET_CALENDARS = False
+
+
+@lru_cache(maxsize=4)
+def _nyse_closed_weekdays(year: int) -> frozenset:
+    """Weekdays in *year* on which NYSE is closed (holidays)."""
+    if not HAS_MARKET_CALENDARS:
+        return frozenset()
+    open_days = {
+        d.date()
+        for d in mcal.get_calendar("NYSE").valid_days(f"{year}-01-01", f"{year}-12-31")
+    }
+    d, end, closed = date(year, 1, 1), date(year, 12, 31), set()
+    while d <= end:
+        if d.weekday() < 5 and d not in open_days:
+            closed.add(d)
+        d += timedelta(days=1)
+    return frozenset(closed)
+
+
+if HAS_APSCHEDULER:
+    class TradingDayCronTrigger(CronTrigger):
+        """
+        CronTrigger that never fires on NYSE holidays.
+
+        Fire times landing on a closed weekday are pushed to the next match
+        after that day, so holiday runs are skipped up front rather than
+        connecting to IB only to find the market shut.  Behaves exactly like
+        CronTrigger when pandas_market_calendars is not installed.
+        """
+
+        def get_next_fire_time(self, previous_fire_time, now):
+            fire = super().get_next_fire_time(previous_fire_time, now)
+            while fire is not None and fire.date() in _nyse_closed_weekdays(fire.year):
+                next_day = datetime.combine(fire.date() + timedelta(days=1), time.min)
+                fire = super().get_next_fire_time(None, localize(next_day, self.timezone))
+            return fire
+
 
 class PipelineScheduler:
     """
     Schedule pipeline runs at specific times.
     
     Times are in US/Eastern (market timezone).
+    
+    By default jobs run on APScheduler's background thread pool, which suits
+    a blocking host.  Pass ``use_asyncio=True`` from a host that already runs
+    an asyncio loop (the orchestrator, async IB / HTTP clients): jobs then
+    execute on that loop with no thread hop, coroutine functions are awaited
+    directly, and ``start()`` must be called from inside the loop.
     """
     
-    def __init__(self):
+    def __init__(self, use_asyncio: bool = False):
         if not HAS_APSCHEDULER:
             raise RuntimeError("APScheduler is required. Install with: pip install apscheduler")
         
-        self.scheduler = BackgroundScheduler()
         self.tz = pytz.timezone('US/Eastern')
+        # Jobs share one IB socket: never run two copies of a job at once,
+        # collapse a backlog of missed runs into one, and still run a job
+        # that is up to 5 min late (e.g. an open scan overrunning).
+        job_defaults = {"coalesce": True, "max_instances": 1, "misfire_grace_time": 300}
+        if use_asyncio:
+            self.scheduler = AsyncIOScheduler(timezone=self.tz, job_defaults=job_defaults)
+        else:
+            self.scheduler = BackgroundScheduler(
+                timezone=self.tz,
+                job_defaults=job_defaults,
+                executors={"default": ThreadPoolExecutor(2)},
+            )
         self.jobs = {}
     
     def schedule_market_open_scan(
@@ -53,7 +116,7 @@ class PipelineScheduler:
         """
         job = self.scheduler.add_job(
             pipeline_fn,
-            trigger=CronTrigger(hour=9, minute=30, day_of_week='mon-fri', timezone=self.tz),
+            trigger=TradingDayCronTrigger(hour=9, minute=30, day_of_week='mon-fri', timezone=self.tz),
             kwargs={"num_candidates": num_candidates},
             id=name,
             name=f"Pipeline: {name}",
@@ -79,7 +142,7 @@ class PipelineScheduler:
         """
         job = self.scheduler.add_job(
             pipeline_fn,
-            trigger=CronTrigger(hour=hour, minute=minute, day_of_week='mon-fri', timezone=self.tz),
+            trigger=TradingDayCronTrigger(hour=hour, minute=minute, day_of_week='mon-fri', timezone=self.tz),
             kwargs={"num_candidates": num_candidates},
             id=name,
             name=f"Pipeline: {name}",
@@ -101,7 +164,7 @@ class PipelineScheduler:
         """
         job = self.scheduler.add_job(
             reconciliation_fn,
-            trigger=CronTrigger(hour=16, minute=0, day_of_week='mon-fri', timezone=self.tz),
+            trigger=TradingDayCronTrigger(hour=16, minute=0, day_of_week='mon-fri', timezone=self.tz),
             id=name,
             name=f"Reconciliation: {name}",
             replace_existing=True,
@@ -224,6 +287,7 @@ def create_standard_schedule(
     pipeline_fn: Callable[..., Any],
     reconciliation_fn: Optional[Callable[..., Any]] = None,
     report_fn: Optional[Callable[..., Any]] = None,
+    use_asyncio: bool = False,
 ) -> PipelineScheduler:
     """
     Create a standard trading schedule.
@@ -233,9 +297,11 @@ def create_standard_schedule(
     - 12:00 PM: Mid-day scan (3 candidates)
     - 4:00 PM: Position reconciliation (if provided)
     - 5:00 PM: Daily report (if provided)
+    
+    ``use_asyncio`` is forwarded to PipelineScheduler.
     """
     
-    scheduler = PipelineScheduler()
+    scheduler = PipelineScheduler(use_asyncio=use_asyncio)
     
     # Market open scan
     scheduler.schedule_market_open_scan(pipeline_fn, num_candidates=5)
@@ -7,41 +7,402 @@ Stores executed trades and pipeline runs to local storage for:
 - PnL calculation
 - Backtesting
 
-Storage format: JSON for simplicity, can migrate to DB later.
+Storage format: append-only JSON Lines (one record per line), so recording
+a run/trade/candidate writes one line instead of re-serializing the whole
+history.  Legacy ``*.json`` array files are converted on first open.
+
+With pyarrow installed, rollup_parquet() mirrors the trades into a Parquet
+dataset partitioned by entry date for columnar analytics; the JSONL file
+stays the write path and source of truth.
 """
 
 import json
+import mmap
+import os
+import re
+import sys
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dataclasses import asdict
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
 
 from src.contracts.trade_intent import TradeIntent
 from src.execution.orders import OrderResult
+from src.utils.clock import utc_today
+
+try:
+    import orjson
+
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(record: Any) -> bytes:
+        return orjson.dumps(record, option=_ORJSON_OPTS, default=str)
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    def _dumps(record: Any) -> bytes:
+        return json.dumps(record, default=str, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pa_ds
+    import pyarrow.parquet as pq
+
+    _PARQUET_OK = True
+except ImportError:  # pragma: no cover - optional dependency
+    _PARQUET_OK = False
+
+
+# Full key set (and on-disk key order) of a trade record.  record_trade
+# copies this pre-sized dict instead of growing a fresh literal per call.
+_TRADE_TEMPLATE: Dict[str, Any] = {
+    "run_id": None,
+    "symbol": None,
+    "side": None,
+    "entry_price": None,
+    "quantity": None,
+    "stop_loss": None,
+    "order_id": None,
+    "stop_order_id": None,
+    "order_success": None,
+    "entry_timestamp": None,
+    "order_message": None,
+    "status": "OPEN",  # OPEN, CLOSED, CANCELLED
+    "exit_price": None,
+    "exit_timestamp": None,
+    "pnl": None,
+    "pnl_percent": None,
+}
+
+
+# status / pnl of one compact trade line, for scans that need nothing else.
+# Keys are written in _TRADE_TEMPLATE order, so "status" precedes "pnl";
+# lines that don't match (hand-edited, reordered) are fully parsed instead.
+_STATUS_PNL_RE = re.compile(rb'"status":\s*"(\w*)".*?"pnl":\s*(null|[-+.\deE]+)')
+
+# Fields iter_trades() filters on, matched in the raw line before parsing.
+_ENTRY_TS_RE = re.compile(rb'"entry_timestamp":\s*"([^"]*)"')
+_STATUS_RE = re.compile(rb'"status":\s*"(\w*)"')
+
+
+def _count_trade(counts: Dict[str, Any], status: Any, pnl: Any, sign: int = 1) -> None:
+    """Add (*sign* = 1) or remove (-1) one trade's share of get_stats() counters."""
+    counts["total"] += sign
+    if status == "OPEN":
+        counts["open"] += sign
+    elif status == "CLOSED":
+        pnl = pnl or 0.0
+        counts["closed"] += sign
+        counts["pnl"] += sign * pnl
+        if pnl > 0:
+            counts["wins"] += sign
+        elif pnl < 0:
+            counts["losses"] += sign
+
+
+if _PARQUET_OK:
+    # Explicit types so a history of all-None exits or int prices still
+    # lands in stable float/int columns across partitions.
+    _TRADE_SCHEMA = pa.schema([
+        ("run_id", pa.string()),
+        ("symbol", pa.string()),
+        ("side", pa.string()),
+        ("entry_price", pa.float64()),
+        ("quantity", pa.int64()),
+        ("stop_loss", pa.float64()),
+        ("order_id", pa.int64()),
+        ("stop_order_id", pa.int64()),
+        ("order_success", pa.bool_()),
+        ("entry_timestamp", pa.string()),
+        ("order_message", pa.string()),
+        ("status", pa.string()),
+        ("exit_price", pa.float64()),
+        ("exit_timestamp", pa.string()),
+        ("pnl", pa.float64()),
+        ("pnl_percent", pa.float64()),
+        ("entry_date", pa.string()),
+    ])
 
 
 class TradeHistoryDB:
-    """Local JSON-based trade history database."""
+    """Local JSONL-based trade history database."""
     
     def __init__(self, db_dir: str = "data/trade_history"):
         self.db_dir = Path(db_dir)
         self.db_dir.mkdir(parents=True, exist_ok=True)
         
-        self.runs_file = self.db_dir / "runs.json"
-        self.trades_file = self.db_dir / "trades.json"
-        self.candidates_file = self.db_dir / "candidates.json"
-    
-    def _load_json(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Load JSON file, return empty list if not found."""
-        if file_path.exists():
-            with open(file_path) as f:
-                return json.load(f)
-        return []
-    
-    def _save_json(self, file_path: Path, data: List[Dict[str, Any]]):
-        """Atomically save JSON file."""
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        self.runs_file = self.db_dir / "runs.jsonl"
+        self.trades_file = self.db_dir / "trades.jsonl"
+        self.candidates_file = self.db_dir / "candidates.jsonl"
+        self.trades_parquet_dir = self.db_dir / "trades_parquet"
+        # path -> (file stamp, records).  Reads are served from RAM until the
+        # file changes underneath us; our own writes keep the entry current.
+        self._cache: Dict[Path, tuple] = {}
+        # Records appended inside batched(), written once on exit.
+        self._pending: Dict[Path, List[Dict[str, Any]]] = {}
+        self._batch_depth = 0
+        for path in (self.runs_file, self.trades_file, self.candidates_file):
+            self._migrate_legacy_json(path)
+        # (trades list, {order_id: index}, rows indexed); see _order_index()
+        self._trade_index: tuple = (None, {}, 0)
+        # Columnar mirror of the cached trades list; see _trade_columns()
+        self._columns: Optional[Dict[str, Any]] = None
+        # date -> (trades.jsonl stamp, summary); see get_daily_summary()
+        self._summary_cache: Dict[str, tuple] = {}
+        # (run_id, ISO timestamp) of the run currently being recorded
+        self._run_ts: tuple = (None, "")
+        # get_stats() counters and the {file: stamp} they are current for;
+        # our own writes keep them current (see _stats_update).
+        self._stats: Optional[Dict[str, Any]] = None
+    
+    @staticmethod
+    def _stamp(file_path: Path):
+        """(mtime_ns, size) of *file_path*, or None if it doesn't exist."""
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _migrate_legacy_json(self, file_path: Path):
+        """Convert a pre-JSONL ``<name>.json`` array next to *file_path*."""
+        legacy = file_path.with_suffix(".json")
+        if file_path.exists() or not legacy.exists():
+            return
+        with open(legacy) as f:
+            self._save_jsonl(file_path, json.load(f))
+        legacy.rename(legacy.with_suffix(".json.migrated"))
+    
+    def _iter_jsonl(self, file_path: Path) -> Iterator[Dict[str, Any]]:
+        """Yield records line by line; nothing if the file doesn't exist."""
+        try:
+            f = open(file_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+    
+    def _load_jsonl(self, file_path: Path) -> List[Dict[str, Any]]:
+        """
+        All records (empty list if the file doesn't exist).
+
+        The list is the cache's own copy: internal callers may only change
+        it through _append_jsonl / _save_jsonl, public getters hand out
+        copies.
+        """
+        stamp = self._stamp(file_path)
+        hit = self._cache.get(file_path)
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+        records = list(self._iter_jsonl(file_path))
+        self._cache[file_path] = (stamp, records)
+        return records
+    
+    def _tail_jsonl(self, file_path: Path, limit: int) -> List[Dict[str, Any]]:
+        """
+        Last *limit* records, parsing only those.
+
+        Served from the cache when it is current; otherwise the file is read
+        backwards in blocks until enough lines are found, so asking for the
+        latest 100 runs doesn't parse the whole history.
+        """
+        if limit <= 0:
+            # keep slice semantics
+            return [dict(r) for r in self._load_jsonl(file_path)[-limit:]]
+        hit = self._cache.get(file_path)
+        if hit is not None and hit[0] == self._stamp(file_path):
+            return [dict(r) for r in hit[1][-limit:]]
+        try:
+            f = open(file_path, "rb")
+        except FileNotFoundError:
+            return []
+        with f:
+            pos = f.seek(0, os.SEEK_END)
+            buf = b""
+            while pos > 0 and buf.count(b"\n") <= limit:
+                step = min(1 << 16, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+        segs = buf.split(b"\n")
+        if pos > 0:
+            # The first segment may be partial.  Drop it before skipping
+            # blanks: when the block starts on a newline it is the empty
+            # one, and the first record after it is complete.
+            segs = segs[1:]
+        lines = [ln for ln in segs if ln.strip()]
+        return [_loads(ln) for ln in lines[-limit:]]
+    
+    def _write_lines(self, file_path: Path, records: List[Dict[str, Any]], cached: bool):
+        before = self._stamp(file_path)
+        # One O_APPEND write() per call: the kernel positions it at the
+        # current end of file, so paper/live/backtest processes appending
+        # to the same history never interleave inside a line (a buffered
+        # file object may split a large payload over several writes).
+        data = memoryview(b"".join(_dumps(r) + b"\n" for r in records))
+        fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        self._stats_update(file_path, before, added=records)
+        hit = self._cache.get(file_path)
+        if hit is None or hit[0] != before:
+            # Changed by someone else since we last read it; reload lazily.
+            self._cache.pop(file_path, None)
+            return
+        if not cached:
+            hit[1].extend(records)
+        self._cache[file_path] = (self._stamp(file_path), hit[1])
+    
+    def _append_jsonl(self, file_path: Path, record: Dict[str, Any]):
+        """Append one record: O(1) bytes written regardless of history size."""
+        if self._batch_depth:
+            # Visible to reads right away; reaches disk when the batch ends.
+            self._load_jsonl(file_path).append(record)
+            self._pending.setdefault(file_path, []).append(record)
+            return
+        self._write_lines(file_path, [record], cached=False)
+    
+    def _save_jsonl(self, file_path: Path, data: List[Dict[str, Any]]):
+        """Rewrite the whole file (mutation path, e.g. close_trade)."""
+        # *data* already holds anything buffered for this file.
+        self._pending.pop(file_path, None)
+        if file_path == self.trades_file:
+            self._columns = None  # rows were edited in place
+        # Write a temp file in the same directory and publish it with
+        # os.replace, so a crash mid-write never leaves a torn history.
+        fd, tmp_path = tempfile.mkstemp(dir=str(file_path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"".join(_dumps(r) + b"\n" for r in data))
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._cache[file_path] = (self._stamp(file_path), data)
+    
+    def flush(self):
+        """
+        Write records buffered by batched() to disk.
+
+        A file's records stay buffered until its write succeeds, so after a
+        failed flush (disk full, permissions) the next one retries them.
+        """
+        for file_path in list(self._pending):
+            self._write_lines(file_path, self._pending[file_path], cached=True)
+            del self._pending[file_path]
+    
+    def close(self):
+        self.flush()
+    
+    @contextmanager
+    def batched(self):
+        """
+        Buffer record_* appends and write each file once on exit::
+
+            with db.batched():
+                for c in candidates:
+                    db.record_candidate(...)
+
+        Reads through this instance see buffered records immediately; other
+        processes (and file-stamp keyed caches) see them after the block.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+    
+    def _order_index(self, trades: List[Dict[str, Any]]) -> Dict[Any, int]:
+        """
+        order_id -> position in *trades* (first occurrence, like a scan).
+
+        Built once per cached trades list and extended incrementally as
+        records are appended, so close_trade is a dict lookup.
+        """
+        indexed, index, n = self._trade_index
+        if indexed is not trades or n > len(trades):
+            index, n = {}, 0
+        for i in range(n, len(trades)):
+            index.setdefault(trades[i]["order_id"], i)
+        self._trade_index = (trades, index, len(trades))
+        return index
+    
+    def _trade_columns(self, trades: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        NumPy columns for the analytic scans over *trades*.
+
+        Rebuilt when the cached list is replaced, grows, or is rewritten
+        (close_trade); the dict rows stay the canonical records.
+        """
+        cols = self._columns
+        if cols is not None and cols["src"] is trades and cols["n"] == len(trades):
+            return cols
+        n = len(trades)
+        cols = {
+            "src": trades,
+            "n": n,
+            "pnl": np.fromiter(((t.get("pnl") or 0.0) for t in trades), dtype=np.float64, count=n),
+            "symbol": np.array([t["symbol"] for t in trades], dtype=str),
+            "status": np.array([t["status"] for t in trades], dtype=str),
+            "entry_ts": np.array([t["entry_timestamp"] for t in trades], dtype=str),
+        }
+        # Sorted view of entry timestamps for range lookups by bisection.
+        # Trades are normally appended in time order, so skip the argsort
+        # unless an explicit back-dated timestamp broke that.
+        ts = cols["entry_ts"]
+        if n < 2 or bool((ts[:-1] <= ts[1:]).all()):
+            cols["order"] = None
+            cols["entry_ts_sorted"] = ts
+        else:
+            order = np.argsort(ts, kind="stable")
+            cols["order"] = order
+            cols["entry_ts_sorted"] = ts[order]
+        self._columns = cols
+        return cols
+    
+    @staticmethod
+    def _entry_range(
+        cols: Dict[str, Any], date_from: Optional[str], date_to: Optional[str]
+    ) -> np.ndarray:
+        """
+        Row indices with ``date_from <= entry_timestamp < date_to`` (O(log N + K));
+        a missing bound is open.
+        """
+        ts = cols["entry_ts_sorted"]
+        lo = int(np.searchsorted(ts, date_from, side="left")) if date_from else 0
+        hi = int(np.searchsorted(ts, date_to, side="left")) if date_to else ts.size
+        if cols["order"] is None:
+            return np.arange(lo, hi)
+        return cols["order"][lo:hi]
+    
+    def _now_iso(self, run_id: str) -> str:
+        """
+        UTC ISO timestamp shared by every record of *run_id*.
+
+        A pipeline run records its candidates/trades in one burst, so the
+        clock is read and formatted once per run rather than once per record.
+        """
+        rid, ts = self._run_ts
+        if rid != run_id:
+            ts = datetime.utcnow().isoformat()
+            self._run_ts = (run_id, ts)
+        return ts
     
     def record_pipeline_run(
         self,
@@ -69,9 +430,7 @@ class TradeHistoryDB:
             "details": details,
         }
         
-        runs = self._load_json(self.runs_file)
-        runs.append(run_record)
-        self._save_json(self.runs_file, runs)
+        self._append_jsonl(self.runs_file, run_record)
         
         return run_record
     
@@ -88,28 +447,22 @@ class TradeHistoryDB:
     ) -> Dict[str, Any]:
         """Record an executed trade."""
         
-        trade_record = {
-            "run_id": run_id,
-            "symbol": symbol,
-            "side": side,
-            "entry_price": entry_price,
-            "quantity": quantity,
-            "stop_loss": stop_loss,
-            "order_id": order_result.parent_order_id,
-            "stop_order_id": order_result.stop_order_id,
-            "order_success": order_result.ok,
-            "entry_timestamp": timestamp or datetime.utcnow().isoformat(),
-            "order_message": order_result.message,
-            "status": "OPEN",  # OPEN, CLOSED, CANCELLED
-            "exit_price": None,
-            "exit_timestamp": None,
-            "pnl": None,
-            "pnl_percent": None,
-        }
+        trade_record = _TRADE_TEMPLATE.copy()
+        trade_record.update(
+            run_id=run_id,
+            symbol=symbol,
+            side=side,
+            entry_price=entry_price,
+            quantity=quantity,
+            stop_loss=stop_loss,
+            order_id=order_result.parent_order_id,
+            stop_order_id=order_result.stop_order_id,
+            order_success=order_result.ok,
+            entry_timestamp=timestamp or self._now_iso(run_id),
+            order_message=order_result.message,
+        )
         
-        trades = self._load_json(self.trades_file)
-        trades.append(trade_record)
-        self._save_json(self.trades_file, trades)
+        self._append_jsonl(self.trades_file, trade_record)
         
         return trade_record
 
@@ -138,13 +491,11 @@ class TradeHistoryDB:
             "rationale": rationale,
             "backend": backend,
             "armed": armed,
-            "timestamp": timestamp or datetime.utcnow().isoformat(),
+            "timestamp": timestamp or self._now_iso(run_id),
             "status": "SUGGESTED",
         }
 
-        candidates = self._load_json(self.candidates_file)
-        candidates.append(candidate_record)
-        self._save_json(self.candidates_file, candidates)
+        self._append_jsonl(self.candidates_file, candidate_record)
 
         return candidate_record
     
@@ -156,69 +507,237 @@ class TradeHistoryDB:
     ):
         """Mark a trade as closed and calculate PnL."""
         
-        trades = self._load_json(self.trades_file)
+        trades = self._load_jsonl(self.trades_file)
+        
+        idx = self._order_index(trades).get(order_id)
+        if idx is None:
+            return None
+        trade = trades[idx]
+        prev = {"status": trade.get("status"), "pnl": trade.get("pnl")}
+        
+        exit_ts = exit_timestamp or datetime.utcnow().isoformat()
         
-        for trade in trades:
-            if trade["order_id"] == order_id:
-                exit_ts = exit_timestamp or datetime.utcnow().isoformat()
-                
-                # Calculate P&L
-                if trade["side"].upper() == "BUY":
-                    pnl = (exit_price - trade["entry_price"]) * trade["quantity"]
-                    pnl_pct = ((exit_price / trade["entry_price"]) - 1.0) * 100.0
-                else:  # SELL
-                    pnl = (trade["entry_price"] - exit_price) * trade["quantity"]
-                    pnl_pct = ((trade["entry_price"] / exit_price) - 1.0) * 100.0
-                
-                trade.update({
-                    "status": "CLOSED",
-                    "exit_price": exit_price,
-                    "exit_timestamp": exit_ts,
-                    "pnl": round(pnl, 2),
-                    "pnl_percent": round(pnl_pct, 4),
-                })
-                
-                self._save_json(self.trades_file, trades)
-                return trade
+        # Calculate P&L
+        if trade["side"].upper() == "BUY":
+            pnl = (exit_price - trade["entry_price"]) * trade["quantity"]
+            pnl_pct = ((exit_price / trade["entry_price"]) - 1.0) * 100.0
+        else:  # SELL
+            pnl = (trade["entry_price"] - exit_price) * trade["quantity"]
+            pnl_pct = ((trade["entry_price"] / exit_price) - 1.0) * 100.0
         
-        return None
+        trade.update({
+            "status": "CLOSED",
+            "exit_price": exit_price,
+            "exit_timestamp": exit_ts,
+            "pnl": round(pnl, 2),
+            "pnl_percent": round(pnl_pct, 4),
+        })
+        
+        before = self._stamp(self.trades_file)
+        self._save_jsonl(self.trades_file, trades)
+        self._stats_update(self.trades_file, before, removed=[prev], added=[trade])
+        return trade
+
+    def close_trades_bulk(
+        self,
+        order_ids: List[int],
+        exit_prices: List[float],
+        exit_timestamp: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Close many trades at once (e.g. end-of-day flatten).
+
+        Same P&L rules as close_trade, computed as one vectorized pass over
+        the matched rows, and the trades file is rewritten once rather than
+        once per trade.  Unknown order ids are skipped; a repeated id is
+        closed once, at its last exit price.
+        """
+        trades = self._load_jsonl(self.trades_file)
+        index = self._order_index(trades)
+
+        # row -> exit price; an order id listed twice closes once, at its
+        # last price.
+        by_row: Dict[int, float] = {}
+        for oid, px in zip(order_ids, exit_prices):
+            idx = index.get(oid)
+            if idx is not None:
+                by_row[idx] = px
+        if not by_row:
+            return []
+        rows = list(by_row)
+        prices = list(by_row.values())
+
+        exit_px = np.asarray(prices, dtype=np.float64)
+        entry = np.fromiter((trades[i]["entry_price"] for i in rows), dtype=np.float64, count=len(rows))
+        qty = np.fromiter((trades[i]["quantity"] for i in rows), dtype=np.float64, count=len(rows))
+        is_buy = np.char.upper(np.array([trades[i]["side"] for i in rows], dtype=str)) == "BUY"
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pnl = np.where(is_buy, exit_px - entry, entry - exit_px) * qty
+            pnl_pct = np.where(is_buy, exit_px / entry - 1.0, entry / exit_px - 1.0) * 100.0
+
+        exit_ts = exit_timestamp or datetime.utcnow().isoformat()
+        closed = []
+        prev = []
+        for k, i in enumerate(rows):
+            trade = trades[i]
+            prev.append({"status": trade.get("status"), "pnl": trade.get("pnl")})
+            trade.update({
+                "status": "CLOSED",
+                "exit_price": prices[k],
+                "exit_timestamp": exit_ts,
+                "pnl": round(float(pnl[k]), 2),
+                "pnl_percent": round(float(pnl_pct[k]), 4),
+            })
+            closed.append(trade)
+
+        before = self._stamp(self.trades_file)
+        self._save_jsonl(self.trades_file, trades)
+        self._stats_update(self.trades_file, before, removed=prev, added=closed)
+        return closed
+
+    def rollup_parquet(self) -> bool:
+        """
+        Rewrite the Parquet mirror of trades.jsonl (one partition per entry
+        date).  Meant for the nightly job, not the per-trade write path.
+        Returns False when pyarrow is unavailable.
+        """
+        if not _PARQUET_OK:
+            return False
+        trades = self._load_jsonl(self.trades_file)
+        rows = [
+            {**{k: t.get(k) for k in _TRADE_TEMPLATE}, "entry_date": str(t.get("entry_timestamp") or "")[:10]}
+            for t in trades
+        ]
+        table = pa.Table.from_pylist(rows, schema=_TRADE_SCHEMA)
+        pq.write_to_dataset(
+            table,
+            root_path=str(self.trades_parquet_dir),
+            partition_cols=["entry_date"],
+            existing_data_behavior="delete_matching",
+        )
+        return True
+    
+    def closed_trades_table(self):
+        """
+        Closed trades from the Parquet mirror as a ``pyarrow.Table`` (status
+        filter pushed down to the scan), or None if pyarrow or the mirror is
+        missing.  Reflects the state as of the last rollup_parquet().
+        """
+        if not _PARQUET_OK or not self.trades_parquet_dir.exists():
+            return None
+        dataset = pa_ds.dataset(str(self.trades_parquet_dir), format="parquet", partitioning="hive")
+        return dataset.to_table(filter=pa_ds.field("status") == "CLOSED")
     
     def get_run_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent pipeline runs."""
-        runs = self._load_json(self.runs_file)
-        return runs[-limit:]
+        return self._tail_jsonl(self.runs_file, limit)
     
-    def get_trade_history(self, symbol: Optional[str] = None, status: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get trade history, optionally filtered."""
-        trades = self._load_json(self.trades_file)
+    def get_trade_history(
+        self,
+        symbol: Optional[str] = None,
+        status: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get trade history, optionally filtered.
+
+        *date_from* / *date_to* bound ``entry_timestamp`` as a half-open
+        range ``[date_from, date_to)`` (ISO dates, e.g. "2024-01-05").
+        A date range is first narrowed by bisection over the sorted entry
+        timestamps (the columnar mirror's index); symbol / status masks then
+        only touch rows inside it.  Rows come back in file order, as
+        shallow copies of the cached records.
+        """
+        trades = self._load_jsonl(self.trades_file)
         
-        if symbol:
-            trades = [t for t in trades if t["symbol"] == symbol]
+        if not (symbol or status or date_from or date_to):
+            return [dict(t) for t in trades]
         
+        cols = self._trade_columns(trades)
+        if date_from or date_to:
+            rows = self._entry_range(cols, date_from, date_to)
+            if cols["order"] is not None:
+                rows = np.sort(rows)
+        else:
+            rows = np.arange(cols["n"])
+        if symbol:
+            rows = rows[cols["symbol"][rows] == symbol]
         if status:
-            trades = [t for t in trades if t["status"] == status]
-        
-        return trades
+            rows = rows[cols["status"][rows] == status]
+        return [dict(trades[i]) for i in rows]
 
+    def iter_trades(
+        self,
+        status: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream trades matching the filters (same semantics as
+        get_trade_history).
+
+        With trades.jsonl already cached this walks the in-memory rows.
+        Otherwise the file is scanned through mmap, status and entry time
+        are checked in the raw line, and only matching lines are parsed;
+        nothing is cached, so memory follows the matches, not the history.
+        """
+        if self._is_cached(self.trades_file):
+            yield from self.get_trade_history(status=status, date_from=date_from, date_to=date_to)
+            return
+        want = status.encode() if status else None
+        lo = date_from.encode() if date_from else None
+        hi = date_to.encode() if date_to else None
+        for line in self._mmap_lines(self.trades_file):
+            m_st = _STATUS_RE.search(line)
+            m_ts = _ENTRY_TS_RE.search(line)
+            if m_st is None or m_ts is None:
+                # Unusual layout: decide on the parsed record.
+                rec = _loads(line)
+                ts = rec.get("entry_timestamp") or ""
+                if ((not status or rec.get("status") == status)
+                        and (not date_from or ts >= date_from)
+                        and (not date_to or ts < date_to)):
+                    yield rec
+                continue
+            if want is not None and m_st.group(1) != want:
+                continue
+            ts = m_ts.group(1)
+            if (lo is not None and ts < lo) or (hi is not None and ts >= hi):
+                continue
+            yield _loads(line)
+    
     def get_candidate_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent suggested candidates."""
-        candidates = self._load_json(self.candidates_file)
-        return candidates[-limit:]
+        return self._tail_jsonl(self.candidates_file, limit)
     
     def get_daily_summary(self, date: Optional[str] = None) -> Dict[str, Any]:
         """Get PnL summary for a date."""
         if date is None:
-            date = datetime.utcnow().strftime("%Y-%m-%d")
+            date = utc_today()
         
-        trades = self._load_json(self.trades_file)
+        # Reconciliation, the scheduled reports and the orchestrator all ask
+        # for the same day; reuse the result until trades.jsonl changes.
+        stamp = self._stamp(self.trades_file)
+        hit = self._summary_cache.get(date)
+        if hit is not None and hit[0] == stamp:
+            return dict(hit[1])
+        summary = self._daily_summary(date)
+        self._summary_cache[date] = (stamp, summary)
+        return dict(summary)
+    
+    def _daily_summary(self, date: str) -> Dict[str, Any]:
+        cols = self._trade_columns(self._load_jsonl(self.trades_file))
         
-        # Filter to trades from this date
-        daily_trades = [
-            t for t in trades
-            if t["entry_timestamp"].startswith(date) and t["status"] == "CLOSED"
-        ]
+        # Closed trades whose entry timestamp starts with *date* (a day, or
+        # any prefix such as "2024-01"): bisect that slice of the sorted
+        # timestamps instead of comparing every row.
+        rows = self._entry_range(cols, date, date + "\uffff")
+        rows = rows[cols["status"][rows] == "CLOSED"]
+        pnl = cols["pnl"][rows]
         
-        if not daily_trades:
+        if not pnl.size:
             return {
                 "date": date,
                 "trades": 0,
@@ -228,39 +747,175 @@ class TradeHistoryDB:
                 "win_rate": 0.0,
             }
         
-        total_pnl = sum(t.get("pnl", 0.0) for t in daily_trades)
-        wins = sum(1 for t in daily_trades if t.get("pnl", 0) > 0)
-        losses = sum(1 for t in daily_trades if t.get("pnl", 0) < 0)
-        win_rate = (wins / len(daily_trades) * 100.0) if daily_trades else 0.0
+        wins = int((pnl > 0).sum())
         
         return {
             "date": date,
-            "trades": len(daily_trades),
-            "total_pnl": round(total_pnl, 2),
+            "trades": int(pnl.size),
+            "total_pnl": round(float(pnl.sum()), 2),
             "wins": wins,
-            "losses": losses,
-            "win_rate": round(win_rate, 2),
+            "losses": int((pnl < 0).sum()),
+            "win_rate": round(wins / pnl.size * 100.0, 2),
         }
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get overall trading statistics."""
-        runs = self._load_json(self.runs_file)
-        trades = self._load_json(self.trades_file)
+    def _is_cached(self, file_path: Path) -> bool:
+        hit = self._cache.get(file_path)
+        return hit is not None and hit[0] == self._stamp(file_path)
+    
+    @staticmethod
+    def _mmap_lines(file_path: Path) -> Iterator[bytes]:
+        """Non-empty lines of *file_path* read through a read-only mmap."""
+        try:
+            f = open(file_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    if line.strip():
+                        yield line
+    
+    def _scan_status_pnl(self, file_path: Path):
+        """
+        (status array, pnl array) straight from the file, without building
+        a dict per trade: a regex pulls the two fields out of each line.
+        """
+        statuses: List[str] = []
+        pnls: List[float] = []
+        for line in self._mmap_lines(file_path):
+            m = _STATUS_PNL_RE.search(line)
+            if m is not None:
+                statuses.append(m.group(1).decode())
+                pnls.append(0.0 if m.group(2) == b"null" else float(m.group(2)))
+            else:
+                rec = _loads(line)
+                statuses.append(rec.get("status"))
+                pnls.append(rec.get("pnl") or 0.0)
+        return np.array(statuses, dtype=str), np.array(pnls, dtype=np.float64)
+    
+    def _stats_update(
+        self,
+        file_path: Path,
+        before,
+        removed: Sequence[Dict[str, Any]] = (),
+        added: Sequence[Dict[str, Any]] = (),
+    ):
+        """
+        Carry the get_stats() counters across one of our own writes.
+
+        *before* is *file_path*'s stamp ahead of the write.  If the counters
+        weren't current for it, another process changed the file in between;
+        they are dropped and the next get_stats() recounts.
+        """
+        st = self._stats
+        if st is None or file_path not in st["stamps"]:
+            return
+        if st["stamps"][file_path] != before:
+            self._stats = None
+            return
+        counts = st["counts"]
+        if file_path == self.runs_file:
+            counts["runs"] += len(added)
+        else:
+            for rec in removed:
+                _count_trade(counts, rec.get("status"), rec.get("pnl"), -1)
+            for rec in added:
+                _count_trade(counts, rec.get("status"), rec.get("pnl"))
+        st["stamps"][file_path] = self._stamp(file_path)
+    
+    def _status_pnl(self):
+        """(status array, pnl array) over all trades, in file order."""
+        # With the trades already in memory use the columnar mirror; on a
+        # cold cache only status and pnl are needed, so skip the full parse.
+        if self._is_cached(self.trades_file):
+            cols = self._trade_columns(self._load_jsonl(self.trades_file))
+            return cols["status"], cols["pnl"]
+        return self._scan_status_pnl(self.trades_file)
+    
+    def _count_stats(self) -> Dict[str, Any]:
+        """get_stats() counters from the files (O(history))."""
+        if self._is_cached(self.runs_file):
+            n_runs = len(self._load_jsonl(self.runs_file))
+        else:
+            n_runs = sum(1 for _ in self._mmap_lines(self.runs_file))
         
-        closed_trades = [t for t in trades if t["status"] == "CLOSED"]
+        status, all_pnl = self._status_pnl()
+        pnl = all_pnl[status == "CLOSED"]
+        return {
+            "runs": n_runs,
+            "total": int(status.size),
+            "open": int((status == "OPEN").sum()),
+            "closed": int(pnl.size),
+            "wins": int((pnl > 0).sum()),
+            "losses": int((pnl < 0).sum()),
+            "pnl": float(pnl.sum()),
+        }
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get overall trading statistics.
+
+        Counters are computed once and then kept up to date by this
+        instance's appends and closes, so repeated calls cost two stat()s
+        while nobody else writes the files.
+        """
+        stamps = {path: self._stamp(path) for path in (self.runs_file, self.trades_file)}
+        st = self._stats
+        if self._pending or st is None or st["stamps"] != stamps:
+            # Buffered batched() records are in the cached lists but not yet
+            # on disk; count them without pinning counters to the stamps.
+            counts = self._count_stats()
+            self._stats = None if self._pending else {"stamps": stamps, "counts": dict(counts)}
+        else:
+            counts = st["counts"]
         
-        total_pnl = sum(t.get("pnl", 0.0) for t in closed_trades)
-        wins = sum(1 for t in closed_trades if t.get("pnl", 0) > 0)
-        losses = sum(1 for t in closed_trades if t.get("pnl", 0) < 0)
+        n_closed = counts["closed"]
+        wins = counts["wins"]
+        total_pnl = counts["pnl"]
         
         return {
-            "pipeline_runs": len(runs),
-            "total_trades": len(trades),
-            "closed_trades": len(closed_trades),
-            "open_trades": len([t for t in trades if t["status"] == "OPEN"]),
+            "pipeline_runs": counts["runs"],
+            "total_trades": counts["total"],
+            "closed_trades": n_closed,
+            "open_trades": counts["open"],
             "wins": wins,
-            "losses": losses,
-            "win_rate": round((wins / len(closed_trades) * 100.0) if closed_trades else 0.0, 2),
+            "losses": counts["losses"],
+            "win_rate": round((wins / n_closed * 100.0) if n_closed else 0.0, 2),
             "total_pnl": round(total_pnl, 2),
-            "avg_trade_pnl": round(total_pnl / len(closed_trades), 2) if closed_trades else 0.0,
+            "avg_trade_pnl": round(total_pnl / n_closed, 2) if n_closed else 0.0,
         }
+    
+    def get_pnl_array(self) -> np.ndarray:
+        """
+        P&L of every closed trade as a float64 array, in file order.
+
+        For statistics beyond get_stats() (spread, drawdown, histograms),
+        computed with NumPy instead of a loop over trade dicts.  The array
+        is a copy; callers may modify it.
+        """
+        status, pnl = self._status_pnl()
+        return pnl[status == "CLOSED"]
+    
+    def dump_human(self, kind: str = "trades", limit: int = 20, stream=None):
+        """
+        Pretty-print the last *limit* runs/trades/candidates for inspection.
+
+        The files themselves stay compact one-line records; indentation is
+        only for people reading them.
+        """
+        path = {
+            "runs": self.runs_file,
+            "trades": self.trades_file,
+            "candidates": self.candidates_file,
+        }[kind]
+        out = stream or sys.stdout
+        json.dump(self._tail_jsonl(path, limit), out, indent=2, default=str)
+        out.write("\n")
+
+
+@lru_cache(maxsize=None)
+def get_shared_db(db_dir: str = "data/trade_history") -> TradeHistoryDB:
+    """Process-wide TradeHistoryDB for *db_dir*, so its caches are shared."""
+    return TradeHistoryDB(db_dir)
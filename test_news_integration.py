@@ -9,11 +9,14 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import asyncio
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, List, Optional
 
-from src.data.news_fetcher import NewsFetcher
-from src.data.news_sentiment import NewsSentimentAnalyzer
+from src.data.news_fetcher import NewsFetcher, make_http_session
+from src.data.news_sentiment import get_default_analyzer
 from src.data.news_scorer import NewsScorer, display_news_scores
 from src.data.quant_news_integrator import QuantNewsIntegrator, display_unified_scores
 from src.quant.quant_scanner import QuantMarketScanner
@@ -27,63 +30,89 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Console banner, built once
+_BAR100 = "=" * 100
 
-def test_news_fetcher():
+
+async def fetch_and_score(fetcher, analyzer, symbol, days_back=3):
+    """
+    Fetch *symbol*'s articles, then score them, both off the event loop.
+
+    The RSS fetch returns its articles in one piece, so there is nothing
+    for scoring to overlap with.  Returns (articles, sentiments) in fetch
+    order.
+    """
+    articles = await asyncio.to_thread(fetcher.fetch_news_for_symbol, symbol, days_back)
+    sentiments = await asyncio.to_thread(analyzer.analyze_articles, articles)
+    return articles, sentiments
+
+
+@dataclass
+class SharedFixtures:
+    """Network results fetched once and shared by every test."""
+    session: Any
+    trending: List[dict] = field(default_factory=list)
+    test_symbol: Optional[str] = None
+    articles: list = field(default_factory=list)
+    sentiments: list = field(default_factory=list)
+
+
+async def gather_context(session) -> SharedFixtures:
+    """One Google News pass: trending symbols, then the top symbol's articles scored."""
+    fetcher = NewsFetcher(session=session)
+    ctx = SharedFixtures(session=session)
+    
+    print("\nFetching trending stocks (shared by all tests)...")
+    ctx.trending = await asyncio.to_thread(
+        fetcher.get_most_talked_about_stocks, min_articles=2, days_back=1, top_limit=10
+    )
+    if ctx.trending:
+        ctx.test_symbol = ctx.trending[0]['symbol']
+        print(f"Streaming articles on {ctx.test_symbol} through sentiment analysis...")
+        ctx.articles, ctx.sentiments = await fetch_and_score(
+            fetcher, get_default_analyzer(), ctx.test_symbol, days_back=3
+        )
+    return ctx
+
+
+async def test_news_fetcher(ctx: SharedFixtures):
     """Test 1: News fetching from Google News RSS."""
-    print("\n" + "="*100)
+    print("\n" + _BAR100)
     print("TEST 1: NEWS FETCHER")
-    print("="*100)
-    
-    fetcher = NewsFetcher()
-    
-    # Test 1a: Fetch trending stocks
-    print("\n1a. Fetching trending stocks...")
-    trending = fetcher.get_most_talked_about_stocks(min_articles=2, days_back=1)
+    print(_BAR100)
     
-    print(f"\nFound {len(trending)} trending stocks:")
+    # Test 1a: Trending stocks
+    trending = ctx.trending
+    print(f"\n1a. Found {len(trending)} trending stocks:")
     for i, stock in enumerate(trending[:10], 1):
         print(f"  {i}. {stock['symbol']}: {stock['article_count']} articles")
     
-    # Test 1b: Fetch news for specific symbol
-    if trending:
-        test_symbol = trending[0]['symbol']
-        print(f"\n1b. Fetching news for {test_symbol}...")
-        articles = fetcher.fetch_news_for_symbol(test_symbol, days_back=3)
-        
-        print(f"\nFound {len(articles)} articles for {test_symbol}:")
-        for i, article in enumerate(articles[:5], 1):
+    # Test 1b: News for the top symbol
+    if ctx.test_symbol:
+        print(f"\n1b. Found {len(ctx.articles)} articles for {ctx.test_symbol}:")
+        for i, article in enumerate(ctx.articles[:5], 1):
             print(f"  {i}. {article.title[:80]}")
             print(f"     Source: {article.source}, Published: {article.published_date}")
     
     print("\n✅ News Fetcher test complete\n")
 
 
-def test_sentiment_analyzer():
+async def test_sentiment_analyzer(ctx: SharedFixtures):
     """Test 2: Sentiment analysis."""
-    print("\n" + "="*100)
+    print("\n" + _BAR100)
     print("TEST 2: SENTIMENT ANALYZER")
-    print("="*100)
-    
-    fetcher = NewsFetcher()
-    analyzer = NewsSentimentAnalyzer()
+    print(_BAR100)
     
-    # Get some articles
-    print("\n2a. Fetching articles for sentiment analysis...")
-    trending = fetcher.get_most_talked_about_stocks(min_articles=2, days_back=1)
-    
-    if not trending:
+    if not ctx.test_symbol:
         print("⚠️  No trending stocks found, skipping sentiment test")
         return
     
-    test_symbol = trending[0]['symbol']
-    articles = fetcher.fetch_news_for_symbol(test_symbol, days_back=3)
-    
+    test_symbol, articles, sentiments = ctx.test_symbol, ctx.articles, ctx.sentiments
     if not articles:
         print(f"⚠️  No articles found for {test_symbol}, skipping sentiment test")
         return
     
-    print(f"\n2b. Analyzing sentiment for {len(articles)} articles on {test_symbol}...")
-    sentiments = analyzer.analyze_articles(articles)
+    print(f"\n2a. Analyzed {len(articles)} articles on {test_symbol}")
     
     # Show individual sentiments
     print(f"\nIndividual article sentiments:")
@@ -92,7 +121,7 @@ def test_sentiment_analyzer():
         print(f"     Title: {article.title[:80]}")
     
     # Aggregate sentiment
-    agg_sentiment = analyzer.get_aggregate_sentiment(articles)
+    agg_sentiment = get_default_analyzer().get_aggregate_sentiment(articles)
     print(f"\nAggregate sentiment for {test_symbol}:")
     print(f"  Average sentiment: {agg_sentiment['avg_sentiment']:+.3f}")
     print(f"  Positive ratio: {agg_sentiment['positive_ratio']:.0%}")
@@ -103,16 +132,18 @@ def test_sentiment_analyzer():
     print("\n✅ Sentiment Analyzer test complete\n")
 
 
-def test_news_scorer():
+async def test_news_scorer(ctx: SharedFixtures):
     """Test 3: News scoring system."""
-    print("\n" + "="*100)
-    print("TEST 3: NEWS SCORER")
-    print("="*100)
+    scorer = NewsScorer(session=ctx.session)
+    opportunities = await asyncio.to_thread(
+        scorer.get_top_news_driven_opportunities, min_score=55.0, days_back=2
+    )
     
-    scorer = NewsScorer()
+    print("\n" + _BAR100)
+    print("TEST 3: NEWS SCORER")
+    print(_BAR100)
     
-    print("\n3a. Finding top news-driven opportunities...")
-    opportunities = scorer.get_top_news_driven_opportunities(min_score=55.0, days_back=2)
+    print("\n3a. Top news-driven opportunities:")
     
     if opportunities:
         print(f"\nFound {len(opportunities)} opportunities with score >= 55")
@@ -123,89 +154,57 @@ def test_news_scorer():
     print("\n✅ News Scorer test complete\n")
 
 
-def test_unified_integration():
+async def test_unified_integration(ctx: SharedFixtures):
     """Test 4: Quant + News unified scoring."""
-    print("\n" + "="*100)
-    print("TEST 4: UNIFIED QUANT + NEWS INTEGRATION")
-    print("="*100)
-    
     # Initialize integrator (60% quant, 40% news)
-    integrator = QuantNewsIntegrator(quant_weight=0.60, news_weight=0.40)
-    
-    print("\n4a. Finding best opportunities combining quant + news...")
-    print("     (This may take 1-2 minutes as it analyzes technicals + news)\n")
+    integrator = QuantNewsIntegrator(quant_weight=0.60, news_weight=0.40, session=ctx.session)
     
     try:
-        opportunities = integrator.get_best_opportunities(
+        opportunities = await asyncio.to_thread(
+            integrator.get_best_opportunities,
             min_quant_score=50.0,
             min_news_score=55.0,
             news_days_back=2,
             top_n=15
         )
         
+        print("\n" + _BAR100)
+        print("TEST 4: UNIFIED QUANT + NEWS INTEGRATION")
+        print(_BAR100)
+        print("\n4a. Best opportunities combining quant + news:")
+        
         if opportunities:
             print(f"\nFound {len(opportunities)} unified opportunities")
             display_unified_scores(opportunities, top_n=15)
             
             # Show detailed breakdown for top opportunity
-            if opportunities:
-                top = opportunities[0]
-                print(f"\nDETAILED BREAKDOWN - Top Opportunity: {top.symbol}")
-                print("-" * 80)
-                print(f"  Total Score: {top.total_score:.1f}/100")
-                print(f"  Quant Score: {top.quant_score:.1f}/100 (weight: 60%)")
-                print(f"  News Score: {top.news_score:.1f}/100 (weight: 40%)")
-                print(f"\n  Quant Components:")
-                if top.momentum_score:
-                    print(f"    - Momentum: {top.momentum_score:.1f}/100")
-                if top.mean_reversion_score:
-                    print(f"    - Mean Reversion: {top.mean_reversion_score:.1f}/100")
-                if top.volatility_score:
-                    print(f"    - Volatility: {top.volatility_score:.1f}/100")
-                print(f"\n  News Components:")
-                if top.sentiment_score:
-                    print(f"    - Sentiment: {top.sentiment_score:.1f}/100")
-                if top.catalyst_score:
-                    print(f"    - Catalyst: {top.catalyst_score:.1f}/100")
-                print(f"\n  Signal Analysis:")
-                print(f"    - Unified Signal: {top.unified_signal}")
-                print(f"    - Quant Signal: {top.quant_signal}")
-                print(f"    - News Signal: {top.news_signal}")
-                print(f"    - Confidence: {top.confidence:.0f}%")
-                
-                if top.entry_price:
-                    print(f"\n  Trading Plan:")
-                    print(f"    - Entry: ${top.entry_price:.2f}")
-                    print(f"    - Stop: ${top.stop_price:.2f}")
-                    print(f"    - Target: ${top.target_price:.2f}")
-                    print(f"    - Risk:Reward = 1:{top.risk_reward_ratio:.1f}")
-                
+            print(opportunities[0].format_detailed(quant_weight=0.60, news_weight=0.40))
         else:
             print("⚠️  No unified opportunities found meeting criteria")
     
     except Exception as e:
         print(f"❌ Error during unified integration: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unified integration test failed")
     
     print("\n✅ Unified Integration test complete\n")
 
 
-def test_manual_symbols():
+async def test_manual_symbols(ctx: SharedFixtures):
     """Test 5: Test with specific symbols (AAPL, NVDA, TSLA)."""
-    print("\n" + "="*100)
-    print("TEST 5: MANUAL SYMBOL SCORING (AAPL, NVDA, TSLA)")
-    print("="*100)
-    
     symbols = ['AAPL', 'NVDA', 'TSLA']
     
     # News scoring
-    news_scorer = NewsScorer()
+    news_scorer = NewsScorer(session=ctx.session)
+    batch = await asyncio.to_thread(news_scorer.score_symbols_batch, symbols, days_back=7)
+    
+    print("\n" + _BAR100)
+    print("TEST 5: MANUAL SYMBOL SCORING (AAPL, NVDA, TSLA)")
+    print(_BAR100)
     
     print("\n5a. News scores for manual symbols:")
     news_scores = []
     for symbol in symbols:
-        score = news_scorer.score_symbol(symbol, days_back=7)
+        score = batch[symbol]
         if score:
             news_scores.append(score)
             print(f"\n  {symbol}:")
@@ -225,39 +224,49 @@ def test_manual_symbols():
     print("\n✅ Manual Symbol test complete\n")
 
 
+TESTS = (
+    test_news_fetcher,
+    test_sentiment_analyzer,
+    test_news_scorer,
+    test_unified_integration,
+    test_manual_symbols,
+)
+
+
+async def run_tests(session):
+    """Fetch the shared fixtures once, then run every test concurrently."""
+    ctx = await gather_context(session)
+    # Any failing test cancels the rest
+    async with asyncio.TaskGroup() as tg:
+        for test in TESTS:
+            tg.create_task(test(ctx))
+
+
 def main():
     """Run all tests."""
-    print("\n" + "="*100)
+    print("\n" + _BAR100)
     print("NEWS + QUANT INTEGRATION TEST SUITE")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("="*100)
+    print(_BAR100)
+    
+    # One keep-alive connection pool for every test, so Google News and
+    # Finnhub connections are reused instead of re-handshaking per request
+    session = make_http_session()
     
     try:
-        # Test 1: News Fetcher
-        test_news_fetcher()
-        
-        # Test 2: Sentiment Analysis
-        test_sentiment_analyzer()
-        
-        # Test 3: News Scorer
-        test_news_scorer()
-        
-        # Test 4: Unified Integration
-        test_unified_integration()
-        
-        # Test 5: Manual symbols
-        test_manual_symbols()
+        asyncio.run(run_tests(session))
         
-        print("\n" + "="*100)
+        print("\n" + _BAR100)
         print("✅ ALL TESTS COMPLETE")
-        print("="*100 + "\n")
+        print(_BAR100 + "\n")
         
     except KeyboardInterrupt:
         print("\n\n⚠️  Tests interrupted by user\n")
     except Exception as e:
         print(f"\n\n❌ Test suite failed: {e}\n")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Test suite failed")
+    finally:
+        session.close()
 
 
 if __name__ == "__main__":
@@ -23,12 +23,13 @@ def test_sqlite_migration():
     db_path = "data/test_trade_labs.db"
     os.makedirs("data", exist_ok=True)
 
-    # Always start fresh so this test is repeatable
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    # Always start fresh so this test is repeatable (WAL side files too)
+    for path in (db_path, db_path + "-wal", db_path + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
 
     print("1. Initializing SQLite database...")
-    db = TradeLabsDB(db_path=db_path)
+    db = TradeLabsDB(db_path=db_path, wal=True)
     print(f"✓ Database created/verified: {db_path}")
     print()
 
@@ -36,15 +37,17 @@ def test_sqlite_migration():
 
     run_id = f"test_run_{uuid.uuid4().hex[:8]}"
 
-    run = db.record_run(
-        run_id=run_id,
-        backend="SIM",
-        armed=False,
-        num_scanned=10,
-        num_executed=5,
-        num_successful=3,
-        details={"test": True},
-    )
+    # One transaction (one fsync) for the whole recording block
+    with db.transaction():
+        run = db.record_run(
+            run_id=run_id,
+            backend="SIM",
+            armed=False,
+            num_scanned=10,
+            num_executed=5,
+            num_successful=3,
+            details={"test": True},
+        )
 
     # record_run returns a dict
     print(f"✓ Recorded run: {run.get('run_id', run_id)}")
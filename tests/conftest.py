@@ -1,16 +1,10 @@
-"""Shared pytest fixtures and import-path setup for the mocked-IBKR suite."""
+"""Shared pytest fixtures for the mocked-IBKR suite.
 
-import os
-import sys
-from pathlib import Path
+The repo root is put on sys.path by ``pythonpath = .`` in pytest.ini.
+"""
 
 import pytest
 
-# Ensure the repo root is importable (config/, src/).
-_ROOT = Path(__file__).resolve().parent.parent
-if str(_ROOT) not in sys.path:
-    sys.path.insert(0, str(_ROOT))
-
 
 @pytest.fixture
 def armed_paper(monkeypatch):
@@ -2,15 +2,17 @@
 
 No network, no broker, no ib_insync IB() connection. ``FakeIB`` records every
 ``placeOrder`` call and exposes programmable ``orderStatus`` / ``positions()``
-/ ``openTrades()`` / ``trades()`` / ``reqHistoricalData`` / ``reqContractDetails``
-so tests can assert leg wiring, transmit chaining, fill accounting, and
-degraded-bracket cleanup.
+/ ``openTrades()`` / ``trades()`` / ``reqHistoricalData`` (sync and async) /
+``cancelHistoricalData`` / ``reqContractDetails`` so tests can assert leg
+wiring, transmit chaining, fill accounting, degraded-bracket cleanup,
+concurrent bar fetches and live bar-stream ownership.
 
 The fake mirrors only the surface area the production code touches.
 """
 
 from __future__ import annotations
 
+import asyncio
 import itertools
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
@@ -83,6 +85,13 @@ class FakeIB:
         self._connected = True
         self.reqContractDetails_calls = 0
         self.historical_calls = 0
+        # reqHistoricalData(Async): symbol -> bars (any bar size), per-request
+        # latency, and the most requests seen in flight at once.
+        self.history_bars: Dict[str, list] = {}
+        self.cancelled_history: List[list] = []
+        self.history_delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
 
     # ── connection ──
     def isConnected(self) -> bool:
@@ -105,9 +114,25 @@ class FakeIB:
         self.reqContractDetails_calls += 1
         return [FakeContractDetails(minTick=self.min_tick)]
 
-    def reqHistoricalData(self, *_args, **_kwargs):
+    def reqHistoricalData(self, contract, **_kwargs):
         self.historical_calls += 1
-        return []
+        return list(self.history_bars.get(contract.symbol, []))
+
+    def cancelHistoricalData(self, bars) -> None:
+        self.cancelled_history.append(bars)
+
+    async def qualifyContractsAsync(self, *contracts):
+        return self.qualifyContracts(*contracts)
+
+    async def reqHistoricalDataAsync(self, contract, **_kwargs):
+        self.historical_calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.history_delay)
+            return list(self.history_bars.get(contract.symbol, []))
+        finally:
+            self.in_flight -= 1
 
     # ── orders ──
     def placeOrder(self, contract, order) -> FakeTrade:
@@ -0,0 +1,40 @@
+"""On-disk daily bar cache (src/signals/signal_validator): final vs _rth files."""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from src.signals import signal_validator as sv
+
+pytestmark = pytest.mark.skipif(not sv._PARQUET_OK, reason="pyarrow not installed")
+
+
+def _bars():
+    return pd.DataFrame({"close": [100.0, 101.0], "volume": [1e6, 2e6]})
+
+
+def test_pre_close_write_expires_after_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr(sv, "_DAILY_DISK_DIR", tmp_path)
+    monkeypatch.setattr(sv, "_session_closed", lambda: False)
+    sv._save_daily_disk("AAPL", _bars())
+
+    final, rth = sv._daily_disk_paths("AAPL")
+    assert rth.exists() and not final.exists()
+    assert sv._load_daily_disk("AAPL") is not None
+
+    stale = time.time() - sv._TTL_DAILY - 1
+    os.utime(rth, (stale, stale))
+    assert sv._load_daily_disk("AAPL") is None
+
+
+def test_post_close_write_is_final(tmp_path, monkeypatch):
+    monkeypatch.setattr(sv, "_DAILY_DISK_DIR", tmp_path)
+    monkeypatch.setattr(sv, "_session_closed", lambda: True)
+    sv._save_daily_disk("AAPL", _bars())
+
+    final, _ = sv._daily_disk_paths("AAPL")
+    stale = time.time() - sv._TTL_DAILY - 1
+    os.utime(final, (stale, stale))
+    assert sv._load_daily_disk("AAPL")["close"].tolist() == [100.0, 101.0]
@@ -0,0 +1,35 @@
+"""Environment log-level overrides (src/utils/logging.apply_env_levels)."""
+
+import importlib
+import logging
+
+import pytest
+
+from src.utils.logging import apply_env_levels
+
+_SCORER = logging.getLogger("src.signals.score_candidates")
+
+
+@pytest.fixture(autouse=True)
+def _restore_level():
+    level = _SCORER.level
+    yield
+    _SCORER.setLevel(level)
+
+
+def test_importing_the_engine_leaves_the_scorer_level_alone(monkeypatch):
+    monkeypatch.setenv("TL_SCORE_LOG_LEVEL", "not-a-level")
+    _SCORER.setLevel(logging.WARNING)
+    import src.signals.signal_engine as engine
+    importlib.reload(engine)
+    assert _SCORER.level == logging.WARNING
+
+
+def test_override_is_applied_and_bad_values_ignored(monkeypatch):
+    monkeypatch.setenv("TL_SCORE_LOG_LEVEL", "debug")
+    apply_env_levels()
+    assert _SCORER.level == logging.DEBUG
+
+    monkeypatch.setenv("TL_SCORE_LOG_LEVEL", "not-a-level")
+    apply_env_levels()
+    assert _SCORER.level == logging.DEBUG
@@ -0,0 +1,42 @@
+"""Concurrent candidate bar fetch (src/signals/run_full_pipeline._fetch_candidates)."""
+
+import asyncio
+from datetime import date, timedelta
+
+from ib_insync import BarData
+
+from src.data.market_data_cache import MarketDataCache
+from src.signals import run_full_pipeline as rfp
+from tests.fake_ib import FakeIB
+
+
+def _bars(n=30, start=50.0):
+    d0 = date(2026, 1, 2)
+    return [
+        BarData(date=d0 + timedelta(days=i), open=start + i, high=start + i + 1,
+                low=start + i - 1, close=start + i + 0.5, volume=1000, average=start + i, barCount=10)
+        for i in range(n)
+    ]
+
+
+def test_fetch_is_bounded_cached_and_isolates_a_failing_symbol():
+    ib = FakeIB()
+    ib.history_delay = 0.02
+    good = ["AAA", "BBB", "CCC", "DDD", "EEE"]
+    for s in good:
+        ib.history_bars[s] = _bars()
+    cache = MarketDataCache()
+
+    out = asyncio.run(rfp._fetch_candidates(ib, good + ["BAD"], concurrency=2, cache=cache))
+
+    assert list(out) == good + ["BAD"]
+    assert isinstance(out["BAD"], RuntimeError)
+    price, daily = out["AAA"]
+    assert price == 79.5 and len(daily) == 30
+    # 2 symbols at a time, each with its 1-min and daily request in flight
+    assert ib.max_in_flight == 4
+    assert ib.historical_calls == 12
+
+    again = asyncio.run(rfp._fetch_candidates(ib, ["AAA", "BAD"], cache=cache))
+    assert again["AAA"][0] == 79.5
+    assert ib.historical_calls == 14  # AAA from cache; empty BAD not cached
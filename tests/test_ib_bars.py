@@ -0,0 +1,57 @@
+"""Live 1-min bar streams (src/signals/_ib_bars.fetch_intraday_1m)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from ib_insync import BarData
+
+from src.signals import _ib_bars
+from tests.fake_ib import FakeIB
+
+
+def _bars(n=5):
+    t0 = datetime(2026, 1, 2, 10, 0)
+    return [
+        BarData(date=t0 + timedelta(minutes=i), open=10.0, high=11.0, low=9.0,
+                close=10.5, volume=100, average=10.0, barCount=5)
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _no_streams():
+    _ib_bars._intraday_1m_subs.clear()
+    yield
+    _ib_bars._intraday_1m_subs.clear()
+
+
+def _ib():
+    ib = FakeIB()
+    ib.history_bars["AAPL"] = _bars()
+    return ib
+
+
+def test_stream_is_reused_on_the_owning_connection():
+    ib = _ib()
+    _ib_bars.fetch_intraday_1m(ib, "AAPL")
+    df = _ib_bars.fetch_intraday_1m(ib, "AAPL")
+    assert len(df) == 5
+    assert ib.historical_calls == 1
+
+
+def test_reconnect_resubscribes_on_the_new_connection():
+    old = _ib()
+    _ib_bars.fetch_intraday_1m(old, "AAPL")
+    stale = _ib_bars._intraday_1m_subs["AAPL"][1]
+
+    new = _ib()
+    _ib_bars.fetch_intraday_1m(new, "AAPL")
+    assert new.historical_calls == 1
+    assert _ib_bars._intraday_1m_subs["AAPL"][0] is new
+    assert old.cancelled_history == [stale]
+
+    new.disconnect()
+    newest = _ib()
+    _ib_bars.fetch_intraday_1m(newest, "AAPL")
+    assert newest.historical_calls == 1
+    assert new.cancelled_history == []
@@ -0,0 +1,26 @@
+"""PipelineLogger (src/utils/log_manager): per-stage flushing, reopen after close."""
+
+import json
+
+from src.utils.log_manager import PipelineLogger
+
+
+def _on_disk(lg):
+    with open(lg.filepath, encoding="utf-8") as f:
+        return [json.loads(line)["event"] for line in f]
+
+
+def test_stage_events_reach_disk_before_close(tmp_path):
+    lg = PipelineLogger(name="t", log_dir=str(tmp_path))
+    lg.scan_started("r1")
+    lg.log("candidate_scored")
+    lg.execution_completed("r1", "AAPL", 10, 100.0, 95.0)
+    assert _on_disk(lg) == ["scan_started", "candidate_scored", "execution_completed"]
+
+    lg.pipeline_completed("r1", 1, 1)
+    assert lg._fh is None
+
+    with lg:
+        lg.scan_started("r2")
+    assert lg._fh is None
+    assert _on_disk(lg)[-2:] == ["pipeline_completed", "scan_started"]
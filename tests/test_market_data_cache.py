@@ -0,0 +1,28 @@
+"""Shared market-data cache (src/data/market_data_cache): TTL per kind, LRU bound."""
+
+from src.data import market_data_cache as mdc
+
+
+def test_values_expire_after_their_kind_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(mdc.time, "monotonic", lambda: now[0])
+    cache = mdc.MarketDataCache()
+    cache.put("AAPL", "ticker", 101.5)
+    cache.put("AAPL", "bars_1d", "frame")
+
+    now[0] += 9.0
+    assert cache.get("AAPL", "ticker") == 101.5
+    now[0] += 2.0  # ticker TTL (10 s) passed, bars (60 s) still fresh
+    assert cache.get("AAPL", "ticker") is None
+    assert cache.get("AAPL", "bars_1d") == "frame"
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = mdc.MarketDataCache(maxsize=2)
+    cache.put("A", "ticker", 1.0)
+    cache.put("B", "ticker", 2.0)
+    cache.get("A", "ticker")
+    cache.put("C", "ticker", 3.0)
+    assert cache.get("B", "ticker") is None
+    assert cache.get("A", "ticker") == 1.0 and cache.get("C", "ticker") == 3.0
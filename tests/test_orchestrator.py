@@ -0,0 +1,143 @@
+"""TradeLabsOrchestrator (trade_labs_orchestrator): scheduled jobs and report saving."""
+
+import asyncio
+import time
+
+import pytest
+
+import trade_labs_orchestrator as tlo
+
+
+@pytest.fixture
+def orch(tmp_path, monkeypatch):
+    monkeypatch.setattr(tlo, "_COALESCE_WINDOW_S", 0.05)
+    o = tlo.TradeLabsOrchestrator(
+        {"db_dir": str(tmp_path / "db"), "log_dir": str(tmp_path / "logs")}
+    )
+    yield o
+    o.close()
+
+
+def test_jobs_firing_together_run_concurrently_with_own_results(orch):
+    running = []
+
+    async def run_pipeline(num_candidates=5):
+        running.append("scan")
+        await asyncio.sleep(0.05)
+        return {"scan": num_candidates, "overlapped": len(running) == 2}
+
+    async def reconcile_positions():
+        running.append("reconcile")
+        await asyncio.sleep(0.05)
+        raise RuntimeError("IB down")
+
+    orch.run_pipeline = run_pipeline
+    orch.reconcile_positions = reconcile_positions
+
+    async def main():
+        return await asyncio.gather(
+            orch._scheduled("run_pipeline", num_candidates=3),
+            orch._scheduled("reconcile_positions"),
+            return_exceptions=True,
+        )
+
+    scan, reconcile = asyncio.run(main())
+    assert scan == {"scan": 3, "overlapped": True}
+    assert isinstance(reconcile, RuntimeError)
+
+
+def test_long_job_does_not_hold_up_a_later_batch(orch):
+    finished = []
+
+    async def run_pipeline(num_candidates=5):
+        await asyncio.sleep(0.5)
+        finished.append("scan")
+
+    async def generate_daily_report(date=None):
+        finished.append("report")
+
+    orch.run_pipeline = run_pipeline
+    orch.generate_daily_report = generate_daily_report
+
+    async def main():
+        scan = asyncio.ensure_future(orch._scheduled("run_pipeline"))
+        await asyncio.sleep(0.1)  # past the batching window
+        await orch._scheduled("generate_daily_report")
+        await scan
+
+    asyncio.run(main())
+    assert finished == ["report", "scan"]
+
+
+def test_failed_parquet_rollup_keeps_the_saved_report(orch, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def broken_rollup():
+        raise OSError("disk full")
+
+    monkeypatch.setattr(orch.db, "rollup_parquet", broken_rollup)
+    report = asyncio.run(orch.generate_daily_report("2026-01-05"))
+    assert "error" not in report
+    assert (tmp_path / "data" / "reports" / "report_2026-01-05.md").exists()
+
+
+def _fake_pipeline(n):
+    """run_full_pipeline stand-in recording *n* candidates and a run."""
+    def run_full_pipeline(ib, db, **kwargs):
+        for i in range(n):
+            db.record_candidate(
+                run_id="r1", symbol=f"S{i}", side="BUY", entry_price=10.0, quantity=1,
+                stop_loss=9.0, rationale="", backend="SIM", armed=False,
+            )
+        db.record_pipeline_run(
+            run_id="r1", backend="SIM", armed=False, num_candidates_scanned=n,
+            num_candidates_executed=0, num_successful=0, details={},
+        )
+        return {"ok": True}
+    return run_full_pipeline
+
+
+@pytest.fixture
+def pipeline(orch, monkeypatch):
+    import src.signals.run_full_pipeline as rfp
+
+    monkeypatch.setattr(orch, "_get_ib", lambda: None)
+    monkeypatch.setattr(tlo, "_DB_RETRY_S", 0.01)
+
+    def run(n, write_lines=None):
+        monkeypatch.setattr(rfp, "run_full_pipeline", _fake_pipeline(n))
+        if write_lines:
+            monkeypatch.setattr(orch.db, "_write_lines", write_lines)
+        return asyncio.run(orch.run_pipeline())
+    return run
+
+
+def _on_disk(orch):
+    fresh = tlo.TradeHistoryDB(str(orch.db.db_dir))
+    return [c["symbol"] for c in fresh.get_candidate_history(limit=1000)], len(fresh.get_run_history())
+
+
+def test_run_pipeline_returns_after_its_records_are_on_disk(orch, pipeline):
+    real = orch.db._write_lines
+
+    def slow_write(*args, **kwargs):
+        time.sleep(0.02)
+        real(*args, **kwargs)
+
+    assert pipeline(150, slow_write) == {"ok": True}  # 150 > one 64-event batch
+    assert _on_disk(orch) == ([f"S{i}" for i in range(150)], 1)
+
+
+def test_failed_trade_log_write_is_retried_in_order(orch, pipeline):
+    real = orch.db._write_lines
+    calls = []
+
+    def flaky_write(*args, **kwargs):
+        calls.append(args[0].name)
+        if len(calls) == 1:
+            raise OSError("disk full")
+        real(*args, **kwargs)
+
+    pipeline(10, flaky_write)
+    assert _on_disk(orch) == ([f"S{i}" for i in range(10)], 1)
+    assert calls[:2] == ["candidates.jsonl", "candidates.jsonl"]
@@ -0,0 +1,33 @@
+"""Per-host HTTP limiter (src/utils/rate_limit): token bucket and 429 retry."""
+
+import time
+from types import SimpleNamespace
+
+from src.utils import rate_limit as rl
+
+
+def test_token_bucket_blocks_once_burst_is_spent():
+    limiter = rl.RateLimiter(rate=5, per=0.25, max_concurrent=2)
+    start = time.monotonic()
+    for _ in range(6):  # 5 from the full bucket, the 6th waits ~50 ms
+        with limiter:
+            pass
+    assert time.monotonic() - start >= 0.04
+
+
+def test_get_with_backoff_retries_429_honouring_retry_after(monkeypatch):
+    replies = [
+        SimpleNamespace(status_code=429, headers={"Retry-After": "0"}),
+        SimpleNamespace(status_code=200, headers={}),
+    ]
+    calls = []
+
+    class Http:
+        def get(self, url, **kwargs):
+            calls.append((url, kwargs))
+            return replies[len(calls) - 1]
+
+    monkeypatch.setattr(rl.time, "sleep", lambda s: None)
+    resp = rl.get_with_backoff(Http(), "https://finnhub.io/api/v1/x", timeout=5)
+    assert resp.status_code == 200
+    assert len(calls) == 2 and calls[0][1] == {"timeout": 5}
@@ -0,0 +1,57 @@
+"""Indicator kernels (src/quant/technical_indicators) vs plain-Python loops."""
+
+import numpy as np
+import pytest
+
+from src.quant.technical_indicators import TechnicalIndicators
+
+
+def _ref_ema(prices, period):
+    mult = 2.0 / (period + 1)
+    ema = sum(prices[:period]) / period
+    for p in prices[period:]:
+        ema = p * mult + ema * (1 - mult)
+    return ema
+
+
+def _ref_atr(highs, lows, closes, period):
+    tr = [
+        max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+        for i in range(-period, 0)
+    ]
+    return sum(tr) / period
+
+
+def _ref_cmf(highs, lows, closes, volumes, period):
+    flow = sum(
+        0.0 if h == l else ((c - l) - (h - c)) / (h - l) * v
+        for h, l, c, v in zip(highs[-period:], lows[-period:], closes[-period:], volumes[-period:])
+    )
+    vol = sum(volumes[-period:])
+    return flow / vol if vol else 0.0
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(7)
+    closes = 80.0 * np.cumprod(1.0 + rng.normal(0.0005, 0.015, 250))
+    spread = closes * rng.uniform(0.002, 0.02, 250)
+    highs, lows = closes + spread, closes - spread
+    highs[-3] = lows[-3] = closes[-3]  # a flat bar (CMF's h == l branch)
+    volumes = rng.integers(100_000, 2_000_000, 250).astype(float)
+    return [a.tolist() for a in (highs, lows, closes, volumes)]
+
+
+def test_kernels_match_plain_python(bars):
+    highs, lows, closes, volumes = bars
+    ti = TechnicalIndicators()
+
+    for period in (9, 20, 50):
+        assert np.isclose(ti.calculate_ema(closes, period), _ref_ema(closes[-period:], period), rtol=1e-12)
+        assert np.isclose(ti._ema(np.asarray(closes), period), _ref_ema(closes, period), rtol=1e-12)
+    assert np.isclose(ti.calculate_atr(highs, lows, closes, 14), _ref_atr(highs, lows, closes, 14), rtol=1e-12)
+    assert np.isclose(
+        ti.calculate_chaikin_money_flow(highs, lows, closes, volumes, 20),
+        _ref_cmf(highs, lows, closes, volumes, 20),
+        rtol=1e-12,
+    )
@@ -0,0 +1,125 @@
+"""TradeHistoryDB (src/utils/trade_history_db): JSONL reads, cached stats, Parquet mirror."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.trade_history_db import TradeHistoryDB
+
+
+def test_tail_keeps_first_record_when_block_starts_on_newline(tmp_path):
+    # 255-byte lines: the last 64 KiB block (65535 = 257 * 255, plus one)
+    # begins exactly on the newline ending record 42 of 300.
+    db = TradeHistoryDB(str(tmp_path))
+    with open(db.runs_file, "w") as f:
+        for i in range(300):
+            line = json.dumps({"i": i, "pad": ""}, separators=(",", ":"))
+            f.write(line[:-2] + "x" * (254 - len(line)) + '"}\n')
+    assert db.runs_file.stat().st_size - (1 << 16) == 43 * 255 - 1
+
+    tail = db._tail_jsonl(db.runs_file, 257)
+    assert [r["i"] for r in tail] == list(range(43, 300))
+    assert [r["i"] for r in db._tail_jsonl(db.runs_file, 2)] == [298, 299]
+
+
+def _fill(order_id):
+    return SimpleNamespace(ok=True, message="", parent_order_id=order_id, stop_order_id=None)
+
+
+def _trade(db, order_id, side="BUY"):
+    db.record_trade(
+        run_id="r1", symbol="AAPL", side=side, entry_price=100.0, quantity=2,
+        stop_loss=95.0, order_result=_fill(order_id),
+    )
+
+
+def test_incremental_stats_match_a_fresh_count(tmp_path):
+    db = TradeHistoryDB(str(tmp_path))
+
+    def fresh():
+        return TradeHistoryDB(str(tmp_path)).get_stats()
+
+    assert db.get_stats() == fresh()
+    for oid in range(1, 6):
+        _trade(db, oid, side="SELL" if oid == 5 else "BUY")
+    db.record_pipeline_run("r1", "SIM", False, 5, 5, 5, {})
+    assert db.get_stats() == fresh()
+
+    db.close_trade(2, 90.0)
+    db.close_trade(2, 105.0)  # re-close replaces the first P&L
+    assert db.get_stats() == fresh()
+
+    closed = db.close_trades_bulk([1, 1, 99, 5], [110.0, 120.0, 1.0, 90.0])
+    assert [t["order_id"] for t in closed] == [1, 5]
+    assert closed[0]["exit_price"] == 120.0
+    stats = db.get_stats()
+    assert stats == fresh()
+    assert stats["total_pnl"] == 40.0 + 10.0 + 20.0
+
+    with db.batched():
+        _trade(db, 6)
+        db.record_pipeline_run("r2", "SIM", False, 1, 1, 1, {})
+        assert db.get_stats()["total_trades"] == 6
+    assert db.get_stats() == fresh()
+
+    _trade(TradeHistoryDB(str(tmp_path)), 7)  # another writer
+    assert db.get_stats() == fresh()
+    assert db.get_stats()["open_trades"] == 4
+
+
+def test_getters_hand_out_copies(tmp_path):
+    db = TradeHistoryDB(str(tmp_path))
+    _trade(db, 1)
+    db.record_pipeline_run("r1", "SIM", False, 1, 1, 1, {})
+    stats = db.get_stats()
+
+    db.get_trade_history()[0]["status"] = "CLOSED"
+    db.get_trade_history(status="OPEN")[0]["pnl"] = 1e6
+    db.get_run_history()[0]["run_id"] = "edited"
+
+    assert db.get_trade_history()[0]["status"] == "OPEN"
+    assert db.get_trade_history()[0].get("pnl") != 1e6
+    assert db.get_run_history()[0]["run_id"] == "r1"
+    assert db.get_stats() == stats
+
+
+def test_parquet_rollup_reads_back_closed_trades(tmp_path):
+    pytest.importorskip("pyarrow")
+    db = TradeHistoryDB(str(tmp_path))
+    for oid in range(1, 4):
+        _trade(db, oid)
+    db.close_trades_bulk([1, 3], [110.0, 90.0])
+
+    assert db.closed_trades_table() is None  # no mirror yet
+    assert db.rollup_parquet() is True
+    table = db.closed_trades_table()
+    rows = sorted(table.select(["order_id", "pnl", "status"]).to_pylist(), key=lambda r: r["order_id"])
+    assert rows == [
+        {"order_id": 1, "pnl": 20.0, "status": "CLOSED"},
+        {"order_id": 3, "pnl": -20.0, "status": "CLOSED"},
+    ]
+
+    db.close_trade(2, 105.0)
+    db.rollup_parquet()  # partitions are replaced, not appended to
+    assert db.closed_trades_table().num_rows == 3
+
+
+def test_daily_summary_matches_a_date_prefix(tmp_path):
+    db = TradeHistoryDB(str(tmp_path))
+    rows = [
+        ("2026-09-30T23:59:59", 5.0),
+        ("2026-10-01T09:30:00", 10.0),
+        ("2026-10-01T15:00:00", -4.0),
+        ("2026-10-31T12:00:00", 6.0),
+        ("2026-11-01T00:00:00", 100.0),
+    ]
+    with open(db.trades_file, "w") as f:
+        for i, (ts, pnl) in enumerate(rows):
+            f.write(json.dumps({"order_id": i, "symbol": "AAPL", "status": "CLOSED",
+                                "pnl": pnl, "entry_timestamp": ts}) + "\n")
+
+    day = db.get_daily_summary("2026-10-01")
+    assert (day["trades"], day["total_pnl"], day["wins"]) == (2, 6.0, 1)
+    month = db.get_daily_summary("2026-10")
+    assert (month["trades"], month["total_pnl"]) == (3, 12.0)
@@ -9,21 +9,97 @@ Master control module that integrates:
 - Scheduled operations
 
 This is the main entry point for running the complete trading system.
+
+The operations are coroutines on one asyncio loop.  ib_insync's blocking
+API needs an event loop of its own on the calling thread, so all IB work
+runs on a dedicated single-thread executor; report building and file
+writes go through ``asyncio.to_thread``.  A scheduled scan can therefore
+wait on IB while a report is written, and the command prompt stays
+responsive throughout.
 """
 
+import asyncio
+import contextlib
+import functools
+import logging
 import os
+import stat
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Tuple, TYPE_CHECKING
 
 from config.identity import SYSTEM_NAME, HUMAN_NAME
-from src.signals.run_full_pipeline import run_full_pipeline
 from src.utils.log_manager import setup_logging, PipelineLogger
+from src.utils.logging import apply_env_levels
 from src.utils.trade_history_db import TradeHistoryDB
-from src.utils.report_generator import ReportGenerator
-from src.utils.position_reconciler import PositionReconciler
-from src.utils.scheduler import create_standard_schedule, PipelineScheduler
-from src.data.ib_market_data import connect_ib
-from src.risk.daily_pnl_manager import get_kill_switch_status
+from src.data.market_data_cache import MarketDataCache
+
+# The pipeline (pandas, scanners), IB, the reconciler and the scheduler
+# (market calendars) are imported where they are first used, so a mode
+# only loads what it runs.
+if TYPE_CHECKING:
+    from src.utils.position_reconciler import PositionReconciler
+    from src.utils.report_generator import ReportGenerator
+    from src.utils.scheduler import PipelineScheduler
+
+# Banners and progress are console output: they go to stdout on this
+# module's own handler, whatever the host does with the root logger.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _console = logging.StreamHandler(sys.stdout)
+    _console.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_console)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def _banner(title: str) -> None:
+    """Section header, logged as one record rather than a burst of prints."""
+    rule = "=" * 60
+    logger.info("\n%s\n%s\n%s\n", rule, title, rule)
+
+
+def _ib_thread_init() -> None:
+    """Give the IB worker thread the event loop ib_insync's sync calls use."""
+    asyncio.set_event_loop(asyncio.new_event_loop())
+
+
+# Trade-log writer queue: capacity, and events written per batched() block.
+_DB_QUEUE_SIZE = 1024
+_DB_BATCH = 64
+# Retries of a failed trade-log batch, and the backoff step between them.
+_DB_RETRIES = 3
+_DB_RETRY_S = 0.5
+
+# Scheduled jobs firing within this many seconds of the first one are run
+# as one batch (see _coalescer).
+_COALESCE_WINDOW_S = 0.5
+
+
+class _QueuedWrites:
+    """
+    TradeHistoryDB stand-in handed to the pipeline on the IB thread.
+
+    record_* calls become ``(method, kwargs)`` events for the orchestrator's
+    writer task, so the IB thread never waits on the disk.  Return values
+    are not available (the pipeline doesn't use them).
+    """
+    
+    __slots__ = ("_put",)
+    
+    def __init__(self, put: Callable[[Tuple[str, Dict[str, Any]]], None]):
+        self._put = put
+    
+    def record_pipeline_run(self, **kwargs) -> None:
+        self._put(("record_pipeline_run", kwargs))
+    
+    def record_trade(self, **kwargs) -> None:
+        self._put(("record_trade", kwargs))
+    
+    def record_candidate(self, **kwargs) -> None:
+        self._put(("record_candidate", kwargs))
 
 
 class TradeLabsOrchestrator:
@@ -43,32 +119,225 @@ class TradeLabsOrchestrator:
         
         # Initialize components
         self.db = TradeHistoryDB(self.config.get("db_dir", "data/trade_history"))
-        self.reporter = ReportGenerator(self.db)
-        self.reconciler = PositionReconciler(self.db)
+        # Quotes and bars shared by the pipeline and reconciliation, so jobs
+        # close together in time don't ask IB for the same data twice.
+        self.market_cache = MarketDataCache()
         self.scheduler = None
+        # Every IB call runs here, one at a time: ib_insync objects belong
+        # to the loop of the thread that created them.
+        self._ib_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ib", initializer=_ib_thread_init
+        )
+        # Long-lived IB connection, created and used on the IB thread only
+        # (see _get_ib); closed by close().
+        self._ib = None
+        # Trade-log events from the IB thread and the task writing them;
+        # both belong to one event loop (see _db_writes).
+        self._db_queue: Optional[asyncio.Queue] = None
+        self._db_writer: Optional[asyncio.Task] = None
+        # Scheduled jobs waiting for the coalescer, and the coalescer task;
+        # both belong to the scheduler's loop (see _scheduled).
+        self._pending: Optional[asyncio.Queue] = None
+        self._coalescer_task: Optional[asyncio.Task] = None
+        # Running batches, referenced so they aren't garbage-collected.
+        self._batches: set = set()
         
         # Setup logging
-        import inspect as _insp
-        import src.utils.log_manager as _lm
-        print(f"[DIAG] log_manager loaded from: {_lm.__file__}")
-        print(f"[DIAG] setup_logging signature: {_insp.signature(_lm.setup_logging)}")
+        if os.environ.get("TRADE_LABS_DIAG") == "1":
+            import inspect as _insp
+            import src.utils.log_manager as _lm
+            logger.info("[DIAG] log_manager loaded from: %s", _lm.__file__)
+            logger.info("[DIAG] setup_logging signature: %s", _insp.signature(_lm.setup_logging))
         setup_logging(
             "trade_labs_orchestrator",
             log_dir=self.config.get("log_dir", "logs/pipeline"),
         )
         self.logger = PipelineLogger.get_logger()
         
-        print(f"\n{'='*60}")
-        print(f"{SYSTEM_NAME} → {HUMAN_NAME}: ORCHESTRATOR v1")
-        print(f"{'='*60}\n")
-        print(f"Mode: {os.getenv('TRADE_LABS_MODE', 'PAPER')}")
-        print(f"Backend: {os.getenv('TRADE_LABS_EXECUTION_BACKEND', 'SIM')}")
-        print(f"Armed: {os.getenv('TRADE_LABS_ARMED', '0')}")
+        _banner(f"{SYSTEM_NAME} → {HUMAN_NAME}: ORCHESTRATOR v1")
+        logger.info(
+            "Mode: %s\nBackend: %s\nArmed: %s\n",
+            os.getenv("TRADE_LABS_MODE", "PAPER"),
+            os.getenv("TRADE_LABS_EXECUTION_BACKEND", "SIM"),
+            os.getenv("TRADE_LABS_ARMED", "0"),
+        )
         if os.getenv("TRADE_LABS_ARMED", "0") == "1":
-            print("WARNING: TRADE_LABS_ARMED=1 (IB paper orders can be submitted).")
-        print()
+            logger.warning("WARNING: TRADE_LABS_ARMED=1 (IB paper orders can be submitted).")
+    
+    @functools.cached_property
+    def reporter(self) -> "ReportGenerator":
+        from src.utils.report_generator import ReportGenerator
+        return ReportGenerator(self.db)
+    
+    @functools.cached_property
+    def reconciler(self) -> "PositionReconciler":
+        from src.utils.position_reconciler import PositionReconciler
+        return PositionReconciler(self.db, cache=self.market_cache)
+    
+    async def _on_ib_thread(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run blocking IB code *fn* on the IB thread and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._ib_pool, functools.partial(fn, *args, **kwargs)
+        )
+    
+    def _get_ib(self):
+        """
+        The orchestrator's IB connection, (re)connected on demand.
+
+        Pipeline runs, reconciliations and stats all reuse one socket
+        instead of paying connect + handshake each time.  IB thread only.
+        """
+        ib = self._ib
+        if ib is not None and ib.isConnected():
+            return ib
+        if ib is not None:
+            ib.disconnect()  # dropped by TWS; clear it before reconnecting
+            self._ib = None
+        from src.data.ib_market_data import connect_ib
+        self._ib = connect_ib()
+        return self._ib
+    
+    def _db_writes(self) -> asyncio.Queue:
+        """
+        Trade-log queue for the running loop, starting its writer if needed.
+
+        One writer task owns every pipeline write: producers only enqueue,
+        and the writer applies up to _DB_BATCH events per db.batched()
+        block on a worker thread, i.e. one append per file per batch.
+        """
+        loop = asyncio.get_running_loop()
+        if self._db_writer is None or self._db_writer.done() or self._db_writer.get_loop() is not loop:
+            self._db_queue = asyncio.Queue(maxsize=_DB_QUEUE_SIZE)
+            self._db_writer = loop.create_task(self._db_writer_loop(self._db_queue))
+        return self._db_queue
+    
+    async def _db_writer_loop(self, queue: asyncio.Queue):
+        while True:
+            events = [await queue.get()]
+            while len(events) < _DB_BATCH and not queue.empty():
+                events.append(queue.get_nowait())
+            try:
+                await self._write_with_retry(events)
+            finally:
+                for _ in events:
+                    queue.task_done()
+    
+    async def _write_with_retry(self, events: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Write *events*, retrying what is left after a failure with backoff.
+
+        An event still failing after _DB_RETRIES retries is dropped (and
+        logged) so the ones behind it go out; records whose flush keeps
+        failing stay buffered in the db for the next batch or close().
+        """
+        attempt = 0
+        while True:
+            events, ok = await asyncio.to_thread(self._write_events, events)
+            if ok:
+                return
+            if attempt == _DB_RETRIES:
+                if not events:
+                    logger.error("Trade-log flush still failing; records stay buffered")
+                    return
+                logger.error(
+                    "Dropping trade-log %s after %d failed attempts: %r",
+                    events[0][0], attempt + 1, events[0][1],
+                )
+                events, attempt = events[1:], 0
+                continue
+            attempt += 1
+            await asyncio.sleep(_DB_RETRY_S * attempt)
+    
+    def _write_events(
+        self, events: List[Tuple[str, Dict[str, Any]]]
+    ) -> Tuple[List[Tuple[str, Dict[str, Any]]], bool]:
+        """
+        Apply *events* in order in one db.batched() block.
+
+        Returns (events not applied, whether everything reached disk).  On
+        an error the events before it are still flushed, and records whose
+        flush failed stay buffered in the db for the retry's flush, so a
+        retry never writes anything twice or out of order.
+        """
+        done = 0
+        try:
+            with self.db.batched():
+                for method, kwargs in events:
+                    getattr(self.db, method)(**kwargs)
+                    done += 1
+        except Exception:
+            logger.exception(
+                "Trade-log write failed; %d event(s) kept for retry", len(events) - done
+            )
+            return events[done:], False
+        return [], True
+    
+    async def _scheduled(self, op: str, **kwargs) -> Any:
+        """
+        Scheduler entry point: queue orchestrator method *op* for the
+        coalescer and wait for its result.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._coalescer_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._pending = asyncio.Queue()
+            self._coalescer_task = loop.create_task(self._coalescer(self._pending))
+        done = loop.create_future()
+        await self._pending.put((op, kwargs, done))
+        return await done
+    
+    async def _coalescer(self, pending: asyncio.Queue):
+        """
+        Start scheduled jobs in batches.
+
+        Jobs that fire together (e.g. a custom job sharing a scan's minute)
+        are collected for _COALESCE_WINDOW_S after the first and started as
+        one batch; its IB work still takes turns on the IB thread.  Batches
+        are not awaited here, so a long scan never holds up a later job.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await pending.get()]
+            deadline = loop.time() + _COALESCE_WINDOW_S
+            while (left := deadline - loop.time()) > 0:
+                try:
+                    batch.append(await asyncio.wait_for(pending.get(), left))
+                except asyncio.TimeoutError:
+                    break
+            if len(batch) > 1:
+                logger.info("Batched %d scheduled jobs", len(batch))
+            task = loop.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[str, Dict[str, Any], asyncio.Future]]):
+        """Run one batch's jobs concurrently and hand each its own result."""
+        results = await asyncio.gather(
+            *(getattr(self, op)(**kwargs) for op, kwargs, _ in batch),
+            return_exceptions=True,
+        )
+        for (_, _, done), result in zip(batch, results):
+            if done.done():
+                continue
+            if isinstance(result, asyncio.CancelledError):
+                done.cancel()
+            elif isinstance(result, BaseException):
+                done.set_exception(result)
+            else:
+                done.set_result(result)
+    
+    def _run_pipeline_ib(self, put, **kwargs) -> Dict[str, Any]:
+        """
+        run_full_pipeline on the shared connection (runs on the IB thread).
+
+        Its records go through *put* to the writer task instead of being
+        written here, keeping disk I/O off the IB thread.
+        """
+        from src.signals.run_full_pipeline import run_full_pipeline
+        return run_full_pipeline(ib=self._get_ib(), db=_QueuedWrites(put), **kwargs)
     
-    def run_pipeline(
+    async def run_pipeline(
         self,
         num_candidates: int = 5,
         use_spy_only: bool = False,
@@ -79,17 +348,32 @@ class TradeLabsOrchestrator:
         Returns:
             Pipeline execution results
         """
+        queue = self._db_writes()
+        loop = asyncio.get_running_loop()
+        
+        def put(event):
+            # From the IB thread: hand the put to the loop and move on.  A
+            # full queue parks the put (in order) rather than blocking IB.
+            asyncio.run_coroutine_threadsafe(queue.put(event), loop)
+        
         try:
-            result = run_full_pipeline(
+            result = await self._on_ib_thread(
+                self._run_pipeline_ib,
+                put,
                 num_candidates=num_candidates,
                 use_spy_only=use_spy_only,
+                fetch_concurrency=self.config.get("fetch_concurrency", 8),
+                market_cache=self.market_cache,
             )
             return result
         except Exception as e:
             print(f"Error running pipeline: {str(e)}")
             return {"ok": False, "error": str(e)}
+        finally:
+            # The run's records are on disk by the time it returns.
+            await queue.join()
     
-    def reconcile_positions(self) -> Dict[str, Any]:
+    async def reconcile_positions(self) -> Dict[str, Any]:
         """
         Reconcile open positions with IB.
         
@@ -97,23 +381,44 @@ class TradeLabsOrchestrator:
             Reconciliation results
         """
         try:
-            print(f"\n{'='*60}")
-            print("Position Reconciliation")
-            print(f"{'='*60}\n")
+            _banner("Position Reconciliation")
             
-            ib = connect_ib()
-            reconciliation = self.reconciler.reconcile(ib)
-            ib.disconnect()
+            reconciliation = await self._on_ib_thread(
+                lambda: self.reconciler.reconcile(self._get_ib())
+            )
             
             self.reconciler.display_reconciliation(reconciliation)
-            self.reconciler.export_reconciliation_json(reconciliation)
+            await asyncio.to_thread(self.reconciler.export_reconciliation_json, reconciliation)
             
             return reconciliation
         except Exception as e:
             print(f"Error reconciling positions: {str(e)}")
             return {"error": str(e), "status": "ERROR"}
     
-    def generate_daily_report(self, date: Optional[str] = None) -> Dict[str, Any]:
+    async def _save_report(self, report: Dict[str, Any]) -> None:
+        """
+        Write the Markdown and CSV reports and roll trades up to Parquet.
+
+        The three writes touch separate files, each through its own handle,
+        so they run side by side on worker threads.
+        """
+        await asyncio.gather(
+            asyncio.to_thread(self.reporter.save_report_markdown, report),
+            asyncio.to_thread(self.reporter.save_report_csv, report),
+            asyncio.to_thread(self._rollup_parquet),
+        )
+    
+    def _rollup_parquet(self) -> None:
+        """
+        Nightly roll-up of trades.jsonl into the Parquet mirror.  Failures
+        are logged here so they don't turn a saved report into an error.
+        """
+        try:
+            self.db.rollup_parquet()
+        except Exception:
+            logger.exception("Parquet roll-up failed (report files were still written)")
+    
+    async def generate_daily_report(self, date: Optional[str] = None) -> Dict[str, Any]:
         """
         Generate daily trading report.
         
@@ -121,16 +426,12 @@ class TradeLabsOrchestrator:
             Report data
         """
         try:
-            print(f"\n{'='*60}")
-            print("Daily Report Generation")
-            print(f"{'='*60}\n")
+            _banner("Daily Report Generation")
             
-            report = self.reporter.generate_daily_report(date)
+            report = await asyncio.to_thread(self.reporter.generate_daily_report, date)
             self.reporter.display_report(report)
             
-            # Save reports
-            self.reporter.save_report_markdown(report)
-            self.reporter.save_report_csv(report)
+            await self._save_report(report)
             
             return report
         except Exception as e:
@@ -141,7 +442,7 @@ class TradeLabsOrchestrator:
         """Get overall trading statistics."""
         return self.db.get_stats()
     
-    def display_stats(self):
+    async def display_stats(self):
         """Display trading statistics and kill switch status."""
         stats = self.get_trading_stats()
         
@@ -158,10 +459,19 @@ class TradeLabsOrchestrator:
         print(f"Total PnL:         ${stats['total_pnl']:,.2f}")
         print(f"Avg Trade PnL:     ${stats['avg_trade_pnl']:,.2f}")
         
+        # Spread of closed-trade P&L; the counts above come from get_stats()
+        pnl = self.db.get_pnl_array()
+        if pnl.size > 1:
+            print(f"PnL Std Dev:       ${pnl.std(ddof=1):,.2f}")
+        if pnl.size:
+            print(f"Best / Worst:      ${pnl.max():,.2f} / ${pnl.min():,.2f}")
+        
         # Display daily kill switch status
         try:
-            ib = connect_ib()
-            ks_status = get_kill_switch_status(ib)
+            from src.risk.daily_pnl_manager import get_kill_switch_status
+            ks_status = await self._on_ib_thread(
+                lambda: get_kill_switch_status(self._get_ib())
+            )
             
             print(f"\n{'='*60}")
             print("Daily Kill Switch Status (Market Hours P&L Check)")
@@ -187,24 +497,49 @@ class TradeLabsOrchestrator:
             
             print(f"Kill Switch:       {'🔴 ACTIVE (new trades blocked)' if ks_status['is_active'] else '🟢 SAFE'}")
             print(f"Threshold:         {ks_status['threshold_percent']:.2f}%")
-            
-            ib.disconnect()
         except Exception as e:
             print(f"\n[ERROR] Could not retrieve kill switch status: {e}")
         
         print(f"{'='*60}\n")
     
-    def create_scheduler(self) -> PipelineScheduler:
+    def _disconnect_ib(self):
+        if self._ib is not None:
+            self._ib.disconnect()
+            self._ib = None
+    
+    def close(self):
+        """
+        Disconnect from IB once, stop the IB thread, flush any trade-log
+        records a failed write left buffered and close the pipeline event
+        log (idempotent).
+        """
+        try:
+            self.db.flush()
+        except Exception:
+            logger.exception("Trade-log records could not be flushed on close")
+        self.logger.close()
+        if self._ib is not None:
+            self._ib_pool.submit(self._disconnect_ib).result()
+        self._ib_pool.shutdown(wait=True)
+    
+    def create_scheduler(self) -> "PipelineScheduler":
         """
         Create scheduler for automated operations.
         
+        An AsyncIOScheduler: jobs are the orchestrator's coroutines, awaited
+        on the loop start_scheduler runs, so a long scan waiting on IB never
+        holds up another job or the command prompt.  Jobs go through the
+        coalescer, which batches those firing together.
+        
         Returns:
             Configured scheduler
         """
+        from src.utils.scheduler import create_standard_schedule
         self.scheduler = create_standard_schedule(
-            pipeline_fn=self.run_pipeline,
-            reconciliation_fn=self.reconcile_positions,
-            report_fn=self.generate_daily_report,
+            pipeline_fn=functools.partial(self._scheduled, "run_pipeline"),
+            reconciliation_fn=functools.partial(self._scheduled, "reconcile_positions"),
+            report_fn=functools.partial(self._scheduled, "generate_daily_report"),
+            use_asyncio=True,
         )
         return self.scheduler
 
@@ -245,20 +580,94 @@ def _scheduler_status(orchestrator):
     print("Status not available for this scheduler object.")
 
 
-def start_scheduler(self):
+def _stdin_lines(loop: asyncio.AbstractEventLoop) -> "asyncio.Queue[Optional[str]]":
     """
-    Start the scheduler and enter interactive command loop.
-    This keeps the process alive so you can type: status/run/report/reconcile/stats/quit
+    Queue of lines typed at the prompt, read by a daemon thread.
+
+    Reading stdin blocks, so it lives on its own thread and hands each line
+    to *loop*; None marks end of input.  Being a daemon, the reader never
+    holds up interpreter exit.
     """
+    lines: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+
+    def _reader():
+        while True:
+            try:
+                line = sys.stdin.readline() or None
+            except (OSError, ValueError):
+                line = None
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+            if line is None:
+                return
+
+    threading.Thread(target=_reader, name="stdin", daemon=True).start()
+    return lines
+
+
+def _stdin_pipe():
+    """
+    Unbuffered file over stdin that the event loop can watch, or None.
+
+    A terminal is reopened by name: the loop switches what it reads to
+    non-blocking mode, and doing that on the shared stdin description would
+    make writes to stdout on the same terminal fail with EAGAIN.
+    """
+    try:
+        fd = sys.stdin.fileno()
+        if os.isatty(fd):
+            return open(os.ttyname(fd), "rb", buffering=0)
+        mode = os.fstat(fd).st_mode
+        if stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode):
+            return open(fd, "rb", buffering=0, closefd=False)
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+
+async def _prompt_lines():
+    """
+    Lines typed at the prompt, read without blocking the loop.
+
+    stdin is read through an asyncio StreamReader where the loop supports it;
+    otherwise (Windows consoles, regular files) by _stdin_lines()' thread.
+    """
+    loop = asyncio.get_running_loop()
+    pipe = _stdin_pipe()
+    if pipe is not None:
+        reader = asyncio.StreamReader()
+        try:
+            transport, _ = await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), pipe
+            )
+        except (NotImplementedError, OSError, ValueError):
+            pipe.close()
+            pipe = None
+
+    if pipe is None:
+        lines = _stdin_lines(loop)
+        while (line := await lines.get()) is not None:
+            yield line
+        return
+
+    try:
+        while line := await reader.readline():
+            yield line.decode(errors="replace")
+    finally:
+        transport.close()
+
+
+async def _command_loop(self):
+    """Read and run prompt commands until quit/EOF, on the orchestrator loop."""
     if getattr(self, "scheduler", None) is None:
         self.create_scheduler()
 
     self.scheduler.start()
     self._display_menu()
-
-    try:
+    async with contextlib.aclosing(_prompt_lines()) as lines:
         while True:
-            cmd = input("> ").strip().lower()
+            print("> ", end="", flush=True)
+            line = await anext(lines, None)
+            cmd = "quit" if line is None else line.strip().lower()
 
             if cmd in ("quit", "exit", "q"):
                 print("Stopping scheduler...")
@@ -272,19 +681,19 @@ def start_scheduler(self):
             elif cmd == "run":
                 print("Running pipeline now...")
                 # candidates default to 5, adjust as desired
-                self.run_pipeline(num_candidates=5)
+                await self.run_pipeline(num_candidates=5)
 
             elif cmd == "report":
                 print("Generating report now...")
-                self.generate_daily_report()
+                await self.generate_daily_report()
 
             elif cmd == "reconcile":
                 print("Reconciling positions now...")
-                self.reconcile_positions()
+                await self.reconcile_positions()
 
             elif cmd == "stats":
                 print("Showing stats...")
-                self.display_stats()
+                await self.display_stats()
 
             elif cmd == "":
                 continue
@@ -292,6 +701,14 @@ def start_scheduler(self):
             else:
                 print("Unknown command. Try: status | run | report | reconcile | stats | quit")
 
+
+def start_scheduler(self):
+    """
+    Start the scheduler and enter interactive command loop.
+    This keeps the process alive so you can type: status/run/report/reconcile/stats/quit
+    """
+    try:
+        asyncio.run(self._command_loop())
     except KeyboardInterrupt:
         print("\nCtrl+C received. Stopping scheduler...")
         self.stop_scheduler()
@@ -320,11 +737,26 @@ def _display_menu(self):
 
 
 # Attach methods back onto TradeLabsOrchestrator class (in case they were removed)
+TradeLabsOrchestrator._command_loop = _command_loop
 TradeLabsOrchestrator.start_scheduler = start_scheduler
 TradeLabsOrchestrator.stop_scheduler = stop_scheduler
 TradeLabsOrchestrator._display_menu = _display_menu
 
 
+# --mode -> handler(orchestrator, args).  Each handler reaches only the
+# methods its mode needs, and those import their own dependencies.
+_MODES: Dict[str, Callable[[TradeLabsOrchestrator, Any], None]] = {
+    "pipeline": lambda orch, args: asyncio.run(orch.run_pipeline(
+        num_candidates=args.candidates,
+        use_spy_only=args.spy_only,
+    )),
+    "reconcile": lambda orch, args: asyncio.run(orch.reconcile_positions()),
+    "report": lambda orch, args: asyncio.run(orch.generate_daily_report(args.date)),
+    "stats": lambda orch, args: asyncio.run(orch.display_stats()),
+    "scheduler": lambda orch, args: orch.start_scheduler(),
+}
+
+
 def main():
     """Main entry point for Trade Labs orchestrator."""
     import argparse
@@ -334,7 +766,7 @@ def main():
     )
     parser.add_argument(
         "--mode",
-        choices=["pipeline", "reconcile", "report", "scheduler", "stats"],
+        choices=list(_MODES),
         default="pipeline",
         help="Operation mode",
     )
@@ -356,27 +788,15 @@ def main():
     )
     
     args = parser.parse_args()
+    apply_env_levels()
     
     # Create orchestrator
     orchestrator = TradeLabsOrchestrator()
     
-    if args.mode == "pipeline":
-        orchestrator.run_pipeline(
-            num_candidates=args.candidates,
-            use_spy_only=args.spy_only,
-        )
-    
-    elif args.mode == "reconcile":
-        orchestrator.reconcile_positions()
-    
-    elif args.mode == "report":
-        orchestrator.generate_daily_report(args.date)
-    
-    elif args.mode == "stats":
-        orchestrator.display_stats()
-    
-    elif args.mode == "scheduler":
-        orchestrator.start_scheduler()
+    try:
+        _MODES[args.mode](orchestrator, args)
+    finally:
+        orchestrator.close()
 
 
 if __name__ == "__main__":